@@ -61,29 +61,28 @@ def cleanup_namespace(client, namespace):
         print("❌ Cleanup cancelled")
         return
     
-    # Delete deployments
-    if deployments:
-        print("\nDeleting deployments...")
-        for deployment in deployments:
-            name = deployment['name']
-            if client.delete_deployment(name):
-                print(f"  ✅ Deleted deployment: {name}")
-            else:
-                print(f"  ❌ Failed to delete deployment: {name}")
-    
-    # Delete services
-    if services:
-        print("\nDeleting services...")
-        for service in services:
-            name = service['name']
-            if client.delete_service(name):
-                print(f"  ✅ Deleted service: {name}")
-            else:
-                print(f"  ❌ Failed to delete service: {name}")
+    # Delete everything in one request per kind; an empty selector matches every object
+    print("\nDeleting resources...")
+    client.delete_by_selector(["deployments", "services"], label_selector="", wait=True)
     
     print("\n✅ Cleanup completed!")
 
 
+def cleanup_by_selector(client, selector):
+    """Clean up everything matching a label selector, e.g. a preview environment"""
+    print(f"🧹 Cleaning up resources matching: {selector}")
+    
+    kinds = ["deployments", "statefulsets", "services", "pods", "configmaps", "secrets"]
+    response = input(f"\nDelete all {', '.join(kinds)} matching '{selector}'? (y/N): ")
+    if response.lower() != 'y':
+        print("❌ Cleanup cancelled")
+        return
+    
+    results = client.delete_by_selector(kinds, label_selector=selector, wait=True)
+    deleted = sum(result['deleted'] for result in results.values())
+    print(f"\n✅ Cleanup completed! {deleted} object(s) deleted")
+
+
 def show_cleanup_status(client):
     """Show remaining resources after cleanup"""
     print("\n📊 Remaining resources:")
@@ -133,10 +132,11 @@ def main():
     # Cleanup options
     print("\nCleanup options:")
     print("1. Clean up specific application")
-    print("2. Clean up entire namespace")
-    print("3. Exit")
+    print("2. Clean up by label selector")
+    print("3. Clean up entire namespace")
+    print("4. Exit")
     
-    choice = input("Select option (1-3): ").strip()
+    choice = input("Select option (1-4): ").strip()
     
     if choice == "1":
         app_name = input("Enter application name: ").strip()
@@ -146,9 +146,16 @@ def main():
             print("❌ Invalid application name")
     
     elif choice == "2":
-        cleanup_namespace(client, namespace)
+        selector = input("Enter label selector (e.g. env=preview-123): ").strip()
+        if selector:
+            cleanup_by_selector(client, selector)
+        else:
+            print("❌ Invalid label selector")
     
     elif choice == "3":
+        cleanup_namespace(client, namespace)
+    
+    elif choice == "4":
         print("👋 Goodbye!")
         return
     
@@ -2,7 +2,6 @@
 k8s-helper: A simplified Python wrapper for common Kubernetes operations
 """
 
-from .core import K8sClient
 from .config import K8sConfig, get_config
 from .utils import (
     format_pod_list,
@@ -24,9 +23,32 @@ __version__ = "0.2.7"
 __author__ = "Harshit Chatterjee"
 __email__ = "harshitchatterjee50@gmail.com"
 
+# Names served from modules that import the Kubernetes client library, mapped
+# to their module. They are resolved on first access so `import k8s_helper` stays fast.
+_LAZY_NAMES = {
+    'K8sClient': 'core',
+    'EKSClient': 'core',
+    'MultiRegionEKS': 'core',
+    'get_api_client': 'core',
+    'reset_api_clients': 'core',
+    'AsyncK8sClient': 'aio',
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_NAMES:
+        import importlib
+        module = importlib.import_module(f".{_LAZY_NAMES[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # Convenience functions for quick operations
 def quick_deployment(name: str, image: str, replicas: int = 1, namespace: str = "default") -> bool:
     """Quickly create a deployment"""
+    from . import K8sClient
     client = K8sClient(namespace=namespace)
     result = client.create_deployment(name, image, replicas)
     return result is not None
@@ -36,33 +58,43 @@ def quick_service(name: str, port: int, target_port: int = None, namespace: str
     if target_port is None:
         target_port = port
     
+    from . import K8sClient
     client = K8sClient(namespace=namespace)
     result = client.create_service(name, port, target_port)
     return result is not None
 
 def quick_scale(deployment_name: str, replicas: int, namespace: str = "default") -> bool:
     """Quickly scale a deployment"""
+    from . import K8sClient
     client = K8sClient(namespace=namespace)
     return client.scale_deployment(deployment_name, replicas)
 
 def quick_logs(pod_name: str, namespace: str = "default") -> str:
     """Quickly get pod logs"""
+    from . import K8sClient
     client = K8sClient(namespace=namespace)
     return client.get_logs(pod_name)
 
 def quick_delete_deployment(name: str, namespace: str = "default") -> bool:
     """Quickly delete a deployment"""
+    from . import K8sClient
     client = K8sClient(namespace=namespace)
     return client.delete_deployment(name)
 
 def quick_delete_service(name: str, namespace: str = "default") -> bool:
     """Quickly delete a service"""
+    from . import K8sClient
     client = K8sClient(namespace=namespace)
     return client.delete_service(name)
 
 # Export main classes and functions
 __all__ = [
     'K8sClient',
+    'EKSClient',
+    'MultiRegionEKS',
+    'get_api_client',
+    'reset_api_clients',
+    'AsyncK8sClient',
     'K8sConfig',
     'get_config',
     'format_pod_list',
@@ -0,0 +1,213 @@
+"""
+Asyncio facade for k8s-helper
+
+AsyncK8sClient runs K8sClient calls on a dedicated thread pool so that many of
+them can be awaited concurrently from a single event loop without blocking it.
+The kubernetes client is synchronous, so this is a facade over threads rather
+than native asyncio I/O: every call in flight occupies one worker thread.
+"""
+
+import asyncio
+import functools
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+from types import TracebackType
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Type
+
+from kubernetes import watch
+
+from .config import DEFAULT_PAGE_SIZE
+from .core import K8sClient
+
+
+# Resource kinds that can be watched, mapped to (API group attribute, list method)
+WATCHABLE_KINDS = {
+    'pods': ('core_v1', 'list_namespaced_pod'),
+    'deployments': ('apps_v1', 'list_namespaced_deployment'),
+    'services': ('core_v1', 'list_namespaced_service'),
+    'events': ('core_v1', 'list_namespaced_event'),
+    'secrets': ('core_v1', 'list_namespaced_secret'),
+    'pvcs': ('core_v1', 'list_namespaced_persistent_volume_claim'),
+}
+
+# Methods that keep producing items for a long time: each item is handed over
+# immediately, and the stream runs on the pool reserved for streams
+_UNBATCHED_ITERATORS = ('stream_logs',)
+
+
+def _next_batch(iterator: Iterator[Any], size: int) -> List[Any]:
+    """Pull up to `size` items from a blocking iterator"""
+    return list(itertools.islice(iterator, size))
+
+
+class AsyncK8sClient:
+    """Asyncio version of K8sClient
+
+    Every public K8sClient method is available as a coroutine with the same
+    arguments (``await client.list_pods()``, ``await client.create_deployment(...)``).
+    Generator methods (``iter_pods``, ``stream_logs``, ...) become async iterators,
+    and ``watch`` streams watch events for a resource kind.
+
+    Each call runs on a worker thread for its whole duration, so at most
+    ``max_workers`` calls are in flight and further ones queue. Watches and
+    ``stream_logs`` hold their thread for as long as the stream is open; they
+    run on a separate pool of ``max_streams`` threads so that open streams never
+    starve ordinary calls. Streams opened beyond that bound wait until one ends.
+
+    Example:
+        async with AsyncK8sClient(namespace="production") as k8s:
+            pods, deployments = await asyncio.gather(k8s.list_pods(), k8s.list_deployments())
+            async for event in k8s.watch("pods", timeout_seconds=60):
+                print(event['type'], event['object'].metadata.name)
+    """
+
+    def __init__(self, namespace: str = "default", max_workers: int = 64,
+                 max_streams: int = 16, client: Optional[K8sClient] = None, **kwargs: Any) -> None:
+        """Initialize the async client
+
+        Args:
+            namespace: Default namespace for operations
+            max_workers: Number of blocking API calls that can run at the same time
+            max_streams: Number of watches and log streams that can be open at the same time
+            client: Existing K8sClient to wrap instead of creating one
+            **kwargs: Extra K8sClient arguments (config_file, context, use_cache, ...)
+        """
+        if client is None:
+            kwargs.setdefault('pool_size', max_workers)
+            client = K8sClient(namespace=namespace, **kwargs)
+        self.sync = client
+        self.namespace = client.namespace
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix="k8s-helper-aio")
+        self._stream_executor = ThreadPoolExecutor(max_workers=max_streams,
+                                                   thread_name_prefix="k8s-helper-aio-stream")
+
+    @classmethod
+    def _wrap(cls, client: K8sClient, executor: ThreadPoolExecutor,
+              stream_executor: ThreadPoolExecutor) -> 'AsyncK8sClient':
+        """Wrap a K8sClient, sharing existing thread pools"""
+        view = cls.__new__(cls)
+        view.sync = client
+        view.namespace = client.namespace
+        view._executor = executor
+        view._stream_executor = stream_executor
+        return view
+
+    def with_namespace(self, namespace: str) -> 'AsyncK8sClient':
+        """Get a client for another namespace sharing this client's connections and threads"""
+        return self._wrap(self.sync.with_namespace(namespace), self._executor, self._stream_executor)
+
+    async def close(self) -> None:
+        """Release the thread pools; calls already running are allowed to finish"""
+        self._executor.shutdown(wait=False)
+        self._stream_executor.shutdown(wait=False)
+
+    async def __aenter__(self) -> 'AsyncK8sClient':
+        return self
+
+    async def __aexit__(self, exc_type: Optional[Type[BaseException]],
+                        exc_value: Optional[BaseException],
+                        traceback: Optional[TracebackType]) -> None:
+        await self.close()
+
+    # ======================
+    # SYNC METHOD BRIDGE
+    # ======================
+    def __getattr__(self, name: str) -> Any:
+        if name == 'sync':
+            # Not initialized (yet); avoid recursing into __getattr__
+            raise AttributeError(name)
+        attr = getattr(self.sync, name)
+        if name.startswith('_') or not callable(attr):
+            return attr
+
+        if name in _UNBATCHED_ITERATORS:
+            @functools.wraps(attr)
+            def stream(*args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+                return self._aiter(functools.partial(attr, *args, **kwargs),
+                                   executor=self._stream_executor)
+            return stream
+
+        if name.startswith('iter_'):
+            @functools.wraps(attr)
+            def iterate(*args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+                size = kwargs.get('page_size', DEFAULT_PAGE_SIZE)
+                return self._aiter(functools.partial(attr, *args, **kwargs), size)
+            return iterate
+
+        @functools.wraps(attr)
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            return await self.run(attr, *args, **kwargs)
+        return call
+
+    async def run(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking callable on the client's thread pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def _aiter(self, factory: Callable[[], Iterator[Any]], batch_size: int = 1,
+                     on_close: Optional[Callable[[], None]] = None,
+                     executor: Optional[ThreadPoolExecutor] = None) -> AsyncIterator[Any]:
+        """Drive a blocking iterator on a thread pool, handing items over in batches
+
+        Args:
+            factory: Callable returning the blocking iterator
+            batch_size: Items pulled per thread hop; 1 for streams that must not wait
+            on_close: Called when the consumer stops early, to unblock the iterator
+            executor: Pool to run on; defaults to the pool of ordinary calls
+        """
+        executor = executor or self._executor
+        iterator = factory()
+        future = None
+        try:
+            while True:
+                future = executor.submit(_next_batch, iterator, batch_size)
+                batch = await asyncio.wrap_future(future)
+                if not batch:
+                    return
+                for item in batch:
+                    yield item
+        finally:
+            if on_close is not None:
+                on_close()
+            close = getattr(iterator, 'close', None)
+            if close is not None:
+                if future is not None and not future.done():
+                    # A worker is still inside the iterator; close it once it returns
+                    future.add_done_callback(lambda _: close())
+                else:
+                    close()
+
+    # ======================
+    # WATCHES
+    # ======================
+    def watch(self, kind: str, namespace: Optional[str] = None,
+              resource_version: Optional[str] = None, timeout_seconds: Optional[int] = None,
+              **kwargs: Any) -> AsyncIterator[Dict[str, Any]]:
+        """Watch a resource kind, yielding events as they arrive
+
+        Args:
+            kind: Resource kind, one of WATCHABLE_KINDS
+            namespace: Namespace to watch; defaults to the client's namespace
+            resource_version: Resource version to start watching from
+            timeout_seconds: Seconds before the server ends the watch
+            **kwargs: Extra list arguments (label_selector, field_selector, ...)
+
+        Yields:
+            Watch events as dictionaries with 'type' and 'object'
+        """
+        if kind not in WATCHABLE_KINDS:
+            raise ValueError(f"Unsupported kind for watching: {kind}")
+
+        api_attr, list_method = WATCHABLE_KINDS[kind]
+        list_func = getattr(getattr(self.sync, api_attr), list_method)
+        if resource_version is not None:
+            kwargs['resource_version'] = resource_version
+        if timeout_seconds is not None:
+            kwargs['timeout_seconds'] = timeout_seconds
+
+        w = watch.Watch()
+        return self._aiter(
+            lambda: w.stream(list_func, namespace=namespace or self.namespace, **kwargs),
+            on_close=w.stop, executor=self._stream_executor
+        )
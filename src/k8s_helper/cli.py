@@ -3,16 +3,17 @@ Command-line interface for k8s-helper
 """
 
 import typer
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.text import Text
-import time
+from rich.live import Live
+import itertools
+import os
 import time
 
-from .core import K8sClient
-from .config import get_config
+from .config import get_config, DEFAULT_PAGE_SIZE
 from .utils import (
     format_pod_list,
     format_deployment_list,
@@ -24,7 +25,9 @@ from .utils import (
     validate_image,
     parse_env_vars,
     parse_labels,
-    format_age
+    format_age,
+    iter_chunks,
+    parse_duration
 )
 from . import __version__
 
@@ -37,16 +40,92 @@ def version_callback(value: bool):
 app = typer.Typer(help="k8s-helper: Simplified Kubernetes operations")
 console = Console()
 
+
+def get_k8s_client(namespace: str):
+    """Create a K8sClient, importing the Kubernetes client library on first use"""
+    from .core import K8sClient
+    return K8sClient(namespace=namespace)
+
+
 @app.callback()
 def main(
-    version: Optional[bool] = typer.Option(None, "--version", callback=version_callback, is_eager=True, help="Show version and exit")
+    ctx: typer.Context,
+    version: Optional[bool] = typer.Option(None, "--version", callback=version_callback, is_eager=True, help="Show version and exit"),
+    profile: bool = typer.Option(False, "--profile", help="Print a per-API-call latency breakdown after the command"),
+    profile_json: Optional[str] = typer.Option(None, "--profile-json", help="Write the per-API-call breakdown as JSON to this file")
 ):
     """Main callback to handle global options"""
+    if profile or profile_json:
+        from . import metrics
+        metrics.registry.reset()
+        metrics.add_hook(metrics.registry.record)
+        
+        def finish():
+            metrics.remove_hook(metrics.registry.record)
+            report_profile(metrics.registry, profile, profile_json)
+        ctx.call_on_close(finish)
     return
 
+
+def report_profile(registry, show: bool, json_path: Optional[str]) -> None:
+    """Print and/or export the calls recorded while the command ran"""
+    rows = registry.summary()
+    if json_path:
+        registry.to_json(json_path)
+    if not show:
+        return
+    
+    err_console = Console(stderr=True)
+    if not rows:
+        err_console.print("📊 No API calls were made")
+        return
+    
+    table = Table(title="API Calls")
+    table.add_column("API", style="cyan")
+    table.add_column("Call", style="magenta")
+    table.add_column("Resource")
+    for column in ("Count", "Errors", "p50 ms", "p95 ms", "p99 ms", "Total ms", "Bytes"):
+        table.add_column(column, justify="right")
+    
+    for row in rows:
+        table.add_row(
+            row['api'], row['call'], row['resource'], str(row['count']),
+            str(row['errors']) if row['errors'] else "",
+            f"{row['p50_ms']:.1f}", f"{row['p95_ms']:.1f}", f"{row['p99_ms']:.1f}",
+            f"{row['total_ms']:.1f}", str(row['bytes']) if row['bytes'] else ""
+        )
+    
+    err_console.print(table)
+    total_ms = sum(row['total_ms'] for row in rows)
+    err_console.print(f"📊 {sum(row['count'] for row in rows)} call(s), {total_ms:.1f} ms in API calls")
+
 # Global options
 namespace_option = typer.Option(None, "--namespace", "-n", help="Kubernetes namespace")
 output_option = typer.Option("table", "--output", "-o", help="Output format: table, yaml, json")
+page_size_option = typer.Option(DEFAULT_PAGE_SIZE, "--page-size", help="Number of objects fetched per API call")
+selector_option = typer.Option(None, "--selector", "-l", help="Label selector, e.g. app=web,tier!=db")
+field_selector_option = typer.Option(None, "--field-selector", help="Field selector, e.g. status.phase=Running")
+fast_option = typer.Option(True, "--fast/--no-fast", help="Decode list responses directly instead of building client models")
+
+
+def print_paged_table(rows, formatter, page_size: int) -> None:
+    """Print table rows page by page as they stream in from the API
+    
+    The first page fixes the column widths so later pages line up under the header.
+    """
+    from kubernetes.client.rest import ApiException
+    
+    printed = False
+    col_widths: Dict[str, int] = {}
+    try:
+        for page in iter_chunks(rows, page_size):
+            console.print(formatter(page, show_header=not printed, col_widths=col_widths))
+            printed = True
+    except ApiException as e:
+        console.print(f"❌ Listing stopped partway, the table above is incomplete: {e}")
+        raise typer.Exit(1)
+    if not printed:
+        console.print(formatter([]))
 
 
 @app.command()
@@ -115,7 +194,7 @@ def create_deployment(
     
     # Get client
     ns = namespace or get_config().get_namespace()
-    client = K8sClient(namespace=ns)
+    client = get_k8s_client(ns)
     
     # Create deployment
     with console.status(f"Creating deployment {name}..."):
@@ -148,7 +227,7 @@ def delete_deployment(
 ):
     """Delete a deployment"""
     ns = namespace or get_config().get_namespace()
-    client = K8sClient(namespace=ns)
+    client = get_k8s_client(ns)
     
     if typer.confirm(f"Are you sure you want to delete deployment {name}?"):
         with console.status(f"Deleting deployment {name}..."):
@@ -166,7 +245,7 @@ def scale_deployment(
 ):
     """Scale a deployment"""
     ns = namespace or get_config().get_namespace()
-    client = K8sClient(namespace=ns)
+    client = get_k8s_client(ns)
     
     with console.status(f"Scaling deployment {name} to {replicas} replicas..."):
         if client.scale_deployment(name, replicas):
@@ -178,17 +257,26 @@ def scale_deployment(
 @app.command()
 def list_deployments(
     namespace: Optional[str] = namespace_option,
-    output: str = output_option
+    output: str = output_option,
+    page_size: int = page_size_option,
+    selector: Optional[str] = selector_option,
+    field_selector: Optional[str] = field_selector_option,
+    fast: bool = fast_option
 ):
     """List deployments"""
     ns = namespace or get_config().get_namespace()
-    client = K8sClient(namespace=ns)
-    
-    deployments = client.list_deployments()
+    client = get_k8s_client(ns)
     
     if output == "table":
-        console.print(format_deployment_list(deployments))
-    elif output == "yaml":
+        rows = client.iter_deployments(page_size=page_size, label_selector=selector,
+                                       field_selector=field_selector, fast=fast)
+        print_paged_table(rows, format_deployment_list, page_size)
+        return
+    
+    deployments = client.list_deployments(page_size=page_size, label_selector=selector,
+                                          field_selector=field_selector, fast=fast)
+    
+    if output == "yaml":
         console.print(format_yaml_output(deployments))
     elif output == "json":
         console.print(format_json_output(deployments))
@@ -216,7 +304,7 @@ def create_pod(
     label_dict = parse_labels(labels) if labels else None
     
     ns = namespace or get_config().get_namespace()
-    client = K8sClient(namespace=ns)
+    client = get_k8s_client(ns)
     
     with console.status(f"Creating pod {name}..."):
         result = client.create_pod(
@@ -240,7 +328,7 @@ def delete_pod(
 ):
     """Delete a pod"""
     ns = namespace or get_config().get_namespace()
-    client = K8sClient(namespace=ns)
+    client = get_k8s_client(ns)
     
     if typer.confirm(f"Are you sure you want to delete pod {name}?"):
         with console.status(f"Deleting pod {name}..."):
@@ -253,17 +341,26 @@ def delete_pod(
 @app.command()
 def list_pods(
     namespace: Optional[str] = namespace_option,
-    output: str = output_option
+    output: str = output_option,
+    page_size: int = page_size_option,
+    selector: Optional[str] = selector_option,
+    field_selector: Optional[str] = field_selector_option,
+    fast: bool = fast_option
 ):
     """List pods"""
     ns = namespace or get_config().get_namespace()
-    client = K8sClient(namespace=ns)
-    
-    pods = client.list_pods()
+    client = get_k8s_client(ns)
     
     if output == "table":
-        console.print(format_pod_list(pods))
-    elif output == "yaml":
+        rows = client.iter_pods(page_size=page_size, label_selector=selector,
+                                field_selector=field_selector, fast=fast)
+        print_paged_table(rows, format_pod_list, page_size)
+        return
+    
+    pods = client.list_pods(page_size=page_size, label_selector=selector,
+                            field_selector=field_selector, fast=fast)
+    
+    if output == "yaml":
         console.print(format_yaml_output(pods))
     elif output == "json":
         console.print(format_json_output(pods))
@@ -289,7 +386,7 @@ def create_service(
     selector_dict = parse_labels(selector) if selector else None
     
     ns = namespace or get_config().get_namespace()
-    client = K8sClient(namespace=ns)
+    client = get_k8s_client(ns)
     
     with console.status(f"Creating service {name}..."):
         result = client.create_service(
@@ -313,7 +410,7 @@ def delete_service(
 ):
     """Delete a service"""
     ns = namespace or get_config().get_namespace()
-    client = K8sClient(namespace=ns)
+    client = get_k8s_client(ns)
     
     if typer.confirm(f"Are you sure you want to delete service {name}?"):
         with console.status(f"Deleting service {name}..."):
@@ -326,13 +423,15 @@ def delete_service(
 @app.command()
 def list_services(
     namespace: Optional[str] = namespace_option,
-    output: str = output_option
+    output: str = output_option,
+    selector: Optional[str] = selector_option,
+    field_selector: Optional[str] = field_selector_option
 ):
     """List services"""
     ns = namespace or get_config().get_namespace()
-    client = K8sClient(namespace=ns)
+    client = get_k8s_client(ns)
     
-    services = client.list_services()
+    services = client.list_services(label_selector=selector, field_selector=field_selector)
     
     if output == "table":
         console.print(format_service_list(services))
@@ -347,30 +446,116 @@ def logs(
     pod_name: str = typer.Argument(..., help="Pod name"),
     container: Optional[str] = typer.Option(None, help="Container name"),
     tail: Optional[int] = typer.Option(None, help="Number of lines to tail"),
+    follow: bool = typer.Option(False, "--follow", "-f", help="Stream new log lines as they are written"),
+    since: Optional[str] = typer.Option(None, "--since", help="Only show lines newer than a duration, e.g. 5m, 2h"),
+    limit_bytes: Optional[int] = typer.Option(None, "--limit-bytes", help="Maximum number of bytes to read"),
+    previous: bool = typer.Option(False, "--previous", "-p", help="Show logs of the previous container instance"),
+    timestamps: bool = typer.Option(False, "--timestamps", help="Prefix lines with timestamps"),
     namespace: Optional[str] = namespace_option
 ):
     """Get pod logs"""
+    try:
+        since_seconds = parse_duration(since) if since else None
+    except ValueError as e:
+        console.print(f"❌ {e}")
+        return
+    
     ns = namespace or get_config().get_namespace()
-    client = K8sClient(namespace=ns)
+    client = get_k8s_client(ns)
     
-    logs = client.get_logs(pod_name, container_name=container, tail_lines=tail)
-    if logs:
-        console.print(logs)
-    else:
-        console.print(f"❌ Failed to get logs for pod {pod_name}")
+    lines = client.stream_logs(pod_name, container_name=container, follow=follow,
+                               since_seconds=since_seconds, tail_lines=tail,
+                               limit_bytes=limit_bytes, previous=previous, timestamps=timestamps)
+    try:
+        for line in lines:
+            console.print(line, markup=False, highlight=False)
+    except KeyboardInterrupt:
+        pass
+
+
+@app.command()
+def logs_by_selector(
+    selector: str = typer.Option(..., "--selector", "-l", help="Label selector for the pods, e.g. app=web"),
+    container: Optional[str] = typer.Option(None, help="Container name"),
+    tail: Optional[int] = typer.Option(None, help="Number of lines to tail from each pod"),
+    timestamps: bool = typer.Option(False, "--timestamps", help="Show timestamps and merge pods into one timeline"),
+    workers: int = typer.Option(8, "--workers", help="Number of logs fetched concurrently"),
+    namespace: Optional[str] = namespace_option
+):
+    """Get logs from all pods matching a label selector"""
+    ns = namespace or get_config().get_namespace()
+    client = get_k8s_client(ns)
+    
+    colors = ["cyan", "magenta", "green", "yellow", "blue", "red"]
+    pod_colors = {}
+    found = False
+    
+    for pod_name, line in client.iter_logs_by_selector(selector, container_name=container, tail_lines=tail,
+                                                       timestamps=timestamps, max_workers=workers):
+        found = True
+        color = pod_colors.setdefault(pod_name, colors[len(pod_colors) % len(colors)])
+        console.print(Text.assemble((f"[{pod_name}] ", color), line), highlight=False)
+    
+    if not found:
+        console.print(f"📋 No logs found for pods matching '{selector}' in {ns}")
+
+
+@app.command()
+def export_logs(
+    output_dir: str = typer.Argument(..., help="Directory to write the logs to"),
+    selector: Optional[str] = selector_option,
+    compress: str = typer.Option("gzip", "--compress", help="Compression: gzip, zstd or none"),
+    workers: int = typer.Option(8, "--workers", help="Number of logs downloaded concurrently"),
+    namespace: Optional[str] = namespace_option
+):
+    """Export the logs of every pod container to files, resuming earlier exports"""
+    from kubernetes.client.rest import ApiException
+    
+    ns = namespace or get_config().get_namespace()
+    client = get_k8s_client(ns)
+    
+    compression = None if compress == "none" else compress
+    try:
+        with console.status(f"Exporting logs from {ns} to {output_dir}..."):
+            manifest = client.export_logs(output_dir, label_selector=selector,
+                                          compression=compression, max_workers=workers)
+    except ValueError as e:
+        console.print(f"❌ {e}")
+        raise typer.Exit(1)
+    except ApiException as e:
+        console.print(f"❌ Failed to list pods in {ns}: ({e.status}) {e.reason}")
+        raise typer.Exit(1)
+    
+    files = manifest['files']
+    failed = [entry for entry in files if entry['status'] == 'failed']
+    total_bytes = sum(entry.get('bytes', 0) for entry in files)
+    
+    if manifest['status'] == 'complete':
+        console.print(f"✅ Exported {len(files)} logs ({total_bytes / 1024 / 1024:.1f} MiB) to {output_dir}")
+        return
+    
+    console.print(f"❌ Export incomplete: {len(failed)} of {len(files)} logs failed "
+                  f"({total_bytes / 1024 / 1024:.1f} MiB written to {output_dir})")
+    for entry in failed:
+        console.print(f"❌ {entry['pod']}/{entry['container']}: {entry['error']}")
+    console.print("💡 Run the same command again to retry the failed logs")
+    raise typer.Exit(1)
 
 
 @app.command()
 def events(
     resource: Optional[str] = typer.Option(None, help="Resource name to filter events"),
     namespace: Optional[str] = namespace_option,
-    output: str = output_option
+    output: str = output_option,
+    selector: Optional[str] = selector_option,
+    field_selector: Optional[str] = field_selector_option
 ):
     """Get events"""
     ns = namespace or get_config().get_namespace()
-    client = K8sClient(namespace=ns)
+    client = get_k8s_client(ns)
     
-    events = client.get_events(resource_name=resource)
+    events = client.get_events(resource_name=resource, label_selector=selector,
+                               field_selector=field_selector)
     
     if output == "table":
         console.print(format_events(events))
@@ -389,7 +574,7 @@ def describe(
 ):
     """Describe a resource"""
     ns = namespace or get_config().get_namespace()
-    client = K8sClient(namespace=ns)
+    client = get_k8s_client(ns)
     
     if resource_type.lower() == "pod":
         info = client.describe_pod(name)
@@ -418,7 +603,7 @@ def status(
 ):
     """Show namespace status"""
     ns = namespace or get_config().get_namespace()
-    client = K8sClient(namespace=ns)
+    client = get_k8s_client(ns)
     
     console.print(f"\n[bold]Namespace: {ns}[/bold]")
     
@@ -435,20 +620,58 @@ def status(
     console.print(table)
     
     # Show recent events
-    events = client.get_events()
-    if events:
+    recent_events = client.get_recent_events(limit=5)
+    if recent_events:
         console.print(f"\n[bold]Recent Events (last 5):[/bold]")
-        recent_events = events[:5]
         for event in recent_events:
             event_type = event['type']
             color = "green" if event_type == "Normal" else "red"
             console.print(f"[{color}]{event['type']}[/{color}] {event['reason']}: {event['message']}")
 
 
+def apply_manifests(path: str, namespace: Optional[str], workers: int, server_side: bool,
+                    force_conflicts: bool = False) -> None:
+    """Apply a manifest file or directory and print per-object results"""
+    if not os.path.exists(path):
+        console.print(f"❌ No such file or directory: {path}")
+        return
+    
+    ns = namespace or get_config().get_namespace()
+    client = get_k8s_client(ns)
+    
+    with console.status(f"Applying manifests from {path}..."):
+        try:
+            summary = client.apply_manifests(path, max_workers=workers, server_side=server_side,
+                                             force=force_conflicts)
+        except Exception as e:
+            console.print(f"❌ Failed to load manifests: {e}")
+            return
+    
+    icons = {'applied': "✅", 'created': "✅", 'unchanged': "➖", 'exists': "➖", 'failed': "❌"}
+    for result in summary['results']:
+        line = f"{icons[result['status']]} {result['kind']}/{result['name']} {result['status']}"
+        if result['status'] == 'failed':
+            line += f": {result['error']}"
+        console.print(line, markup=False)
+    if any(result.get('conflict') for result in summary['results']):
+        console.print("💡 Other managers own some fields; re-run with --force-conflicts to take them over")
+    
+    throughput = f", {summary['objects_per_second']} objects/s" if summary['objects_per_second'] else ""
+    labels = {'applied': "applied", 'unchanged': "unchanged", 'created': "created",
+              'exists': "already existed", 'failed': "failed"}
+    counts = ", ".join(f"{summary[status]} {label}" for status, label in labels.items() if summary[status])
+    console.print(f"\n📊 {summary['total']} objects: {counts or 'nothing to do'} "
+                  f"in {summary['seconds']:.2f}s{throughput}")
+
+
 @app.command()
 def apply(
-    name: str = typer.Argument(..., help="Application name"),
-    image: str = typer.Argument(..., help="Container image"),
+    name: Optional[str] = typer.Argument(None, help="Application name"),
+    image: Optional[str] = typer.Argument(None, help="Container image"),
+    filename: Optional[str] = typer.Option(None, "--filename", "-f", help="Manifest file or directory to apply instead"),
+    workers: int = typer.Option(8, "--workers", help="Objects submitted concurrently with --filename"),
+    server_side: bool = typer.Option(False, "--server-side", help="Server-side apply --filename objects, skipping unchanged ones"),
+    force_conflicts: bool = typer.Option(False, "--force-conflicts", help="Take over fields owned by other managers (e.g. replicas under an HPA)"),
     replicas: int = typer.Option(1, "--replicas", "-r", help="Number of replicas"),
     port: int = typer.Option(80, "--port", "-p", help="Container port"),
     service_type: str = typer.Option("ClusterIP", help="Service type"),
@@ -462,7 +685,15 @@ def apply(
     wait: bool = typer.Option(True, "--wait/--no-wait", help="Wait for deployment to be ready"),
     show_url: bool = typer.Option(True, "--show-url/--no-show-url", help="Show service URL after deployment")
 ):
-    """Deploy an application (deployment + service) with advanced features"""
+    """Deploy an application (deployment + service), or apply manifests with -f"""
+    if filename:
+        apply_manifests(filename, namespace, workers, server_side, force_conflicts)
+        return
+    
+    if not name or not image:
+        console.print("❌ Provide an application name and image, or manifests with --filename")
+        return
+    
     if not validate_name(name):
         console.print(f"❌ Invalid application name: {name}")
         return
@@ -475,7 +706,7 @@ def apply(
     label_dict = parse_labels(labels) if labels else None
     
     ns = namespace or get_config().get_namespace()
-    client = K8sClient(namespace=ns)
+    client = get_k8s_client(ns)
     
     console.print(f"🚀 Deploying application: {name}")
     
@@ -553,9 +784,9 @@ def apply(
             console.print(f"❌ Error parsing secret: {e}")
             return
     
-    # Create deployment
-    with console.status(f"Creating deployment {name}..."):
-        deployment_result = client.create_deployment(
+    # Apply deployment and service; each reads its live object to skip unchanged specs
+    with console.status(f"Applying deployment {name}..."):
+        deployment_status = client.apply_deployment(
             name=name,
             image=image,
             replicas=replicas,
@@ -564,26 +795,27 @@ def apply(
             labels=label_dict,
             init_containers=init_containers if init_containers else None,
             volume_mounts=volume_mounts if volume_mounts else None,
-            volumes=volumes if volumes else None
+            volumes=volumes if volumes else None,
+            force=force_conflicts
         )
     
-    if not deployment_result:
-        console.print(f"❌ Failed to create deployment {name}")
-        return
+    if deployment_status == 'failed':
+        console.print(f"❌ Failed to apply deployment {name}")
+        raise typer.Exit(1)
     
-    # Create service
-    with console.status(f"Creating service {name}-service..."):
-        service_result = client.create_service(
+    with console.status(f"Applying service {name}-service..."):
+        service_status = client.apply_service(
             name=f"{name}-service",
             port=port,
             target_port=port,
             service_type=service_type,
-            selector=label_dict or {"app": name}
+            selector=label_dict or {"app": name},
+            force=force_conflicts
         )
     
-    if not service_result:
-        console.print(f"❌ Failed to create service {name}-service")
-        return
+    if service_status == 'failed':
+        console.print(f"❌ Failed to apply service {name}-service")
+        raise typer.Exit(1)
     
     console.print(f"✅ Application {name} deployed successfully")
     
@@ -593,6 +825,7 @@ def apply(
                 console.print(f"✅ Application {name} is ready")
             else:
                 console.print(f"❌ Application {name} failed to become ready")
+                raise typer.Exit(1)
     
     # Show service URL if requested
     if show_url:
@@ -627,12 +860,44 @@ def apply(
 
 @app.command()
 def cleanup(
-    name: str = typer.Argument(..., help="Application name"),
+    name: Optional[str] = typer.Argument(None, help="Application name"),
+    selector: Optional[str] = typer.Option(None, "--selector", "-l", help="Delete every object matching this label selector, e.g. env=preview-123"),
+    kinds: str = typer.Option("deployments,statefulsets,services,pods,configmaps,secrets", "--kinds",
+                              help="Kinds to delete with --selector (comma-separated; pvcs also supported)"),
+    wait: bool = typer.Option(False, "--wait/--no-wait", help="Wait until the deleted objects are gone"),
+    timeout: int = typer.Option(300, "--timeout", "-t", help="Timeout in seconds when waiting"),
     namespace: Optional[str] = namespace_option
 ):
-    """Clean up an application (delete deployment + service)"""
+    """Clean up an application (delete deployment + service) or everything matching a selector"""
+    if bool(name) == bool(selector):
+        console.print("❌ Provide either an application name or --selector")
+        raise typer.Exit(1)
+    
     ns = namespace or get_config().get_namespace()
-    client = K8sClient(namespace=ns)
+    client = get_k8s_client(ns)
+    
+    if selector:
+        from .core import DELETABLE_KINDS
+        kind_list = [kind.strip() for kind in kinds.split(",") if kind.strip()]
+        unknown = [kind for kind in kind_list if kind not in DELETABLE_KINDS]
+        if unknown:
+            console.print(f"❌ Unsupported kind(s): {', '.join(unknown)}. Choose from: {', '.join(DELETABLE_KINDS)}")
+            raise typer.Exit(1)
+        
+        if not typer.confirm(f"Are you sure you want to delete all {', '.join(kind_list)} matching '{selector}' in {ns}?"):
+            return
+        
+        console.print(f"🧹 Cleaning up objects matching: {selector}")
+        start = time.time()
+        results = client.delete_by_selector(kind_list, selector, wait=wait, timeout=timeout)
+        deleted = sum(result['deleted'] for result in results.values())
+        failed = sum(result['failed'] + result.get('remaining', 0) for result in results.values())
+        
+        if failed:
+            console.print(f"⚠️  Partial cleanup: {deleted} object(s) deleted, {failed} failed or still present")
+            raise typer.Exit(1)
+        console.print(f"✅ Deleted {deleted} object(s) in {time.time() - start:.1f}s")
+        return
     
     if typer.confirm(f"Are you sure you want to delete application {name} and its service?"):
         console.print(f"🧹 Cleaning up application: {name}")
@@ -654,17 +919,44 @@ def cleanup(
 # ======================
 # EKS COMMANDS
 # ======================
+def _print_timeline(phases: List[Dict[str, Any]], total: float) -> None:
+    """Print the phases of a provisioning run"""
+    table = Table(title=f"Provisioning Timeline ({total:.1f}s)")
+    table.add_column("Phase", style="cyan")
+    table.add_column("Start", justify="right")
+    table.add_column("End", justify="right")
+    table.add_column("Duration", justify="right", style="green")
+    
+    for phase in phases:
+        table.add_row(
+            phase['phase'] if phase['ok'] else f"{phase['phase']} ❌",
+            f"{phase['start_s']:.1f}s",
+            f"{phase['end_s']:.1f}s",
+            f"{phase['seconds']:.1f}s"
+        )
+    
+    console.print(table)
+
+
+def _print_wait_progress(resource: str, status: str, previous: Optional[str], elapsed: float) -> None:
+    """Print a status change reported while waiting for an EKS resource"""
+    if previous is None:
+        console.print(f"   📋 {resource}: {status}")
+    else:
+        console.print(f"   🔄 {resource}: {previous} → {status} after {elapsed:.0f}s")
+
+
 @app.command()
 def create_eks_cluster(
     name: str = typer.Argument(..., help="Cluster name"),
     region: str = typer.Option("us-west-2", "--region", "-r", help="AWS region"),
     version: str = typer.Option("1.29", "--version", "-v", help="Kubernetes version"),
-    node_group: str = typer.Option(None, "--node-group", help="Node group name"),
+    node_group: str = typer.Option(None, "--node-group", help="Node group name, or several comma-separated names"),
     instance_types: str = typer.Option("t3.medium", "--instance-types", help="EC2 instance types (comma-separated)"),
     min_size: int = typer.Option(1, "--min-size", help="Minimum number of nodes"),
     max_size: int = typer.Option(3, "--max-size", help="Maximum number of nodes"),
     desired_size: int = typer.Option(2, "--desired-size", help="Desired number of nodes"),
-    wait: bool = typer.Option(True, "--wait/--no-wait", help="Wait for cluster to be ready"),
+    wait: bool = typer.Option(True, "--wait/--no-wait", help="Wait for the cluster, then create node groups and wait for them"),
     create_nodegroup: bool = typer.Option(True, "--create-nodegroup/--no-nodegroup", help="Create node group automatically"),
     ami_type: str = typer.Option("AL2_x86_64", "--ami-type", help="AMI type for nodes"),
     capacity_type: str = typer.Option("ON_DEMAND", "--capacity-type", help="Capacity type: ON_DEMAND or SPOT")
@@ -677,11 +969,17 @@ def create_eks_cluster(
     try:
         from .core import EKSClient
         
-        eks_client = EKSClient(region=region)
+        # Reuse default subnets and role ARNs found by earlier runs
+        eks_client = EKSClient(region=region, persist_discovery=True)
         
         # Parse instance types
         instance_type_list = [t.strip() for t in instance_types.split(",")]
         
+        # Parse node group names
+        nodegroup_names = []
+        if create_nodegroup:
+            nodegroup_names = [n.strip() for n in (node_group or f"{name}-nodegroup").split(",") if n.strip()]
+        
         scaling_config = {
             "minSize": min_size,
             "maxSize": max_size,
@@ -703,24 +1001,72 @@ def create_eks_cluster(
         console.print("   • Security groups for cluster communication")
         console.print("   • EKS cluster control plane")
         if create_nodegroup:
-            if node_group:
-                console.print(f"   • Managed node group: {node_group}")
-            else:
-                console.print(f"   • Managed node group: {name}-nodegroup")
+            for nodegroup_name in nodegroup_names:
+                console.print(f"   • Managed node group: {nodegroup_name}")
         else:
             console.print("   • ⚠️  No node group (cluster will have no worker nodes)")
         
+        if wait:
+            # Discover, create the cluster, then create and await every node group
+            # as soon as the control plane is active
+            nodegroups = [
+                {
+                    'nodegroup_name': nodegroup_name,
+                    'instance_types': instance_type_list,
+                    'ami_type': ami_type,
+                    'capacity_type': capacity_type,
+                    'scaling_config': scaling_config
+                }
+                for nodegroup_name in nodegroup_names
+            ]
+            console.print("⏳ Provisioning cluster and node groups...")
+            result = eks_client.provision(name, nodegroups, version=version,
+                                          on_progress=_print_wait_progress)
+            
+            cluster_info = result['cluster']
+            console.print(f"📋 Cluster ARN: {cluster_info['cluster_arn']}")
+            console.print(f"🌐 Subnets: {cluster_info['subnets']}")
+            for nodegroup_name, nodegroup_info in result['nodegroups'].items():
+                if 'error' in nodegroup_info:
+                    console.print(f"⚠️  Node group {nodegroup_name} creation failed: {nodegroup_info['error']}")
+                    console.print(f"💡 You can create it manually later using: k8s-helper create-nodegroup {name} {nodegroup_name}")
+            
+            _print_timeline(result['timeline'], result['seconds'])
+            
+            pending = [resource for resource, status in result['statuses'].items() if status != 'ACTIVE']
+            if pending:
+                console.print(f"❌ Timeout waiting for {', '.join(pending)} to become active")
+                return
+            
+            console.print("✅ EKS cluster is now active!")
+            status = eks_client.get_cluster_status(name)
+            console.print(f"🔗 Endpoint: {status['endpoint']}")
+            if any('error' not in info for info in result['nodegroups'].values()):
+                console.print("🎉 Cluster is ready with worker nodes!")
+            
+            # Show next steps
+            console.print(f"\n🚀 Next steps:")
+            console.print(f"   1. Configure kubectl: aws eks update-kubeconfig --name {name} --region {region}")
+            if create_nodegroup:
+                console.print(f"   2. Verify nodes: kubectl get nodes")
+                console.print(f"   3. Verify connection: kubectl get svc")
+                console.print(f"   4. Deploy applications: k8s-helper apply <app-name> <image>")
+            else:
+                console.print(f"   2. Create node group: k8s-helper create-nodegroup {name}")
+                console.print(f"   3. Verify connection: kubectl get svc")
+                console.print(f"   4. Deploy applications: k8s-helper apply <app-name> <image>")
+            return
+        
         with console.status("Creating EKS cluster and required resources..."):
             cluster_info = eks_client.create_cluster(
                 cluster_name=name,
                 version=version,
-                node_group_name=node_group,
+                node_group_name=nodegroup_names[0] if nodegroup_names else None,
                 instance_types=instance_type_list,
                 scaling_config=scaling_config,
                 ami_type=ami_type,
                 capacity_type=capacity_type,
-                create_nodegroup=create_nodegroup,
-                wait_for_cluster=wait
+                create_nodegroup=create_nodegroup
             )
         
         console.print(f"✅ EKS cluster creation initiated")
@@ -730,81 +1076,10 @@ def create_eks_cluster(
         if 'subnets' in cluster_info:
             console.print(f"🌐 Subnets: {cluster_info['subnets']}")
         
-        # Show node group information
         if create_nodegroup:
-            if 'nodegroup_info' in cluster_info:
-                nodegroup_info = cluster_info['nodegroup_info']
-                console.print(f"\n✅ Node group creation initiated")
-                console.print(f"📋 Node group name: {nodegroup_info['nodegroup_name']}")
-                console.print(f"📋 Node group ARN: {nodegroup_info['nodegroup_arn']}")
-                console.print(f"💻 Instance types: {nodegroup_info['instance_types']}")
-                console.print(f"📊 Scaling config: {nodegroup_info['scaling_config']}")
-            elif 'nodegroup_error' in cluster_info:
-                console.print(f"\n⚠️  Node group creation failed: {cluster_info['nodegroup_error']}")
-                console.print(f"💡 You can create it manually later using: k8s-helper create-nodegroup {name}")
-            elif 'node_group_name' in cluster_info:
-                console.print(f"\n📋 Node group will be created: {cluster_info['node_group_name']}")
-                console.print(f"💡 Create it after cluster is active: k8s-helper create-nodegroup {name}")
-        
-        if wait:
-            console.print("⏳ Waiting for cluster to become active...")
-            if eks_client.wait_for_cluster_active(name):
-                console.print("✅ EKS cluster is now active!")
-                
-                # Show cluster status
-                status = eks_client.get_cluster_status(name)
-                console.print(f"🔗 Endpoint: {status['endpoint']}")
-                
-                # If node group was created, wait for it too
-                if create_nodegroup and 'nodegroup_info' in cluster_info:
-                    nodegroup_name = cluster_info['nodegroup_info']['nodegroup_name']
-                    console.print(f"⏳ Waiting for node group {nodegroup_name} to become active...")
-                    if eks_client.wait_for_nodegroup_active(name, nodegroup_name):
-                        console.print("✅ Node group is now active!")
-                        console.print("🎉 Cluster is ready with worker nodes!")
-                    else:
-                        console.print("❌ Timeout waiting for node group to become active")
-                elif create_nodegroup and not wait:
-                    # Create node group now that cluster is active
-                    nodegroup_name = cluster_info.get('node_group_name') or f"{name}-nodegroup"
-                    console.print(f"🔧 Creating node group: {nodegroup_name}")
-                    try:
-                        nodegroup_info = eks_client.create_nodegroup(
-                            cluster_name=name,
-                            nodegroup_name=nodegroup_name,
-                            instance_types=instance_type_list,
-                            ami_type=ami_type,
-                            capacity_type=capacity_type,
-                            scaling_config=scaling_config
-                            # No SSH key for automatic creation
-                        )
-                        console.print(f"✅ Node group creation initiated: {nodegroup_name}")
-                        console.print(f"📋 Node group ARN: {nodegroup_info['nodegroup_arn']}")
-                        
-                        console.print(f"⏳ Waiting for node group to become active...")
-                        if eks_client.wait_for_nodegroup_active(name, nodegroup_name):
-                            console.print("✅ Node group is now active!")
-                            console.print("🎉 Cluster is ready with worker nodes!")
-                        else:
-                            console.print("❌ Timeout waiting for node group to become active")
-                    except Exception as e:
-                        console.print(f"❌ Failed to create node group: {e}")
-                
-                # Show next steps
-                console.print(f"\n🚀 Next steps:")
-                console.print(f"   1. Configure kubectl: aws eks update-kubeconfig --name {name} --region {region}")
-                if create_nodegroup:
-                    console.print(f"   2. Verify nodes: kubectl get nodes")
-                    console.print(f"   3. Verify connection: kubectl get svc")
-                    console.print(f"   4. Deploy applications: k8s-helper apply <app-name> <image>")
-                else:
-                    console.print(f"   2. Create node group: k8s-helper create-nodegroup {name}")
-                    console.print(f"   3. Verify connection: kubectl get svc")
-                    console.print(f"   4. Deploy applications: k8s-helper apply <app-name> <image>")
-            else:
-                console.print("❌ Timeout waiting for cluster to become active")
-        else:
-            console.print(f"💡 Use 'aws eks update-kubeconfig --name {name} --region {region}' to configure kubectl")
+            console.print(f"\n📋 Node group will be created: {', '.join(nodegroup_names)}")
+            console.print(f"💡 Create it after cluster is active: k8s-helper create-nodegroup {name} <nodegroup-name>")
+        console.print(f"💡 Use 'aws eks update-kubeconfig --name {name} --region {region}' to configure kubectl")
     
     except Exception as e:
         error_message = str(e)
@@ -854,7 +1129,8 @@ def create_nodegroup(
     try:
         from .core import EKSClient
         
-        eks_client = EKSClient(region=region)
+        # Reuse default subnets and role ARNs found by earlier runs
+        eks_client = EKSClient(region=region, persist_discovery=True)
         
         # Parse instance types
         instance_type_list = [t.strip() for t in instance_types.split(",")]
@@ -903,7 +1179,8 @@ def create_nodegroup(
         
         if wait:
             console.print("⏳ Waiting for node group to become active...")
-            if eks_client.wait_for_nodegroup_active(cluster_name, nodegroup_name):
+            if eks_client.wait_for_nodegroup_active(cluster_name, nodegroup_name,
+                                                    on_progress=_print_wait_progress):
                 console.print("✅ Node group is now active!")
                 console.print("🎉 You can now deploy workloads!")
                 
@@ -948,24 +1225,39 @@ def list_nodegroups(
         
         eks_client = EKSClient(region=region)
         
+        if output != "table":
+            with console.status("Fetching node groups..."):
+                nodegroups = eks_client.list_nodegroups(cluster_name)
+            if not nodegroups:
+                console.print(f"📋 No node groups found for cluster: {cluster_name}")
+                console.print(f"💡 Create one with: k8s-helper create-nodegroup {cluster_name} <nodegroup-name>")
+                return
+            if output == "json":
+                console.print(format_json_output(nodegroups))
+            elif output == "yaml":
+                console.print(format_yaml_output(nodegroups))
+            return
+        
+        nodegroups = eks_client.iter_nodegroups(cluster_name)
         with console.status("Fetching node groups..."):
-            nodegroups = eks_client.list_nodegroups(cluster_name)
+            first = next(nodegroups, None)
         
-        if not nodegroups:
+        if first is None:
             console.print(f"📋 No node groups found for cluster: {cluster_name}")
             console.print(f"💡 Create one with: k8s-helper create-nodegroup {cluster_name} <nodegroup-name>")
             return
         
-        if output == "table":
-            table = Table(title=f"Node Groups for {cluster_name}")
-            table.add_column("Name", style="cyan")
-            table.add_column("Status", style="green")
-            table.add_column("Instance Types", style="blue")
-            table.add_column("Capacity Type", style="yellow")
-            table.add_column("Scaling Config", style="magenta")
-            table.add_column("Created", style="white")
-            
-            for ng in nodegroups:
+        table = Table(title=f"Node Groups for {cluster_name}")
+        table.add_column("Name", style="cyan")
+        table.add_column("Status", style="green")
+        table.add_column("Instance Types", style="blue")
+        table.add_column("Capacity Type", style="yellow")
+        table.add_column("Scaling Config", style="magenta")
+        table.add_column("Created", style="white")
+        
+        # Render rows as each describe call completes
+        with Live(table, console=console, refresh_per_second=8):
+            for ng in itertools.chain([first], nodegroups):
                 scaling = f"{ng['scaling_config']['minSize']}-{ng['scaling_config']['maxSize']} (desired: {ng['scaling_config']['desiredSize']})"
                 table.add_row(
                     ng['name'],
@@ -975,15 +1267,74 @@ def list_nodegroups(
                     scaling,
                     format_age(ng['created_at'])
                 )
-            
-            console.print(table)
-        elif output == "json":
-            console.print(format_json_output(nodegroups))
-        elif output == "yaml":
-            console.print(format_yaml_output(nodegroups))
     
     except Exception as e:
         console.print(f"❌ Failed to list node groups: {e}")
+
+
+@app.command()
+def list_clusters(
+    regions: str = typer.Option("us-west-2", "--regions", "-r", help="AWS regions (comma-separated)"),
+    nodegroups: bool = typer.Option(True, "--nodegroups/--no-nodegroups", help="Describe the node groups of every cluster"),
+    sort_by: str = typer.Option("region", "--sort-by", help="Sort by: region, name, status, version, nodegroups, nodes, created_at"),
+    reverse: bool = typer.Option(False, "--reverse", help="Sort in descending order"),
+    output: str = output_option
+):
+    """List EKS clusters across one or more regions"""
+    region_list = [r.strip() for r in regions.split(",") if r.strip()]
+    if not region_list:
+        console.print("❌ No regions given")
+        return
+    
+    try:
+        from .core import MultiRegionEKS
+        
+        inventory = MultiRegionEKS(region_list)
+        with console.status(f"Fetching clusters from {len(region_list)} region(s)..."):
+            result = inventory.inventory(include_nodegroups=nodegroups, sort_by=sort_by, reverse=reverse)
+    except Exception as e:
+        console.print(f"❌ Failed to list clusters: {e}")
+        return
+    
+    if output == "json":
+        console.print(format_json_output(result))
+        return
+    elif output == "yaml":
+        console.print(format_yaml_output(result))
+        return
+    
+    if result['clusters']:
+        table = Table(title=f"EKS Clusters ({len(result['clusters'])})")
+        table.add_column("Region", style="cyan")
+        table.add_column("Name", style="cyan")
+        table.add_column("Status", style="green")
+        table.add_column("Version", style="blue")
+        if nodegroups:
+            table.add_column("Node Groups", justify="right", style="yellow")
+            table.add_column("Nodes", justify="right", style="magenta")
+        table.add_column("Age", style="white")
+        
+        for cluster in result['clusters']:
+            row = [cluster['region'], cluster['name'], cluster['status'], cluster['version']]
+            if nodegroups:
+                row += [str(cluster['nodegroups']), str(cluster['nodes'])]
+            row.append(format_age(cluster['created_at']))
+            table.add_row(*row)
+        
+        console.print(table)
+    else:
+        console.print(f"📋 No clusters found in: {', '.join(region_list)}")
+    
+    regions_table = Table(title="Regions")
+    regions_table.add_column("Region", style="cyan")
+    regions_table.add_column("Clusters", justify="right")
+    regions_table.add_column("Latency", justify="right", style="green")
+    regions_table.add_column("Error", style="red")
+    
+    for region, summary in result['regions'].items():
+        regions_table.add_row(region, str(summary['clusters']), f"{summary['seconds']:.2f}s", summary['error'] or "")
+    
+    console.print(regions_table)
 # ======================
 # SECRET COMMANDS
 # ======================
@@ -1015,7 +1366,7 @@ def create_secret(
             return
         
         ns = namespace or get_config().get_namespace()
-        client = K8sClient(namespace=ns)
+        client = get_k8s_client(ns)
         
         with console.status(f"Creating secret {name}..."):
             result = client.create_secret(name, data_dict, secret_type, ns)
@@ -1034,13 +1385,15 @@ def create_secret(
 @app.command()
 def list_secrets(
     namespace: Optional[str] = namespace_option,
-    output: str = output_option
+    output: str = output_option,
+    selector: Optional[str] = selector_option,
+    field_selector: Optional[str] = field_selector_option
 ):
     """List secrets"""
     ns = namespace or get_config().get_namespace()
-    client = K8sClient(namespace=ns)
+    client = get_k8s_client(ns)
     
-    secrets = client.list_secrets(ns)
+    secrets = client.list_secrets(ns, label_selector=selector, field_selector=field_selector)
     
     if output == "table":
         table = Table(title=f"Secrets in {ns}")
@@ -1068,7 +1421,7 @@ def delete_secret(
 ):
     """Delete a secret"""
     ns = namespace or get_config().get_namespace()
-    client = K8sClient(namespace=ns)
+    client = get_k8s_client(ns)
     
     if typer.confirm(f"Are you sure you want to delete secret {name}?"):
         with console.status(f"Deleting secret {name}..."):
@@ -1098,7 +1451,7 @@ def create_pvc(
     access_modes_list = [mode.strip() for mode in access_modes.split(",")]
     
     ns = namespace or get_config().get_namespace()
-    client = K8sClient(namespace=ns)
+    client = get_k8s_client(ns)
     
     with console.status(f"Creating PVC {name}..."):
         result = client.create_pvc(
@@ -1122,13 +1475,15 @@ def create_pvc(
 @app.command()
 def list_pvcs(
     namespace: Optional[str] = namespace_option,
-    output: str = output_option
+    output: str = output_option,
+    selector: Optional[str] = selector_option,
+    field_selector: Optional[str] = field_selector_option
 ):
     """List Persistent Volume Claims"""
     ns = namespace or get_config().get_namespace()
-    client = K8sClient(namespace=ns)
+    client = get_k8s_client(ns)
     
-    pvcs = client.list_pvcs(ns)
+    pvcs = client.list_pvcs(ns, label_selector=selector, field_selector=field_selector)
     
     if output == "table":
         table = Table(title=f"PVCs in {ns}")
@@ -1167,7 +1522,7 @@ def delete_pvc(
 ):
     """Delete a Persistent Volume Claim"""
     ns = namespace or get_config().get_namespace()
-    client = K8sClient(namespace=ns)
+    client = get_k8s_client(ns)
     
     if typer.confirm(f"Are you sure you want to delete PVC {name}?"):
         with console.status(f"Deleting PVC {name}..."):
@@ -1188,7 +1543,7 @@ def service_url(
 ):
     """Get service URL including AWS ELB URLs"""
     ns = namespace or get_config().get_namespace()
-    client = K8sClient(namespace=ns)
+    client = get_k8s_client(ns)
     
     def show_service_url():
         url_info = client.get_service_url(name, ns)
@@ -8,6 +8,38 @@ import yaml
 from pathlib import Path
 
 
+# Number of objects requested per page when walking list endpoints
+DEFAULT_PAGE_SIZE = 500
+
+# Widest column of a table printed page by page; the first page fixes the widths
+TABLE_MAX_COLUMN_WIDTH = 63
+
+# Maximum number of bytes read at a time from a streamed log response
+LOG_CHUNK_SIZE = 64 * 1024
+
+# Client-side request rate for the Kubernetes API (sustained requests per second and burst)
+DEFAULT_QPS = 50.0
+DEFAULT_BURST = 100
+
+# Client-side request rate for AWS APIs, which throttle much earlier than an API server
+DEFAULT_AWS_QPS = 10.0
+DEFAULT_AWS_BURST = 20
+
+# Retries of throttled (429) and transient 5xx responses before an error is surfaced
+DEFAULT_MAX_RETRIES = 5
+
+# Seconds discovered default subnets and IAM role ARNs are reused before being looked up again
+DEFAULT_DISCOVERY_TTL = 3600
+
+# File keeping discovered AWS resources between runs when persistence is enabled
+DISCOVERY_CACHE_FILE = "~/.k8s-helper/discovery-cache.json"
+
+# Polling of EKS clusters and node groups: first interval, growth factor and cap (seconds)
+EKS_WAIT_INITIAL_DELAY = 5.0
+EKS_WAIT_MULTIPLIER = 1.5
+EKS_WAIT_MAX_DELAY = 30.0
+
+
 class K8sConfig:
     """Configuration class for k8s-helper"""
     
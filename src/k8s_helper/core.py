@@ -1,30 +1,218 @@
-from kubernetes import client, config
+from kubernetes import client, config, watch
+from kubernetes import utils as k8s_utils
 from kubernetes.client.rest import ApiException
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Callable, Iterable, Iterator, Tuple
 import yaml
+import os
+import threading
 import time
 import base64
-import boto3
+import heapq
 import json
-from botocore.exceptions import ClientError, NoCredentialsError
+from collections import Counter
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from .config import (
+    DEFAULT_AWS_BURST,
+    DEFAULT_AWS_QPS,
+    DEFAULT_BURST,
+    DEFAULT_DISCOVERY_TTL,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_PAGE_SIZE,
+    DEFAULT_QPS,
+    DISCOVERY_CACHE_FILE,
+    LOG_CHUNK_SIZE
+)
+from .utils import (
+    COMPRESSION_SUFFIXES,
+    load_manifests,
+    log_timestamp,
+    log_timestamp_key,
+    SPEC_HASH_ANNOTATION,
+    create_deployment_manifest,
+    create_service_manifest,
+    manifest_tier,
+    open_compressed,
+    parse_equality_selector,
+    with_spec_hash
+)
+from . import fastpath
+from .metrics import Timeline
+from .discovery import DiscoveryCache, shared_cache
+from .ratelimit import RequestLayer, install_boto_request_layer, install_k8s_request_layer
+from .waiters import ProgressCallback, Waiter, WaitFailed
+
+# Kinds that can be server-side applied, mapped to (API group attribute, resource
+# name used in the generated method names)
+APPLY_KINDS = {
+    'Deployment': ('apps_v1', 'deployment'),
+    'Service': ('core_v1', 'service'),
+    'ConfigMap': ('core_v1', 'config_map'),
+    'Secret': ('core_v1', 'secret'),
+    'PersistentVolumeClaim': ('core_v1', 'persistent_volume_claim'),
+}
+
+# Field manager recorded by the API server for objects applied by k8s-helper
+FIELD_MANAGER = "k8s-helper"
+
+# Kinds that can be deleted by label selector, mapped to (API group attribute, resource
+# name used in the generated method names), in the order they are deleted by default
+DELETABLE_KINDS = {
+    'deployments': ('apps_v1', 'deployment'),
+    'statefulsets': ('apps_v1', 'stateful_set'),
+    'services': ('core_v1', 'service'),
+    'pods': ('core_v1', 'pod'),
+    'configmaps': ('core_v1', 'config_map'),
+    'secrets': ('core_v1', 'secret'),
+    'pvcs': ('core_v1', 'persistent_volume_claim'),
+}
+
+# IAM roles created for clusters and node groups, mapped to (role name, trusted
+# service, managed policies attached on creation)
+EKS_ROLES = {
+    'cluster': ('eks-cluster-role', 'eks.amazonaws.com', [
+        "arn:aws:iam::aws:policy/AmazonEKSClusterPolicy"
+    ]),
+    'nodegroup': ('eks-nodegroup-role', 'ec2.amazonaws.com', [
+        "arn:aws:iam::aws:policy/AmazonEKSWorkerNodePolicy",
+        "arn:aws:iam::aws:policy/AmazonEKS_CNI_Policy",
+        "arn:aws:iam::aws:policy/AmazonEC2ContainerRegistryReadOnly"
+    ]),
+}
+
+# Cluster and node group statuses from which ACTIVE cannot follow
+EKS_FAILED_STATUSES = ('FAILED', 'CREATE_FAILED', 'DEGRADED', 'DELETING', 'DELETE_FAILED')
+
+# botocore client settings disabling its own retries; RequestLayer retries instead
+BOTO_NO_RETRIES = {'retries': {'total_max_attempts': 1, 'mode': 'standard'}}
+
+# Process-wide ApiClients keyed by (kubeconfig path, context)
+_api_clients: Dict[Tuple[Optional[str], Optional[str]], Any] = {}
+_api_clients_lock = threading.Lock()
+
+
+def get_api_client(config_file: Optional[str] = None, context: Optional[str] = None,
+                   pool_size: Optional[int] = None, qps: Optional[float] = DEFAULT_QPS,
+                   burst: int = DEFAULT_BURST, max_retries: int = DEFAULT_MAX_RETRIES):
+    """Get the shared ApiClient for a kubeconfig file and context
+    
+    The kubeconfig is parsed and the connection pool created only on first use;
+    later calls with the same key reuse them. Requests of the client go through a
+    RequestLayer (rate limit and retries) shared by everything using it.
+    
+    Args:
+        config_file: Path to the kubeconfig file (default: KUBECONFIG or ~/.kube/config)
+        context: Kubeconfig context (default: current context)
+        pool_size: Maximum connections kept per host (only used when the client is created)
+        qps: Sustained requests per second; None disables limiting (only used when the client is created)
+        burst: Requests that may be sent at once (only used when the client is created)
+        max_retries: Retries of throttled or transient failures (only used when the client is created)
+        
+    Returns:
+        A kubernetes.client.ApiClient
+    """
+    key = (os.path.expanduser(config_file) if config_file else None, context)
+    
+    with _api_clients_lock:
+        api_client = _api_clients.get(key)
+        if api_client is None:
+            configuration = client.Configuration()
+            try:
+                config.load_kube_config(config_file=key[0], context=context,
+                                        client_configuration=configuration)
+            except Exception:
+                # For running inside a cluster
+                config.load_incluster_config(client_configuration=configuration)
+            
+            if pool_size:
+                configuration.connection_pool_maxsize = pool_size
+            api_client = client.ApiClient(configuration)
+            install_k8s_request_layer(api_client, RequestLayer(qps, burst, max_retries))
+            _api_clients[key] = api_client
+        return api_client
+
+
+def reset_api_clients() -> None:
+    """Close and forget every shared ApiClient (e.g. after switching kubeconfig)"""
+    with _api_clients_lock:
+        for api_client in _api_clients.values():
+            api_client.close()
+        _api_clients.clear()
 
 
 class EKSClient:
     """AWS EKS client for cluster management"""
     
-    def __init__(self, region: str = "us-west-2"):
+    def __init__(self, region: str = "us-west-2", qps: Optional[float] = DEFAULT_AWS_QPS,
+                 burst: int = DEFAULT_AWS_BURST, max_retries: int = DEFAULT_MAX_RETRIES,
+                 discovery_ttl: float = DEFAULT_DISCOVERY_TTL, persist_discovery: bool = False,
+                 discovery_cache: Optional[DiscoveryCache] = None):
         """Initialize EKS client
         
         Args:
             region: AWS region for EKS operations
+            qps: Sustained AWS calls per second across the EKS, EC2 and IAM clients;
+                None disables limiting
+            burst: AWS calls that may be sent at once
+            max_retries: Retries of throttled or transient failures
+            discovery_ttl: Seconds discovered default subnets and role ARNs are
+                reused; 0 looks them up every time
+            persist_discovery: Keep discovered values in DISCOVERY_CACHE_FILE so
+                that later runs reuse them
+            discovery_cache: Cache to use instead of the process-wide one
         """
+        # boto3 is only needed for EKS operations; import it on first use
+        import boto3
+        from botocore.config import Config
+        from botocore.exceptions import ClientError, NoCredentialsError
+        
         self.region = region
+        self.discovery_ttl = discovery_ttl
+        if discovery_cache is None:
+            discovery_cache = shared_cache(DISCOVERY_CACHE_FILE if persist_discovery else None)
+        self.discovery = discovery_cache
+        # Discovered values belong to an account, resolved on first use of the cache
+        self._account_id: Optional[str] = None
+        self._account_lock = threading.Lock()
+        self.requests = RequestLayer(qps, burst, max_retries)
+        boto_config = Config(**BOTO_NO_RETRIES)
         try:
-            self.eks_client = boto3.client('eks', region_name=region)
-            self.ec2_client = boto3.client('ec2', region_name=region)
-            self.iam_client = boto3.client('iam', region_name=region)
+            self.eks_client = boto3.client('eks', region_name=region, config=boto_config)
+            self.ec2_client = boto3.client('ec2', region_name=region, config=boto_config)
+            self.iam_client = boto3.client('iam', region_name=region, config=boto_config)
+            self.sts_client = boto3.client('sts', region_name=region, config=boto_config)
         except (NoCredentialsError, ClientError) as e:
             raise Exception(f"AWS credentials not found or invalid: {e}")
+        
+        for boto_client in (self.eks_client, self.ec2_client, self.iam_client, self.sts_client):
+            install_boto_request_layer(boto_client, self.requests)
+    
+    @property
+    def request_stats(self) -> Dict[str, float]:
+        """Counters of AWS calls, retries and throttle waits made by this client"""
+        return self.requests.stats.snapshot()
+    
+    def account_id(self) -> str:
+        """AWS account ID of the client's credentials, looked up once per client"""
+        with self._account_lock:
+            if self._account_id is None:
+                self._account_id = self.sts_client.get_caller_identity()['Account']
+            return self._account_id
+    
+    def _discovery_prefix(self) -> str:
+        return f"{self.account_id()}/{self.region}/"
+    
+    def _discover(self, name: str, discover: Callable[[], Any]) -> Any:
+        """Get a discovered value for this account and region from the cache, or discover it"""
+        return self.discovery.get_or_discover(self._discovery_prefix() + name, discover, self.discovery_ttl)
+    
+    def forget_discovered(self) -> None:
+        """Drop cached default subnets and role ARNs for this account and region"""
+        if self._account_id is None:
+            # Nothing was taken from the cache, so nothing of ours can be stale
+            return
+        self.discovery.invalidate(self._discovery_prefix())
     
     def create_cluster(self, cluster_name: str, version: str = "1.29", 
                       subnets: List[str] = None, security_groups: List[str] = None,
@@ -51,6 +239,8 @@ class EKSClient:
         Returns:
             Dict containing cluster information
         """
+        from botocore.exceptions import ClientError
+        
         try:
             # Use default values if not provided
             if subnets is None:
@@ -133,27 +323,38 @@ class EKSClient:
             return cluster_info
             
         except ClientError as e:
+            # Cached subnets or roles may have been deleted since they were discovered
+            self.forget_discovered()
             raise Exception(f"Failed to create EKS cluster: {e}")
     
     def _get_default_subnets(self) -> List[str]:
-        """Get default subnets for EKS cluster from different AZs"""
+        """Get default subnets for EKS cluster from different AZs, cached per region"""
+        return self._discover('default-subnets', self._discover_default_subnets)
+    
+    def _discover_default_subnets(self) -> List[str]:
+        """Look up available default-VPC subnets in two different AZs
+        
+        The subnets are filtered on the server and paged, stopping as soon as
+        two AZs are covered.
+        """
+        from botocore.exceptions import ClientError
+        
         try:
-            response = self.ec2_client.describe_subnets()
+            paginator = self.ec2_client.get_paginator('describe_subnets')
+            pages = paginator.paginate(Filters=[
+                {'Name': 'default-for-az', 'Values': ['true']},
+                {'Name': 'state', 'Values': ['available']}
+            ])
             
-            # Group subnets by availability zone
+            # Take the first subnet of each availability zone
             subnets_by_az = {}
-            for subnet in response['Subnets']:
-                if subnet['State'] == 'available':
-                    az = subnet['AvailabilityZone']
-                    if az not in subnets_by_az:
-                        subnets_by_az[az] = []
-                    subnets_by_az[az].append(subnet['SubnetId'])
-            
-            # Get at least 2 subnets from different AZs
-            selected_subnets = []
-            for az, subnet_ids in subnets_by_az.items():
-                if len(selected_subnets) < 2:
-                    selected_subnets.append(subnet_ids[0])  # Take first subnet from each AZ
+            for page in pages:
+                for subnet in page['Subnets']:
+                    subnets_by_az.setdefault(subnet['AvailabilityZone'], subnet['SubnetId'])
+                if len(subnets_by_az) >= 2:
+                    break
+            
+            selected_subnets = list(subnets_by_az.values())[:2]
             
             if len(selected_subnets) < 2:
                 # If we don't have subnets in 2 different AZs, let's create them
@@ -166,6 +367,8 @@ class EKSClient:
     
     def _create_default_vpc_subnets(self) -> List[str]:
         """Create default VPC and subnets for EKS if none exist"""
+        from botocore.exceptions import ClientError
+        
         try:
             # Get default VPC
             vpcs = self.ec2_client.describe_vpcs(Filters=[{'Name': 'isDefault', 'Values': ['true']}])
@@ -241,54 +444,19 @@ class EKSClient:
             raise Exception(f"Failed to create default subnets: {e}")
     
     def _create_or_get_cluster_role(self) -> str:
-        """Create or get IAM role for EKS cluster"""
-        role_name = "eks-cluster-role"
-        
-        try:
-            # Check if role exists
-            response = self.iam_client.get_role(RoleName=role_name)
-            return response['Role']['Arn']
-            
-        except ClientError as e:
-            if e.response['Error']['Code'] == 'NoSuchEntity':
-                # Create the role
-                trust_policy = {
-                    "Version": "2012-10-17",
-                    "Statement": [
-                        {
-                            "Effect": "Allow",
-                            "Principal": {
-                                "Service": "eks.amazonaws.com"
-                            },
-                            "Action": "sts:AssumeRole"
-                        }
-                    ]
-                }
-                
-                response = self.iam_client.create_role(
-                    RoleName=role_name,
-                    AssumeRolePolicyDocument=json.dumps(trust_policy),
-                    Description="EKS cluster role created by k8s-helper"
-                )
-                
-                # Attach required policies
-                policies = [
-                    "arn:aws:iam::aws:policy/AmazonEKSClusterPolicy"
-                ]
-                
-                for policy in policies:
-                    self.iam_client.attach_role_policy(
-                        RoleName=role_name,
-                        PolicyArn=policy
-                    )
-                
-                return response['Role']['Arn']
-            else:
-                raise Exception(f"Failed to create or get cluster role: {e}")
+        """Create or get IAM role for EKS cluster, cached per region"""
+        return self._discover('cluster-role', lambda: self._create_or_get_role('cluster'))
     
     def _create_or_get_nodegroup_role(self) -> str:
-        """Create or get IAM role for EKS node group"""
-        role_name = "eks-nodegroup-role"
+        """Create or get IAM role for EKS node group, cached per region"""
+        return self._discover('nodegroup-role', lambda: self._create_or_get_role('nodegroup'))
+    
+    def _create_or_get_role(self, purpose: str) -> str:
+        """Get the ARN of one of the EKS_ROLES, creating the role if it does not exist"""
+        from botocore.exceptions import ClientError
+        
+        role_name, service, policies = EKS_ROLES[purpose]
+        description = "cluster" if purpose == 'cluster' else "node group"
         
         try:
             # Check if role exists
@@ -304,7 +472,7 @@ class EKSClient:
                         {
                             "Effect": "Allow",
                             "Principal": {
-                                "Service": "ec2.amazonaws.com"
+                                "Service": service
                             },
                             "Action": "sts:AssumeRole"
                         }
@@ -314,16 +482,10 @@ class EKSClient:
                 response = self.iam_client.create_role(
                     RoleName=role_name,
                     AssumeRolePolicyDocument=json.dumps(trust_policy),
-                    Description="EKS node group role created by k8s-helper"
+                    Description=f"EKS {description} role created by k8s-helper"
                 )
                 
-                # Attach required policies for node group
-                policies = [
-                    "arn:aws:iam::aws:policy/AmazonEKSWorkerNodePolicy",
-                    "arn:aws:iam::aws:policy/AmazonEKS_CNI_Policy",
-                    "arn:aws:iam::aws:policy/AmazonEC2ContainerRegistryReadOnly"
-                ]
-                
+                # Attach required policies
                 for policy in policies:
                     self.iam_client.attach_role_policy(
                         RoleName=role_name,
@@ -332,7 +494,7 @@ class EKSClient:
                 
                 return response['Role']['Arn']
             else:
-                raise Exception(f"Failed to create or get node group role: {e}")
+                raise Exception(f"Failed to create or get {description} role: {e}")
     
     def create_nodegroup(self, cluster_name: str, nodegroup_name: str, 
                         instance_types: List[str] = None, ami_type: str = "AL2_x86_64",
@@ -355,6 +517,8 @@ class EKSClient:
         Returns:
             Dict containing node group information
         """
+        from botocore.exceptions import ClientError
+        
         try:
             # Use defaults if not provided
             if instance_types is None:
@@ -372,7 +536,6 @@ class EKSClient:
             
             if subnets is None:
                 # Get cluster's subnets
-                cluster_info = self.get_cluster_status(cluster_name)
                 cluster_details = self.eks_client.describe_cluster(name=cluster_name)
                 subnets = cluster_details['cluster']['resourcesVpcConfig']['subnetIds']
             
@@ -411,10 +574,13 @@ class EKSClient:
             }
             
         except ClientError as e:
+            self.forget_discovered()
             raise Exception(f"Failed to create node group: {e}")
     
     def get_nodegroup_status(self, cluster_name: str, nodegroup_name: str) -> Dict:
         """Get EKS node group status"""
+        from botocore.exceptions import ClientError
+        
         try:
             response = self.eks_client.describe_nodegroup(
                 clusterName=cluster_name,
@@ -437,44 +603,253 @@ class EKSClient:
         except ClientError as e:
             raise Exception(f"Failed to get node group status: {e}")
     
-    def wait_for_nodegroup_active(self, cluster_name: str, nodegroup_name: str, timeout: int = 1200) -> bool:
-        """Wait for EKS node group to become active"""
-        import time
-        start_time = time.time()
+    def wait_for_nodegroup_active(self, cluster_name: str, nodegroup_name: str, timeout: int = 1200,
+                                  on_progress: Optional[ProgressCallback] = None) -> bool:
+        """Wait for EKS node group to become active
         
-        while time.time() - start_time < timeout:
-            try:
-                status = self.get_nodegroup_status(cluster_name, nodegroup_name)
-                if status['status'] == 'ACTIVE':
-                    return True
-                elif status['status'] in ['CREATE_FAILED', 'DEGRADED']:
-                    raise Exception(f"Node group creation failed with status: {status['status']}")
-                
-                time.sleep(30)  # Check every 30 seconds
-                
-            except Exception as e:
-                raise Exception(f"Error waiting for node group: {e}")
+        Polls with a short first interval growing to EKS_WAIT_MAX_DELAY, and
+        waits out throttling and transient errors.
         
-        return False
+        Args:
+            cluster_name: Name of the EKS cluster
+            nodegroup_name: Name of the node group
+            timeout: Maximum number of seconds to wait
+            on_progress: Called with (resource, status, previous, elapsed) on
+                every status change
+            
+        Returns:
+            True if the node group became active, False on timeout
+        """
+        try:
+            statuses = self.wait_for_active(cluster_name, [nodegroup_name], timeout=timeout,
+                                            include_cluster=False, on_progress=on_progress)
+        except WaitFailed as e:
+            raise Exception(f"Error waiting for node group: Node group creation failed with status: {e.status}")
+        except Exception as e:
+            raise Exception(f"Error waiting for node group: {e}")
+        return all(status == 'ACTIVE' for status in statuses.values())
     
-    def list_nodegroups(self, cluster_name: str) -> List[Dict]:
-        """List all node groups for a cluster"""
+    def wait_for_active(self, cluster_name: str, nodegroup_names: Iterable[str] = (),
+                        timeout: int = 1800, include_cluster: bool = True,
+                        on_progress: Optional[ProgressCallback] = None) -> Dict[str, Optional[str]]:
+        """Wait for a cluster and several of its node groups to become active together
+        
+        Every resource is polled on its own adaptive schedule, and the wait
+        ends as soon as all of them are ACTIVE.
+        
+        Args:
+            cluster_name: Name of the EKS cluster
+            nodegroup_names: Node groups to wait for
+            timeout: Maximum number of seconds to wait for all of them
+            include_cluster: Whether to wait for the cluster itself
+            on_progress: Called with (resource, status, previous, elapsed) on
+                every status change
+            
+        Returns:
+            Last status of every resource, keyed "cluster/<name>" and
+            "nodegroup/<name>"; a status other than ACTIVE means the wait timed out
+            
+        Raises:
+            WaitFailed: The cluster or a node group failed
+        """
+        checks = {}
+        if include_cluster:
+            checks[f"cluster/{cluster_name}"] = lambda: (
+                self.eks_client.describe_cluster(name=cluster_name)['cluster']['status'])
+        for nodegroup_name in nodegroup_names:
+            checks[f"nodegroup/{nodegroup_name}"] = lambda nodegroup_name=nodegroup_name: (
+                self.eks_client.describe_nodegroup(clusterName=cluster_name, nodegroupName=nodegroup_name)
+                ['nodegroup']['status'])
+        
+        return Waiter().wait(checks, timeout, failure=EKS_FAILED_STATUSES, on_progress=on_progress)
+    
+    # ======================
+    # PROVISIONING PIPELINE
+    # ======================
+    def provision(self, cluster_name: str, nodegroups: Optional[List[Dict]] = None,
+                  version: str = "1.29", subnets: List[str] = None,
+                  security_groups: List[str] = None, role_arn: str = None,
+                  timeout: int = 3000, max_workers: int = 8,
+                  on_progress: Optional[ProgressCallback] = None) -> Dict:
+        """Create a cluster and its node groups, overlapping every step that can overlap
+        
+        1. Default subnets and the cluster role are discovered in parallel
+        2. The cluster is created; while its control plane comes up, the node
+           group role is discovered
+        3. As soon as the cluster is ACTIVE, all node groups are created in parallel
+        4. The node groups are awaited together
+        
+        Args:
+            cluster_name: Name of the EKS cluster
+            nodegroups: create_nodegroup keyword arguments per node group, each
+                with at least 'nodegroup_name'; subnets and node role default to
+                the cluster's. None creates one "<cluster>-nodegroup"
+            version: Kubernetes version
+            subnets: List of subnet IDs; discovered when not given
+            security_groups: List of security group IDs
+            role_arn: IAM role ARN for the cluster; discovered when not given
+            timeout: Maximum number of seconds to wait for the cluster and node groups
+            max_workers: Maximum number of concurrent AWS calls
+            on_progress: Called with (resource, status, previous, elapsed) on
+                every status change while waiting
+            
+        Returns:
+            Dict with 'cluster' (as returned by create_cluster), 'nodegroups'
+            (create_nodegroup result, or {'error': ...}, per name), 'statuses'
+            (last status of every awaited resource), 'timeline' (phases with
+            start_s, end_s and seconds) and 'seconds'
+            
+        Raises:
+            WaitFailed: The cluster or a node group failed
+        """
+        if nodegroups is None:
+            nodegroups = [{'nodegroup_name': f"{cluster_name}-nodegroup"}]
+        started = time.monotonic()
+        deadline = started + timeout
+        timeline = Timeline()
+        result = {'cluster': None, 'nodegroups': {}, 'statuses': {}}
+        
+        def timed(phase, func, *args, **kwargs):
+            with timeline.phase(phase):
+                return func(*args, **kwargs)
+        
         try:
-            response = self.eks_client.list_nodegroups(clusterName=cluster_name)
-            nodegroups = []
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                subnets_future = (None if subnets is not None else
+                                  executor.submit(timed, "discover subnets", self._get_default_subnets))
+                role_future = (None if role_arn is not None else
+                               executor.submit(timed, "discover cluster role", self._create_or_get_cluster_role))
+                subnets = subnets if subnets_future is None else subnets_future.result()
+                role_arn = role_arn if role_future is None else role_future.result()
+                
+                result['cluster'] = timed("create cluster", self.create_cluster, cluster_name,
+                                          version=version, subnets=subnets, security_groups=security_groups,
+                                          role_arn=role_arn, create_nodegroup=False)
+                
+                # Prepare the node groups while the control plane is being created
+                node_role_future = None
+                if nodegroups and any('node_role_arn' not in spec for spec in nodegroups):
+                    node_role_future = executor.submit(timed, "discover nodegroup role",
+                                                       self._create_or_get_nodegroup_role)
+                
+                with timeline.phase("wait for cluster"):
+                    result['statuses'].update(self.wait_for_active(
+                        cluster_name, timeout=max(0, deadline - time.monotonic()), on_progress=on_progress))
+                if result['statuses'][f"cluster/{cluster_name}"] != 'ACTIVE' or not nodegroups:
+                    return result
+                
+                node_role_arn = node_role_future.result() if node_role_future else None
+                futures = {}
+                for spec in nodegroups:
+                    spec = dict(spec)
+                    spec.setdefault('subnets', subnets)
+                    spec.setdefault('node_role_arn', node_role_arn)
+                    name = spec['nodegroup_name']
+                    futures[name] = executor.submit(timed, f"create nodegroup {name}", self.create_nodegroup,
+                                                    cluster_name, **spec)
+                for name, future in futures.items():
+                    try:
+                        result['nodegroups'][name] = future.result()
+                    except Exception as e:
+                        result['nodegroups'][name] = {'error': str(e)}
+                
+                created = [name for name, info in result['nodegroups'].items() if 'error' not in info]
+                if created:
+                    with timeline.phase("wait for nodegroups"):
+                        result['statuses'].update(self.wait_for_active(
+                            cluster_name, created, timeout=max(0, deadline - time.monotonic()),
+                            include_cluster=False, on_progress=on_progress))
+                return result
+        finally:
+            result['timeline'] = timeline.phases()
+            result['seconds'] = round(time.monotonic() - started, 3)
+    
+    def iter_nodegroups(self, cluster_name: str, max_workers: int = 8) -> Iterator[Dict]:
+        """Describe all node groups of a cluster concurrently
+        
+        Node group names are collected with the list_nodegroups paginator, then
+        described over a bounded thread pool.
+        
+        Args:
+            cluster_name: Name of the EKS cluster
+            max_workers: Maximum number of concurrent describe_nodegroup calls
             
-            for nodegroup_name in response['nodegroups']:
+        Yields:
+            Node group information in listing order, as soon as each is available
+        """
+        from botocore.exceptions import ClientError
+        
+        try:
+            paginator = self.eks_client.get_paginator('list_nodegroups')
+            nodegroup_names = [
+                nodegroup_name
+                for page in paginator.paginate(clusterName=cluster_name)
+                for nodegroup_name in page['nodegroups']
+            ]
+        except ClientError as e:
+            raise Exception(f"Failed to list node groups: {e}")
+        
+        if not nodegroup_names:
+            return
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(nodegroup_names))) as executor:
+            futures = [
+                executor.submit(self.get_nodegroup_status, cluster_name, nodegroup_name)
+                for nodegroup_name in nodegroup_names
+            ]
+            for future in futures:
                 try:
-                    nodegroup_info = self.get_nodegroup_status(cluster_name, nodegroup_name)
-                    nodegroups.append(nodegroup_info)
-                except Exception as e:
+                    yield future.result()
+                except Exception:
                     # Skip node groups that can't be described
                     continue
+    
+    def list_nodegroups(self, cluster_name: str, max_workers: int = 8) -> List[Dict]:
+        """List all node groups for a cluster"""
+        return list(self.iter_nodegroups(cluster_name, max_workers=max_workers))
+    
+    def iter_clusters(self, max_workers: int = 8) -> Iterator[Dict]:
+        """Describe all clusters of the region concurrently
+        
+        Cluster names are collected with the list_clusters paginator, then
+        described over a bounded thread pool.
+        
+        Args:
+            max_workers: Maximum number of concurrent describe_cluster calls
             
-            return nodegroups
-            
+        Yields:
+            Cluster information in listing order, as soon as each is available
+        """
+        from botocore.exceptions import ClientError
+        
+        try:
+            paginator = self.eks_client.get_paginator('list_clusters')
+            cluster_names = [
+                cluster_name
+                for page in paginator.paginate()
+                for cluster_name in page['clusters']
+            ]
         except ClientError as e:
-            raise Exception(f"Failed to list node groups: {e}")
+            raise Exception(f"Failed to list clusters: {e}")
+        
+        if not cluster_names:
+            return
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(cluster_names))) as executor:
+            futures = [
+                executor.submit(self.get_cluster_status, cluster_name)
+                for cluster_name in cluster_names
+            ]
+            for future in futures:
+                try:
+                    yield future.result()
+                except Exception:
+                    # Skip clusters deleted or not describable since they were listed
+                    continue
+    
+    def list_clusters(self, max_workers: int = 8) -> List[Dict]:
+        """List all clusters in the region"""
+        return list(self.iter_clusters(max_workers=max_workers))
     
     def create_nodegroup_with_instance_profile(self, cluster_name: str, nodegroup_name: str, 
                                               instance_types: List[str] = None, ami_type: str = "AL2_x86_64",
@@ -497,6 +872,8 @@ class EKSClient:
         Returns:
             Dict containing node group information
         """
+        from botocore.exceptions import ClientError
+        
         try:
             # Use defaults if not provided
             if instance_types is None:
@@ -514,7 +891,6 @@ class EKSClient:
             
             if subnets is None:
                 # Get cluster's subnets
-                cluster_info = self.get_cluster_status(cluster_name)
                 cluster_details = self.eks_client.describe_cluster(name=cluster_name)
                 subnets = cluster_details['cluster']['resourcesVpcConfig']['subnetIds']
             
@@ -549,11 +925,14 @@ class EKSClient:
             }
             
         except ClientError as e:
+            self.forget_discovered()
             raise Exception(f"Failed to create node group with instance profile: {e}")
     
     def update_nodegroup_scaling_config(self, cluster_name: str, nodegroup_name: str, 
                                        scaling_config: Dict) -> bool:
         """Update the scaling configuration of a node group"""
+        from botocore.exceptions import ClientError
+        
         try:
             # Get current node group configuration
             nodegroup = self.get_nodegroup_status(cluster_name, nodegroup_name)
@@ -575,6 +954,8 @@ class EKSClient:
     def update_nodegroup_instance_type(self, cluster_name: str, nodegroup_name: str, 
                                       instance_types: List[str]) -> bool:
         """Update the instance type of a node group"""
+        from botocore.exceptions import ClientError
+        
         try:
             # Get current node group configuration
             nodegroup = self.get_nodegroup_status(cluster_name, nodegroup_name)
@@ -595,6 +976,8 @@ class EKSClient:
     
     def delete_nodegroup(self, cluster_name: str, nodegroup_name: str) -> bool:
         """Delete an EKS managed node group"""
+        from botocore.exceptions import ClientError
+        
         try:
             self.eks_client.delete_nodegroup(
                 clusterName=cluster_name,
@@ -608,6 +991,8 @@ class EKSClient:
 
     def get_cluster_status(self, cluster_name: str) -> Dict:
         """Get EKS cluster status"""
+        from botocore.exceptions import ClientError
+        
         try:
             response = self.eks_client.describe_cluster(name=cluster_name)
             cluster = response['cluster']
@@ -625,36 +1010,223 @@ class EKSClient:
         except ClientError as e:
             raise Exception(f"Failed to get cluster status: {e}")
     
-    def wait_for_cluster_active(self, cluster_name: str, timeout: int = 1800) -> bool:
-        """Wait for EKS cluster to become active"""
-        import time
-        start_time = time.time()
+    def wait_for_cluster_active(self, cluster_name: str, timeout: int = 1800,
+                                on_progress: Optional[ProgressCallback] = None) -> bool:
+        """Wait for EKS cluster to become active
+        
+        Polls with a short first interval growing to EKS_WAIT_MAX_DELAY, and
+        waits out throttling and transient errors.
+        
+        Args:
+            cluster_name: Name of the EKS cluster
+            timeout: Maximum number of seconds to wait
+            on_progress: Called with (resource, status, previous, elapsed) on
+                every status change
+            
+        Returns:
+            True if the cluster became active, False on timeout
+        """
+        try:
+            statuses = self.wait_for_active(cluster_name, timeout=timeout, on_progress=on_progress)
+        except WaitFailed:
+            raise Exception("Error waiting for cluster: Cluster creation failed")
+        except Exception as e:
+            raise Exception(f"Error waiting for cluster: {e}")
+        return all(status == 'ACTIVE' for status in statuses.values())
+
+
+# Fields a MultiRegionEKS inventory can be sorted by
+INVENTORY_SORT_FIELDS = ('region', 'name', 'status', 'version', 'nodegroups', 'nodes', 'created_at')
+
+
+class MultiRegionEKS:
+    """Inventory of EKS clusters and node groups across several regions
+    
+    Regions are queried concurrently, each through its own EKSClient (and so
+    its own rate limiter, as AWS limits are per region). Clients are created
+    on first use and reused by later inventories.
+    """
+    
+    def __init__(self, regions: Iterable[str], max_workers: int = 8, **client_kwargs):
+        """Initialize the inventory
         
-        while time.time() - start_time < timeout:
+        Args:
+            regions: AWS regions to query; duplicates are ignored
+            max_workers: Maximum number of regions queried at once, and of
+                concurrent describe calls within a region
+            client_kwargs: Extra EKSClient arguments, such as qps
+        """
+        self.regions = list(dict.fromkeys(regions))
+        if not self.regions:
+            raise ValueError("At least one region is required")
+        self.max_workers = max_workers
+        self.client_kwargs = client_kwargs
+        self._clients: Dict[str, EKSClient] = {}
+        self._clients_lock = threading.Lock()
+    
+    def client(self, region: str) -> EKSClient:
+        """Get the EKSClient of a region, creating it on first use"""
+        # boto3's default session is not thread-safe, so clients are created one at a time
+        with self._clients_lock:
+            if region not in self._clients:
+                self._clients[region] = EKSClient(region=region, **self.client_kwargs)
+            return self._clients[region]
+    
+    def _region_inventory(self, region: str, include_nodegroups: bool) -> List[Dict]:
+        eks = self.client(region)
+        clusters = []
+        for cluster in eks.iter_clusters(max_workers=self.max_workers):
+            row = {
+                'region': region,
+                'name': cluster['name'],
+                'status': cluster['status'],
+                'version': cluster['version'],
+                'endpoint': cluster['endpoint'],
+                'created_at': cluster['created_at'],
+                'arn': cluster['arn'],
+            }
+            if include_nodegroups:
+                nodegroups = eks.list_nodegroups(cluster['name'], max_workers=self.max_workers)
+                row['nodegroups'] = len(nodegroups)
+                row['nodes'] = sum(ng['scaling_config'].get('desiredSize', 0) for ng in nodegroups)
+                row['nodegroup_details'] = nodegroups
+            clusters.append(row)
+        return clusters
+    
+    def inventory(self, include_nodegroups: bool = True, sort_by: str = 'region',
+                  reverse: bool = False) -> Dict[str, Any]:
+        """List clusters (and their node groups) in every region concurrently
+        
+        A failing region does not fail the inventory; its error is reported
+        with the other regions' timings.
+        
+        Args:
+            include_nodegroups: Whether to describe the node groups of every cluster
+            sort_by: Field of INVENTORY_SORT_FIELDS to sort the merged clusters by
+            reverse: Sort in descending order
+            
+        Returns:
+            Dict with 'clusters' (one row per cluster across all regions) and
+            'regions' (per region: 'clusters', 'seconds' and 'error')
+        """
+        if sort_by not in INVENTORY_SORT_FIELDS:
+            raise ValueError(f"Cannot sort by '{sort_by}'. Supported fields: {', '.join(INVENTORY_SORT_FIELDS)}")
+        
+        def timed(region):
+            start = time.perf_counter()
             try:
-                status = self.get_cluster_status(cluster_name)
-                if status['status'] == 'ACTIVE':
-                    return True
-                elif status['status'] == 'FAILED':
-                    raise Exception(f"Cluster creation failed")
-                
-                time.sleep(30)  # Check every 30 seconds
-                
+                clusters, error = self._region_inventory(region, include_nodegroups), None
             except Exception as e:
-                raise Exception(f"Error waiting for cluster: {e}")
+                clusters, error = [], str(e)
+            return clusters, {'clusters': len(clusters), 'seconds': round(time.perf_counter() - start, 3),
+                              'error': error}
         
-        return False
+        clusters, regions = [], {}
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(self.regions))) as executor:
+            for region, (region_clusters, summary) in zip(self.regions, executor.map(timed, self.regions)):
+                clusters.extend(region_clusters)
+                regions[region] = summary
+        
+        # Secondary order by region and name keeps equal keys stable across runs
+        clusters.sort(key=lambda row: (row['region'], row['name']))
+        clusters.sort(key=lambda row: (row.get(sort_by) is None, row.get(sort_by)), reverse=reverse)
+        return {'clusters': clusters, 'regions': regions}
 
-class K8sClient:
-    def __init__(self, namespace="default"):
-        try:
-            config.load_kube_config()  # Loads from ~/.kube/config
-        except:
-            config.load_incluster_config()  # For running inside a cluster
 
+class K8sClient:
+    def __init__(self, namespace="default", use_cache: bool = False,
+                 config_file: Optional[str] = None, context: Optional[str] = None,
+                 pool_size: Optional[int] = None, api_client: Optional[Any] = None,
+                 qps: Optional[float] = DEFAULT_QPS, burst: int = DEFAULT_BURST,
+                 max_retries: int = DEFAULT_MAX_RETRIES):
+        """Initialize a Kubernetes client
+        
+        Clients for the same kubeconfig file and context share one ApiClient,
+        connection pool and rate limiter, so creating many K8sClient objects is cheap.
+        
+        Args:
+            namespace: Namespace used by all operations
+            use_cache: Serve reads from shared informers (see enable_cache)
+            config_file: Path to the kubeconfig file
+            context: Kubeconfig context
+            pool_size: Maximum pooled connections for a newly created ApiClient
+            api_client: Explicit ApiClient to use instead of the shared one
+            qps: Sustained requests per second for a newly created ApiClient; None disables limiting
+            burst: Requests that may be sent at once for a newly created ApiClient
+            max_retries: Retries of throttled or transient failures for a newly created ApiClient
+        """
         self.namespace = namespace
-        self.apps_v1 = client.AppsV1Api()
-        self.core_v1 = client.CoreV1Api()
+        self.api_client = api_client or get_api_client(config_file, context, pool_size,
+                                                       qps, burst, max_retries)
+        self.requests = install_k8s_request_layer(self.api_client, RequestLayer(qps, burst, max_retries))
+        self.apps_v1 = client.AppsV1Api(self.api_client)
+        self.core_v1 = client.CoreV1Api(self.api_client)
+        self._informers = {}
+        
+        if use_cache:
+            self.enable_cache()
+
+    @property
+    def request_stats(self) -> Dict[str, float]:
+        """Counters of requests, retries and throttle waits on this client's ApiClient"""
+        return self.requests.stats.snapshot()
+
+    def with_namespace(self, namespace: str) -> 'K8sClient':
+        """Get a client for another namespace sharing this client's connection and cache settings"""
+        view = K8sClient(namespace=namespace, api_client=self.api_client)
+        if self._informers:
+            view.enable_cache(list(self._informers))
+        return view
+
+    # ======================
+    # LOCAL CACHE
+    # ======================
+    def enable_cache(self, kinds: Optional[List[str]] = None) -> None:
+        """Serve reads from shared informers instead of the API server
+        
+        Each kind is listed once and then kept current with a watch. Informers
+        are shared by every K8sClient in the process.
+        
+        Args:
+            kinds: Kinds to cache (pods, deployments, services); defaults to all
+        """
+        from .informer import CACHEABLE_KINDS, get_informer
+        
+        for kind in kinds or list(CACHEABLE_KINDS):
+            api_attr, list_method = CACHEABLE_KINDS[kind]
+            list_func = getattr(getattr(self, api_attr), list_method)
+            self._informers[kind] = get_informer(kind, self.namespace, list_func,
+                                                 key=(id(self.api_client),))
+
+    def disable_cache(self) -> None:
+        """Go back to reading from the API server (shared informers keep running)"""
+        self._informers = {}
+
+    def _cached(self, kind: str, namespace: Optional[str] = None):
+        """Get the informer serving a kind in a namespace, if caching is enabled"""
+        if namespace and namespace != self.namespace:
+            return None
+        return self._informers.get(kind)
+
+    def _list_cached(self, kind: str, label_selector: Optional[str] = None,
+                     field_selector: Optional[str] = None) -> Optional[List[Any]]:
+        """List objects from the cache; None means list them from the API server
+        
+        The label index only answers equality selectors, so field selectors and
+        set-based label selectors always go to the API server.
+        """
+        informer = self._cached(kind)
+        if informer is None or field_selector:
+            return None
+        labels = parse_equality_selector(label_selector)
+        if labels is None:
+            return None
+        return informer.list(labels)
+
+    def _read_cached(self, kind: str, name: str, namespace: Optional[str] = None):
+        """Look up an object in the cache; None means read it from the API server"""
+        informer = self._cached(kind, namespace)
+        return informer.get(name) if informer else None
 
     # ======================
     # DEPLOYMENT OPERATIONS
@@ -834,24 +1406,65 @@ class K8sClient:
             print(f"❌ Error scaling deployment '{name}': {e}")
             return False
 
-    def list_deployments(self) -> List[Dict[str, Any]]:
-        """List all deployments in the namespace"""
+    def iter_deployments(self, page_size: int = DEFAULT_PAGE_SIZE, label_selector: Optional[str] = None,
+                         field_selector: Optional[str] = None, fast: bool = False) -> Iterator[Dict[str, Any]]:
+        """Iterate over deployments in the namespace, fetching them page by page
+        
+        Args:
+            page_size: Maximum number of deployments requested per API call
+            label_selector: Only return objects matching this label selector (e.g. 'app=web')
+            field_selector: Only return objects matching this field selector (e.g. 'status.phase=Running')
+            fast: Decode the raw JSON response instead of building client models
+            
+        Yields:
+            Deployment summary dictionaries as each page arrives
+        """
+        cached = self._list_cached('deployments', label_selector, field_selector)
+        if cached is not None:
+            for deployment in cached:
+                yield self._deployment_summary(deployment)
+            return
+        
+        if fast:
+            iter_pages, summary = fastpath.iter_raw_pages, fastpath.deployment_summary
+        else:
+            iter_pages, summary = self._iter_pages, self._deployment_summary
+        
+        listed = False
         try:
-            deployments = self.apps_v1.list_namespaced_deployment(namespace=self.namespace)
-            result = []
-            for deployment in deployments.items:
-                result.append({
-                    'name': deployment.metadata.name,
-                    'replicas': deployment.spec.replicas,
-                    'ready_replicas': deployment.status.ready_replicas or 0,
-                    'available_replicas': deployment.status.available_replicas or 0,
-                    'created': deployment.metadata.creation_timestamp
-                })
-            return result
+            for page in iter_pages(self.apps_v1.list_namespaced_deployment, page_size,
+                                   namespace=self.namespace,
+                                   **self._selector_kwargs(label_selector, field_selector)):
+                for deployment in page:
+                    listed = True
+                    yield summary(deployment)
+        except ApiException as e:
+            if listed:
+                # Ending quietly would make the objects listed so far look like all of them
+                raise
+            print(f"❌ Error listing deployments: {e}")
+
+    def list_deployments(self, page_size: int = DEFAULT_PAGE_SIZE, label_selector: Optional[str] = None,
+                         field_selector: Optional[str] = None, fast: bool = False) -> List[Dict[str, Any]]:
+        """List all deployments in the namespace, optionally filtered server-side by selectors"""
+        try:
+            return list(self.iter_deployments(page_size=page_size, label_selector=label_selector,
+                                              field_selector=field_selector, fast=fast))
         except ApiException as e:
+            # A page after the first failed; a partial list would look complete
             print(f"❌ Error listing deployments: {e}")
             return []
 
+    def _deployment_summary(self, deployment) -> Dict[str, Any]:
+        """Build the summary dictionary for a deployment"""
+        return {
+            'name': deployment.metadata.name,
+            'replicas': deployment.spec.replicas,
+            'ready_replicas': deployment.status.ready_replicas or 0,
+            'available_replicas': deployment.status.available_replicas or 0,
+            'created': deployment.metadata.creation_timestamp
+        }
+
     # ======================
     # POD OPERATIONS
     # ======================
@@ -903,25 +1516,66 @@ class K8sClient:
             print(f"❌ Error deleting pod '{name}': {e}")
             return False
 
-    def list_pods(self) -> List[Dict[str, Any]]:
-        """List all pods in the namespace"""
+    def iter_pods(self, page_size: int = DEFAULT_PAGE_SIZE, label_selector: Optional[str] = None,
+                  field_selector: Optional[str] = None, fast: bool = False) -> Iterator[Dict[str, Any]]:
+        """Iterate over pods in the namespace, fetching them page by page
+        
+        Args:
+            page_size: Maximum number of pods requested per API call
+            label_selector: Only return objects matching this label selector (e.g. 'app=web')
+            field_selector: Only return objects matching this field selector (e.g. 'status.phase=Running')
+            fast: Decode the raw JSON response instead of building client models
+            
+        Yields:
+            Pod summary dictionaries as each page arrives
+        """
+        cached = self._list_cached('pods', label_selector, field_selector)
+        if cached is not None:
+            for pod in cached:
+                yield self._pod_summary(pod)
+            return
+        
+        if fast:
+            iter_pages, summary = fastpath.iter_raw_pages, fastpath.pod_summary
+        else:
+            iter_pages, summary = self._iter_pages, self._pod_summary
+        
+        listed = False
         try:
-            pods = self.core_v1.list_namespaced_pod(namespace=self.namespace)
-            result = []
-            for pod in pods.items:
-                result.append({
-                    'name': pod.metadata.name,
-                    'phase': pod.status.phase,
-                    'ready': self._is_pod_ready(pod),
-                    'restarts': self._get_pod_restarts(pod),
-                    'age': pod.metadata.creation_timestamp,
-                    'node': pod.spec.node_name
-                })
-            return result
+            for page in iter_pages(self.core_v1.list_namespaced_pod, page_size,
+                                   namespace=self.namespace,
+                                   **self._selector_kwargs(label_selector, field_selector)):
+                for pod in page:
+                    listed = True
+                    yield summary(pod)
+        except ApiException as e:
+            if listed:
+                # Ending quietly would make the objects listed so far look like all of them
+                raise
+            print(f"❌ Error listing pods: {e}")
+
+    def list_pods(self, page_size: int = DEFAULT_PAGE_SIZE, label_selector: Optional[str] = None,
+                  field_selector: Optional[str] = None, fast: bool = False) -> List[Dict[str, Any]]:
+        """List all pods in the namespace, optionally filtered server-side by selectors"""
+        try:
+            return list(self.iter_pods(page_size=page_size, label_selector=label_selector,
+                                       field_selector=field_selector, fast=fast))
         except ApiException as e:
+            # A page after the first failed; a partial list would look complete
             print(f"❌ Error listing pods: {e}")
             return []
 
+    def _pod_summary(self, pod) -> Dict[str, Any]:
+        """Build the summary dictionary for a pod"""
+        return {
+            'name': pod.metadata.name,
+            'phase': pod.status.phase,
+            'ready': self._is_pod_ready(pod),
+            'restarts': self._get_pod_restarts(pod),
+            'age': pod.metadata.creation_timestamp,
+            'node': pod.spec.node_name
+        }
+
     def _is_pod_ready(self, pod) -> bool:
         """Check if a pod is ready"""
         if pod.status.conditions:
@@ -957,6 +1611,307 @@ class K8sClient:
             print(f"❌ Error fetching logs from pod '{pod_name}': {e}")
             return None
 
+    def stream_logs(self, pod_name: str, container_name: Optional[str] = None,
+                    follow: bool = False, since_seconds: Optional[int] = None,
+                    tail_lines: Optional[int] = None, limit_bytes: Optional[int] = None,
+                    previous: bool = False, timestamps: bool = False,
+                    max_reconnects: int = 5) -> Iterator[str]:
+        """Stream a pod's log line by line without buffering the whole log
+        
+        When following, a dropped connection is re-established from the last
+        line seen; lines replayed by the new connection are skipped.
+        
+        Args:
+            pod_name: Pod name
+            container_name: Container name, required for multi-container pods
+            follow: Keep the stream open and yield new lines as they are written
+            since_seconds: Only return lines newer than this many seconds
+            tail_lines: Number of lines to read from the end of the log
+            limit_bytes: Maximum number of bytes to read
+            previous: Read the log of the previous, terminated container
+            timestamps: Prefix each line with its timestamp
+            max_reconnects: Consecutive reconnect attempts before giving up
+            
+        Yields:
+            Log lines without the trailing newline
+        """
+        kwargs = {'name': pod_name, 'namespace': self.namespace, 'follow': follow}
+        if container_name:
+            kwargs['container'] = container_name
+        if since_seconds:
+            kwargs['since_seconds'] = since_seconds
+        if tail_lines is not None:
+            kwargs['tail_lines'] = tail_lines
+        if previous:
+            kwargs['previous'] = True
+        # Following needs timestamps to know where to resume after a reconnect
+        if timestamps or follow:
+            kwargs['timestamps'] = True
+        
+        last_key = None
+        last_seen = None
+        # Lines yielded with the latest timestamp, and those still expected to be
+        # replayed by the current connection; distinct lines may share a timestamp
+        lines_at_last_key = Counter()
+        replayed = Counter()
+        # Set while a new connection may still replay lines yielded before it
+        resumed = False
+        bytes_left = limit_bytes
+        reconnects = 0
+        
+        while True:
+            if bytes_left is not None:
+                kwargs['limit_bytes'] = bytes_left
+            try:
+                for line in self._iter_log_stream(**kwargs):
+                    if bytes_left is not None:
+                        bytes_left -= len(line.encode()) + 1
+                    if follow:
+                        seen = log_timestamp(line)
+                        key = log_timestamp_key(line) if seen else None
+                        if resumed and key is not None:
+                            if key < last_key:
+                                # Already yielded before the reconnect
+                                continue
+                            if key == last_key and replayed[line] > 0:
+                                replayed[line] -= 1
+                                continue
+                        # Out-of-order and untimestamped lines are passed through
+                        # without moving the resume point back
+                        if key is not None and (last_key is None or key > last_key):
+                            lines_at_last_key.clear()
+                            replayed.clear()
+                            resumed = False
+                            last_key, last_seen = key, seen
+                        if key is not None and key == last_key:
+                            lines_at_last_key[line] += 1
+                        reconnects = 0
+                        if not timestamps:
+                            line = line.split(' ', 1)[1] if ' ' in line else ''
+                    yield line
+                
+                if not follow or not self._is_pod_running(pod_name):
+                    return
+            except ApiException as e:
+                print(f"❌ Error streaming logs from pod '{pod_name}': {e}")
+                return
+            except Exception as e:
+                # Connection dropped mid-stream
+                if not follow:
+                    print(f"❌ Log stream from pod '{pod_name}' was interrupted: {e}")
+                    return
+            
+            if bytes_left is not None and bytes_left <= 0:
+                return
+            reconnects += 1
+            if reconnects > max_reconnects:
+                print(f"❌ Giving up on logs from pod '{pod_name}' after {max_reconnects} reconnects")
+                return
+            time.sleep(min(2 ** (reconnects - 1), 30))
+            replayed = Counter(lines_at_last_key)
+            resumed = last_key is not None
+            
+            if last_seen is not None:
+                # Resume from the last line seen instead of replaying the tail
+                kwargs.pop('tail_lines', None)
+                elapsed = datetime.now(timezone.utc) - last_seen
+                kwargs['since_seconds'] = max(1, int(elapsed.total_seconds()) + 1)
+
+    def _iter_log_chunks(self, **kwargs) -> Iterator[bytes]:
+        """Read a log response as raw chunks of at most LOG_CHUNK_SIZE bytes"""
+        response = self.core_v1.read_namespaced_pod_log(_preload_content=False, **kwargs)
+        try:
+            yield from response.stream(LOG_CHUNK_SIZE)
+        finally:
+            response.release_conn()
+
+    def _iter_log_stream(self, **kwargs) -> Iterator[str]:
+        """Read a log response chunk by chunk, yielding complete lines"""
+        pending = b''
+        for chunk in self._iter_log_chunks(**kwargs):
+            pending += chunk
+            *lines, pending = pending.split(b'\n')
+            for line in lines:
+                yield line.decode('utf-8', errors='replace')
+        if pending:
+            yield pending.decode('utf-8', errors='replace')
+
+    def export_logs(self, output_dir: str, label_selector: Optional[str] = None,
+                    compression: Optional[str] = None, max_workers: int = 8) -> Dict[str, Any]:
+        """Export the log of every container of every pod in the namespace to files
+        
+        Each log is streamed to <output_dir>/<pod>/<container>.log[.gz|.zst]
+        through a .part file that is renamed once the download completes. Files
+        that already exist are complete and are skipped, so an interrupted export
+        can be resumed by running it again.
+        
+        Args:
+            output_dir: Directory to write the logs and manifest.json to
+            label_selector: Only export pods matching this label selector
+            compression: None, 'gzip' or 'zstd'
+            max_workers: Maximum number of logs downloaded at the same time
+            
+        Returns:
+            The manifest, also written to manifest.json, listing each file with
+            its byte counts and fetch latency. Its 'status' is 'complete' when
+            every log was exported and 'incomplete' when any of them failed.
+            
+        Raises:
+            ValueError: If the compression is not supported
+            ApiException: If the pods cannot be listed; nothing is written then
+        """
+        if compression not in COMPRESSION_SUFFIXES:
+            raise ValueError(f"Unsupported compression: {compression}")
+        suffix = COMPRESSION_SUFFIXES[compression]
+        
+        containers = [
+            (pod['metadata']['name'], container['name'])
+            for page in fastpath.iter_raw_pages(self.core_v1.list_namespaced_pod, DEFAULT_PAGE_SIZE,
+                                                namespace=self.namespace,
+                                                **self._selector_kwargs(label_selector))
+            for pod in page
+            for container in (pod.get('spec') or {}).get('containers') or []
+        ]
+        
+        os.makedirs(output_dir, exist_ok=True)
+        manifest_path = os.path.join(output_dir, 'manifest.json')
+        previous_entries = {}
+        if os.path.exists(manifest_path):
+            with open(manifest_path) as f:
+                previous_entries = {entry['file']: entry for entry in json.load(f).get('files', [])}
+        
+        entries = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = []
+            for pod_name, container_name in containers:
+                relative_path = os.path.join(pod_name, f"{container_name}.log{suffix}")
+                if os.path.exists(os.path.join(output_dir, relative_path)):
+                    entries.append(previous_entries.get(relative_path) or {
+                        'pod': pod_name, 'container': container_name,
+                        'file': relative_path, 'status': 'complete'
+                    })
+                    continue
+                futures.append(executor.submit(self._export_container_log, output_dir,
+                                               relative_path, pod_name, container_name, compression))
+            entries.extend(future.result() for future in futures)
+        
+        manifest = {
+            'namespace': self.namespace,
+            'label_selector': label_selector,
+            'compression': compression,
+            'exported_at': datetime.now(timezone.utc).isoformat(),
+            'status': 'incomplete' if any(entry['status'] == 'failed' for entry in entries) else 'complete',
+            'files': sorted(entries, key=lambda entry: entry['file'])
+        }
+        with open(manifest_path + '.part', 'w') as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(manifest_path + '.part', manifest_path)
+        
+        return manifest
+
+    def _export_container_log(self, output_dir: str, relative_path: str, pod_name: str,
+                              container_name: str, compression: Optional[str]) -> Dict[str, Any]:
+        """Stream one container's log to a file and describe the result for the manifest"""
+        path = os.path.join(output_dir, relative_path)
+        part_path = path + '.part'
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        entry = {'pod': pod_name, 'container': container_name, 'file': relative_path}
+        
+        start = time.time()
+        first_byte = None
+        size = 0
+        try:
+            with open_compressed(part_path, compression) as f:
+                for chunk in self._iter_log_chunks(name=pod_name, namespace=self.namespace,
+                                                   container=container_name):
+                    if first_byte is None:
+                        first_byte = time.time() - start
+                    f.write(chunk)
+                    size += len(chunk)
+            os.replace(part_path, path)
+        except Exception as e:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+            print(f"❌ Error exporting logs from pod '{pod_name}' container '{container_name}': {e}")
+            entry.update(status='failed', error=str(e))
+            return entry
+        
+        entry.update(
+            status='complete',
+            bytes=size,
+            stored_bytes=os.path.getsize(path),
+            first_byte_seconds=round(first_byte if first_byte is not None else time.time() - start, 3),
+            duration_seconds=round(time.time() - start, 3)
+        )
+        return entry
+
+    def _is_pod_running(self, pod_name: str) -> bool:
+        """Check if a pod is still running, i.e. its log may still grow"""
+        try:
+            pod = self.core_v1.read_namespaced_pod(name=pod_name, namespace=self.namespace)
+            return pod.status.phase == 'Running'
+        except ApiException:
+            return False
+
+    def iter_logs_by_selector(self, label_selector: str, container_name: Optional[str] = None,
+                              tail_lines: Optional[int] = None, timestamps: bool = False,
+                              max_workers: int = 8) -> Iterator[Tuple[str, str]]:
+        """Fetch logs from every pod matching a label selector concurrently
+        
+        Args:
+            label_selector: Label selector resolving the pods (e.g. 'app=web')
+            container_name: Container to read in each pod
+            tail_lines: Number of lines to read from the end of each log
+            timestamps: Prefix lines with timestamps and merge all pods into one timeline
+            max_workers: Maximum number of logs fetched at the same time
+            
+        Yields:
+            (pod name, line) tuples. Without timestamps each pod's lines are yielded
+            as soon as its log arrives; with timestamps lines are ordered by time
+            across all pods.
+        """
+        pod_names = [pod['name'] for pod in self.list_pods(label_selector=label_selector, fast=True)]
+        if not pod_names:
+            return
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pod_names))) as executor:
+            futures = {
+                executor.submit(self._read_log_lines, pod_name, container_name,
+                                tail_lines, timestamps): pod_name
+                for pod_name in pod_names
+            }
+            if not timestamps:
+                for future in as_completed(futures):
+                    for line in future.result():
+                        yield futures[future], line
+                return
+            
+            streams = [
+                [(log_timestamp_key(line), futures[future], line) for line in future.result()]
+                for future in futures
+            ]
+        
+        # k-way merge of the per-pod logs, each already in time order
+        for _, pod_name, line in heapq.merge(*streams):
+            yield pod_name, line
+
+    def _read_log_lines(self, pod_name: str, container_name: Optional[str] = None,
+                        tail_lines: Optional[int] = None, timestamps: bool = False) -> List[str]:
+        """Read a pod's log as a list of lines; an unreadable log counts as empty"""
+        kwargs = {'name': pod_name, 'namespace': self.namespace}
+        if container_name:
+            kwargs['container'] = container_name
+        if tail_lines:
+            kwargs['tail_lines'] = tail_lines
+        if timestamps:
+            kwargs['timestamps'] = True
+        
+        try:
+            return self.core_v1.read_namespaced_pod_log(**kwargs).splitlines()
+        except ApiException as e:
+            print(f"❌ Error fetching logs from pod '{pod_name}': {e}")
+            return []
+
     # ======================
     # SERVICE OPERATIONS
     # ======================
@@ -1003,65 +1958,122 @@ class K8sClient:
             print(f"❌ Error deleting service '{name}': {e}")
             return False
 
-    def list_services(self) -> List[Dict[str, Any]]:
-        """List all services in the namespace"""
+    def iter_services(self, page_size: int = DEFAULT_PAGE_SIZE, label_selector: Optional[str] = None,
+                      field_selector: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Iterate over services in the namespace, fetching them page by page"""
+        cached = self._list_cached('services', label_selector, field_selector)
+        if cached is not None:
+            for service in cached:
+                yield self._service_summary(service)
+            return
+        
+        listed = False
         try:
-            services = self.core_v1.list_namespaced_service(namespace=self.namespace)
-            result = []
-            for service in services.items:
-                result.append({
-                    'name': service.metadata.name,
-                    'type': service.spec.type,
-                    'cluster_ip': service.spec.cluster_ip,
-                    'external_ip': service.status.load_balancer.ingress[0].ip if (
-                        service.status.load_balancer and 
-                        service.status.load_balancer.ingress
-                    ) else None,
-                    'ports': [{'port': port.port, 'target_port': port.target_port} 
-                             for port in service.spec.ports],
-                    'created': service.metadata.creation_timestamp
-                })
-            return result
+            for page in self._iter_pages(self.core_v1.list_namespaced_service, page_size,
+                                         namespace=self.namespace,
+                                         **self._selector_kwargs(label_selector, field_selector)):
+                for service in page:
+                    listed = True
+                    yield self._service_summary(service)
+        except ApiException as e:
+            if listed:
+                # Ending quietly would make the objects listed so far look like all of them
+                raise
+            print(f"❌ Error listing services: {e}")
+
+    def list_services(self, page_size: int = DEFAULT_PAGE_SIZE, label_selector: Optional[str] = None,
+                      field_selector: Optional[str] = None) -> List[Dict[str, Any]]:
+        """List all services in the namespace, optionally filtered server-side by selectors"""
+        try:
+            return list(self.iter_services(page_size=page_size, label_selector=label_selector,
+                                           field_selector=field_selector))
         except ApiException as e:
+            # A page after the first failed; a partial list would look complete
             print(f"❌ Error listing services: {e}")
             return []
 
+    def _service_summary(self, service) -> Dict[str, Any]:
+        """Build the summary dictionary for a service"""
+        return {
+            'name': service.metadata.name,
+            'type': service.spec.type,
+            'cluster_ip': service.spec.cluster_ip,
+            'external_ip': service.status.load_balancer.ingress[0].ip if (
+                service.status.load_balancer and 
+                service.status.load_balancer.ingress
+            ) else None,
+            'ports': [{'port': port.port, 'target_port': port.target_port} 
+                      for port in service.spec.ports],
+            'created': service.metadata.creation_timestamp
+        }
+
     # ======================
     # EVENTS AND MONITORING
     # ======================
-    def get_events(self, resource_name: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Get events from the namespace, optionally filtered by resource name"""
+    def get_events(self, resource_name: Optional[str] = None,
+                   label_selector: Optional[str] = None,
+                   field_selector: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get events from the namespace, optionally filtered by resource name
+        
+        Filtering by resource name is done by the API server through an
+        involvedObject.name field selector, combined with any field_selector given.
+        """
+        if resource_name:
+            name_selector = f"involvedObject.name={resource_name}"
+            field_selector = f"{name_selector},{field_selector}" if field_selector else name_selector
+        
         try:
-            events = self.core_v1.list_namespaced_event(namespace=self.namespace)
             result = []
             
-            for event in events.items:
-                if resource_name and event.involved_object.name != resource_name:
-                    continue
-                    
-                result.append({
-                    'name': event.metadata.name,
-                    'type': event.type,
-                    'reason': event.reason,
-                    'message': event.message,
-                    'resource': f"{event.involved_object.kind}/{event.involved_object.name}",
-                    'first_timestamp': event.first_timestamp,
-                    'last_timestamp': event.last_timestamp,
-                    'count': event.count
-                })
+            for page in self._iter_pages(self.core_v1.list_namespaced_event, DEFAULT_PAGE_SIZE,
+                                         namespace=self.namespace,
+                                         **self._selector_kwargs(label_selector, field_selector)):
+                for event in page:
+                    result.append({
+                        'name': event.metadata.name,
+                        'type': event.type,
+                        'reason': event.reason,
+                        'message': event.message,
+                        'resource': f"{event.involved_object.kind}/{event.involved_object.name}",
+                        'first_timestamp': event.first_timestamp,
+                        'last_timestamp': event.last_timestamp,
+                        'count': event.count
+                    })
             
             return sorted(result, key=lambda x: x['last_timestamp'] or x['first_timestamp'], reverse=True)
         except ApiException as e:
             print(f"❌ Error fetching events: {e}")
             return []
 
+    def get_recent_events(self, limit: int = 5) -> List[Dict[str, Any]]:
+        """Get the most recent events in the namespace
+        
+        Events are streamed page by page as raw JSON and only the newest `limit`
+        are kept, so memory use does not grow with the number of events.
+        """
+        def event_time(event):
+            return event['last_timestamp'] or event['first_timestamp'] or datetime.min.replace(tzinfo=timezone.utc)
+        
+        try:
+            events = (
+                fastpath.event_summary(event)
+                for page in fastpath.iter_raw_pages(self.core_v1.list_namespaced_event,
+                                                    DEFAULT_PAGE_SIZE, namespace=self.namespace)
+                for event in page
+            )
+            return heapq.nlargest(limit, events, key=event_time)
+        except ApiException as e:
+            print(f"❌ Error fetching events: {e}")
+            return []
+
     # ======================
     # RESOURCE DESCRIPTION
     # ======================
     def describe_pod(self, name: str) -> Optional[Dict[str, Any]]:
         """Get detailed information about a pod"""
         try:
-            pod = self.core_v1.read_namespaced_pod(name=name, namespace=self.namespace)
+            pod = self._read_cached('pods', name) or \
+                self.core_v1.read_namespaced_pod(name=name, namespace=self.namespace)
             
             return {
                 'metadata': {
@@ -1113,7 +2125,8 @@ class K8sClient:
     def describe_deployment(self, name: str) -> Optional[Dict[str, Any]]:
         """Get detailed information about a deployment"""
         try:
-            deployment = self.apps_v1.read_namespaced_deployment(name=name, namespace=self.namespace)
+            deployment = self._read_cached('deployments', name) or \
+                self.apps_v1.read_namespaced_deployment(name=name, namespace=self.namespace)
             
             return {
                 'metadata': {
@@ -1165,7 +2178,8 @@ class K8sClient:
     def describe_service(self, name: str) -> Optional[Dict[str, Any]]:
         """Get detailed information about a service"""
         try:
-            service = self.core_v1.read_namespaced_service(name=name, namespace=self.namespace)
+            service = self._read_cached('services', name) or \
+                self.core_v1.read_namespaced_service(name=name, namespace=self.namespace)
             
             return {
                 'metadata': {
@@ -1284,28 +2298,47 @@ class K8sClient:
             print(f"❌ Error deleting secret: {e}")
             return False
     
-    def list_secrets(self, namespace: str = None) -> List[Dict]:
-        """List all secrets in a namespace"""
+    def iter_secrets(self, namespace: str = None,
+                     page_size: int = DEFAULT_PAGE_SIZE, label_selector: Optional[str] = None,
+                     field_selector: Optional[str] = None) -> Iterator[Dict]:
+        """Iterate over secrets in a namespace, fetching them page by page"""
+        listed = False
         try:
             ns = namespace or self.namespace
-            result = self.core_v1.list_namespaced_secret(namespace=ns)
-            
-            secrets = []
-            for secret in result.items:
-                secrets.append({
-                    'name': secret.metadata.name,
-                    'namespace': secret.metadata.namespace,
-                    'type': secret.type,
-                    'data_keys': list(secret.data.keys()) if secret.data else [],
-                    'created_at': secret.metadata.creation_timestamp
-                })
-            
-            return secrets
-            
+            for page in self._iter_pages(self.core_v1.list_namespaced_secret, page_size,
+                                         namespace=ns,
+                                         **self._selector_kwargs(label_selector, field_selector)):
+                for secret in page:
+                    listed = True
+                    yield self._secret_summary(secret)
+        except ApiException as e:
+            if listed:
+                # Ending quietly would make the objects listed so far look like all of them
+                raise
+            print(f"❌ Error listing secrets: {e}")
+
+    def list_secrets(self, namespace: str = None,
+                     page_size: int = DEFAULT_PAGE_SIZE, label_selector: Optional[str] = None,
+                     field_selector: Optional[str] = None) -> List[Dict]:
+        """List all secrets in a namespace, optionally filtered server-side by selectors"""
+        try:
+            return list(self.iter_secrets(namespace, page_size=page_size, label_selector=label_selector,
+                                          field_selector=field_selector))
         except ApiException as e:
+            # A page after the first failed; a partial list would look complete
             print(f"❌ Error listing secrets: {e}")
             return []
 
+    def _secret_summary(self, secret) -> Dict:
+        """Build the summary dictionary for a secret"""
+        return {
+            'name': secret.metadata.name,
+            'namespace': secret.metadata.namespace,
+            'type': secret.type,
+            'data_keys': list(secret.data.keys()) if secret.data else [],
+            'created_at': secret.metadata.creation_timestamp
+        }
+
     # ======================
     # PVC OPERATIONS
     # ======================
@@ -1387,31 +2420,50 @@ class K8sClient:
             print(f"❌ Error deleting PVC: {e}")
             return False
     
-    def list_pvcs(self, namespace: str = None) -> List[Dict]:
-        """List all PVCs in a namespace"""
+    def iter_pvcs(self, namespace: str = None,
+                  page_size: int = DEFAULT_PAGE_SIZE, label_selector: Optional[str] = None,
+                  field_selector: Optional[str] = None) -> Iterator[Dict]:
+        """Iterate over PVCs in a namespace, fetching them page by page"""
+        listed = False
         try:
             ns = namespace or self.namespace
-            result = self.core_v1.list_namespaced_persistent_volume_claim(namespace=ns)
-            
-            pvcs = []
-            for pvc in result.items:
-                pvcs.append({
-                    'name': pvc.metadata.name,
-                    'namespace': pvc.metadata.namespace,
-                    'status': pvc.status.phase,
-                    'volume_name': pvc.spec.volume_name,
-                    'access_modes': pvc.spec.access_modes,
-                    'storage_class': pvc.spec.storage_class_name,
-                    'size': pvc.spec.resources.requests.get('storage', 'Unknown'),
-                    'created_at': pvc.metadata.creation_timestamp
-                })
-            
-            return pvcs
-            
+            for page in self._iter_pages(self.core_v1.list_namespaced_persistent_volume_claim, page_size,
+                                         namespace=ns,
+                                         **self._selector_kwargs(label_selector, field_selector)):
+                for pvc in page:
+                    listed = True
+                    yield self._pvc_summary(pvc)
+        except ApiException as e:
+            if listed:
+                # Ending quietly would make the objects listed so far look like all of them
+                raise
+            print(f"❌ Error listing PVCs: {e}")
+
+    def list_pvcs(self, namespace: str = None,
+                  page_size: int = DEFAULT_PAGE_SIZE, label_selector: Optional[str] = None,
+                  field_selector: Optional[str] = None) -> List[Dict]:
+        """List all PVCs in a namespace, optionally filtered server-side by selectors"""
+        try:
+            return list(self.iter_pvcs(namespace, page_size=page_size, label_selector=label_selector,
+                                       field_selector=field_selector))
         except ApiException as e:
+            # A page after the first failed; a partial list would look complete
             print(f"❌ Error listing PVCs: {e}")
             return []
 
+    def _pvc_summary(self, pvc) -> Dict:
+        """Build the summary dictionary for a PVC"""
+        return {
+            'name': pvc.metadata.name,
+            'namespace': pvc.metadata.namespace,
+            'status': pvc.status.phase,
+            'volume_name': pvc.spec.volume_name,
+            'access_modes': pvc.spec.access_modes,
+            'storage_class': pvc.spec.storage_class_name,
+            'size': pvc.spec.resources.requests.get('storage', 'Unknown'),
+            'created_at': pvc.metadata.creation_timestamp
+        }
+
     # ======================
     # SERVICE URL OPERATIONS
     # ======================
@@ -1427,7 +2479,8 @@ class K8sClient:
         """
         try:
             ns = namespace or self.namespace
-            service = self.core_v1.read_namespaced_service(name=name, namespace=ns)
+            service = self._read_cached('services', name, ns) or \
+                self.core_v1.read_namespaced_service(name=name, namespace=ns)
             
             service_type = service.spec.type
             ports = []
@@ -1494,44 +2547,677 @@ class K8sClient:
             print(f"❌ Error getting service URL: {e}")
             return None
 
+    # ======================
+    # BULK DELETE
+    # ======================
+    def delete_by_selector(self, kinds: List[str], label_selector: str, wait: bool = False,
+                           timeout: int = 300, max_workers: int = 16) -> Dict[str, Dict[str, Any]]:
+        """Delete every object of the given kinds that matches a label selector
+        
+        Each kind is removed with a single deletecollection request. Kinds or API
+        servers without deletecollection fall back to deleting the matching objects
+        one by one on a thread pool.
+        
+        Args:
+            kinds: Kinds to delete, from DELETABLE_KINDS
+            label_selector: Label selector, e.g. 'env=preview-123'. Pass an empty
+                string to explicitly match every object of the kinds
+            wait: Wait until the deleted objects are gone (finalizers have run)
+            timeout: Maximum number of seconds to wait when wait is set
+            max_workers: Maximum number of concurrent deletes in the fallback path
+            
+        Returns:
+            Dictionary mapping each kind to its matched, deleted and failed counts,
+            plus the number still present when wait is set
+        """
+        if label_selector is None:
+            raise ValueError("label_selector is required; pass '' to match every object")
+        unknown = [kind for kind in kinds if kind not in DELETABLE_KINDS]
+        if unknown:
+            raise ValueError(f"Unsupported kind(s) for deletion: {', '.join(unknown)}")
+        
+        results = {}
+        deleted_names = {}
+        for kind in kinds:
+            api_attr, resource = DELETABLE_KINDS[kind]
+            api = getattr(self, api_attr)
+            result = {'matched': 0, 'deleted': 0, 'failed': 0}
+            results[kind] = result
+            
+            try:
+                names = self._list_names(kind, label_selector)
+            except ApiException as e:
+                print(f"❌ Error listing {kind} matching '{label_selector}': {self._api_error_message(e)}")
+                continue
+            result['matched'] = len(names)
+            if not names:
+                continue
+            
+            failed = []
+            if hasattr(api, f"delete_collection_namespaced_{resource}"):
+                try:
+                    self._delete_collection(api, resource, label_selector)
+                except ApiException as e:
+                    if e.status not in (404, 405):
+                        print(f"❌ Error deleting {kind} matching '{label_selector}': {self._api_error_message(e)}")
+                        result['failed'] = len(names)
+                        continue
+                    # deletecollection not served for this kind; delete the objects individually
+                    failed = self._delete_each(api, resource, names, max_workers)
+            else:
+                failed = self._delete_each(api, resource, names, max_workers)
+            result['deleted'] = len(names) - len(failed)
+            result['failed'] = len(failed)
+            names = [name for name in names if name not in failed]
+            
+            deleted_names[kind] = names
+            if failed:
+                print(f"⚠️  Deleted {result['deleted']} of {result['matched']} {kind} matching '{label_selector}'")
+            else:
+                print(f"✅ Deleted {result['deleted']} {kind} matching '{label_selector}'")
+        
+        if wait and deleted_names:
+            deadline = time.time() + timeout
+            with ThreadPoolExecutor(max_workers=len(deleted_names)) as executor:
+                futures = {
+                    kind: executor.submit(self._wait_for_deletion, kind, names, label_selector, deadline)
+                    for kind, names in deleted_names.items()
+                }
+                for kind, future in futures.items():
+                    remaining = future.result()
+                    results[kind]['remaining'] = len(remaining)
+                    if remaining:
+                        print(f"❌ Timeout waiting for {len(remaining)} {kind} to be deleted: {', '.join(sorted(remaining))}")
+                    else:
+                        print(f"✅ All deleted {kind} are gone")
+        
+        return results
+
+    def _list_func(self, kind: str) -> Callable:
+        """Get the list_namespaced_* method for a kind in DELETABLE_KINDS"""
+        api_attr, resource = DELETABLE_KINDS[kind]
+        return getattr(getattr(self, api_attr), f"list_namespaced_{resource}")
+
+    def _list_names(self, kind: str, label_selector: str) -> List[str]:
+        """List the names of the objects of a kind matching a label selector"""
+        return [
+            item['metadata']['name']
+            for page in fastpath.iter_raw_pages(self._list_func(kind), DEFAULT_PAGE_SIZE,
+                                                namespace=self.namespace,
+                                                **self._selector_kwargs(label_selector))
+            for item in page
+        ]
+
+    def _delete_collection(self, api: Any, resource: str, label_selector: str) -> None:
+        """Delete all objects of a resource matching a label selector in one request"""
+        delete_collection = getattr(api, f"delete_collection_namespaced_{resource}")
+        delete_collection(namespace=self.namespace, _preload_content=False,
+                          **self._selector_kwargs(label_selector))
+
+    def _delete_each(self, api: Any, resource: str, names: List[str], max_workers: int) -> List[str]:
+        """Delete objects one by one on a thread pool, returning the names that failed"""
+        delete = getattr(api, f"delete_namespaced_{resource}")
+        
+        def delete_one(name):
+            try:
+                delete(name=name, namespace=self.namespace, _preload_content=False)
+            except ApiException as e:
+                if e.status != 404:
+                    print(f"❌ Error deleting {resource} '{name}': {self._api_error_message(e)}")
+                    return name
+            return None
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return [name for name in executor.map(delete_one, names) if name is not None]
+
+    def _wait_for_deletion(self, kind: str, names: List[str], label_selector: str,
+                           deadline: float) -> List[str]:
+        """Watch a kind until the named objects are gone, returning those still present
+        
+        Falls back to polling with backoff when the watch cannot be established.
+        """
+        list_func = self._list_func(kind)
+        selector_kwargs = self._selector_kwargs(label_selector)
+        remaining = set(names)
+        use_watch = True
+        interval = 0.5
+        
+        while time.time() < deadline:
+            # List first to drop objects that are already gone and to get a version to watch from
+            try:
+                response = list_func(namespace=self.namespace, _preload_content=False, **selector_kwargs)
+            except ApiException:
+                use_watch = False
+                response = None
+            if response is not None:
+                body = fastpath.loads(response.data)
+                remaining &= {item['metadata']['name'] for item in body.get('items') or []}
+                if not remaining:
+                    break
+            
+            if not use_watch:
+                time.sleep(min(interval, max(0, deadline - time.time())))
+                interval = min(interval * 2, 5)
+                continue
+            
+            w = watch.Watch()
+            try:
+                for event in w.stream(
+                    list_func,
+                    namespace=self.namespace,
+                    resource_version=(body.get('metadata') or {}).get('resourceVersion'),
+                    timeout_seconds=max(1, int(deadline - time.time())),
+                    **selector_kwargs
+                ):
+                    if event['type'] == 'DELETED':
+                        remaining.discard(event['object'].metadata.name)
+                        if not remaining:
+                            return []
+                    if time.time() >= deadline:
+                        break
+            except ApiException as e:
+                if e.status != 410:
+                    use_watch = False
+            except Exception:
+                # Watch not available (RBAC, proxies, ...); poll instead
+                use_watch = False
+            finally:
+                w.stop()
+        
+        return sorted(remaining)
+
+    # ======================
+    # MANIFESTS
+    # ======================
+    def apply_manifests(self, path: str, max_workers: int = 8,
+                        server_side: bool = False, force: bool = False) -> Dict[str, Any]:
+        """Create every object in a YAML file or a directory of YAML files
+        
+        Objects are grouped into dependency tiers (namespaces, then config and
+        storage, then workloads, then services). The objects of a tier are
+        submitted concurrently, and a tier finishes before the next one starts.
+        Objects that already exist are reported as such and left unchanged,
+        unless server_side is set.
+        
+        Args:
+            path: Manifest file or directory
+            max_workers: Maximum number of objects submitted at the same time
+            server_side: Server-side apply the kinds in APPLY_KINDS, skipping
+                objects whose live spec hash already matches (see apply_object)
+            force: With server_side, take ownership of fields other managers own
+            
+        Returns:
+            Summary with per-object results, counts per status, wall time and throughput
+        """
+        tiers: Dict[int, List[Dict[str, Any]]] = {}
+        for manifest in load_manifests(path):
+            tiers.setdefault(manifest_tier(manifest), []).append(manifest)
+        
+        start = time.time()
+        live_hashes = {}
+        if server_side:
+            # One list per kind and namespace instead of a read per object
+            live_hashes = self._get_live_hashes(
+                manifest for tier in tiers.values() for manifest in tier
+            )
+        
+        def submit(manifest):
+            if server_side and manifest.get('kind') in APPLY_KINDS:
+                return self.apply_object(manifest, live_hashes=live_hashes.get(self._hash_key(manifest)),
+                                         force=force)
+            return self._create_from_manifest(manifest)
+        
+        results = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for tier in sorted(tiers):
+                results.extend(executor.map(submit, tiers[tier]))
+        elapsed = time.time() - start
+        
+        summary = {'total': len(results)}
+        for status in ('applied', 'unchanged', 'created', 'exists', 'failed'):
+            summary[status] = sum(1 for result in results if result['status'] == status)
+        summary.update(
+            results=results,
+            seconds=round(elapsed, 3),
+            objects_per_second=round(len(results) / elapsed, 1) if elapsed > 0 else None
+        )
+        return summary
+
+    def _create_from_manifest(self, manifest: Dict[str, Any]) -> Dict[str, Any]:
+        """Create one object from its manifest and describe the outcome"""
+        metadata = manifest.get('metadata') or {}
+        result = {
+            'kind': manifest.get('kind'),
+            'name': metadata.get('name'),
+            'namespace': metadata.get('namespace') or self.namespace
+        }
+        
+        start = time.time()
+        try:
+            k8s_utils.create_from_dict(self.api_client, manifest, namespace=self.namespace)
+            result['status'] = 'created'
+        except k8s_utils.FailToCreateError as e:
+            errors = [error for error in e.api_exceptions if error.status != 409]
+            if errors:
+                result.update(status='failed', error=self._api_error_message(errors[0]))
+            else:
+                result['status'] = 'exists'
+        except Exception as e:
+            result.update(status='failed', error=str(e))
+        result['seconds'] = round(time.time() - start, 3)
+        
+        return result
+
+    def apply_object(self, manifest: Dict[str, Any], live_hashes: Optional[Dict[str, str]] = None,
+                     force: bool = False) -> Dict[str, Any]:
+        """Server-side apply an object unless the live object was applied from the same manifest
+        
+        The manifest's content hash is stored in the SPEC_HASH_ANNOTATION
+        annotation. When the live object carries the same hash, no write is made.
+        Fields owned by another field manager (e.g. spec.replicas under an HPA)
+        make the apply fail with a conflict unless force is set.
+        
+        Args:
+            manifest: Object manifest of a kind in APPLY_KINDS
+            live_hashes: Spec hashes of live objects by name, from get_spec_hashes.
+                When omitted, the live object is read to find its hash.
+            force: Take ownership of fields managed by other field managers
+            
+        Returns:
+            Result dictionary whose status is 'applied', 'unchanged' or 'failed';
+            a failure caused by a field ownership conflict also has 'conflict': True
+        """
+        kind = manifest.get('kind')
+        if kind not in APPLY_KINDS:
+            raise ValueError(f"Unsupported kind for server-side apply: {kind}")
+        
+        api_attr, resource = APPLY_KINDS[kind]
+        api = getattr(self, api_attr)
+        name = manifest['metadata']['name']
+        namespace = manifest['metadata'].get('namespace') or self.namespace
+        result = {'kind': kind, 'name': name, 'namespace': namespace}
+        
+        manifest = with_spec_hash(manifest)
+        spec_hash = manifest['metadata']['annotations'][SPEC_HASH_ANNOTATION]
+        
+        start = time.time()
+        try:
+            if live_hashes is None:
+                live_hashes = {name: self._read_spec_hash(api, resource, name, namespace)}
+            if live_hashes.get(name) == spec_hash:
+                result['status'] = 'unchanged'
+            else:
+                getattr(api, f"patch_namespaced_{resource}")(
+                    name=name,
+                    namespace=namespace,
+                    body=manifest,
+                    field_manager=FIELD_MANAGER,
+                    force=force,
+                    _content_type='application/apply-patch+yaml'
+                )
+                result['status'] = 'applied'
+        except ApiException as e:
+            result.update(status='failed', error=self._api_error_message(e))
+            if e.status == 409:
+                result['conflict'] = True
+        result['seconds'] = round(time.time() - start, 3)
+        
+        return result
+
+    def get_spec_hashes(self, kind: str, namespace: Optional[str] = None) -> Dict[str, str]:
+        """Get the spec hashes of all live objects of a kind with one paginated list
+        
+        Returns:
+            Dictionary mapping object names to their spec hash, for objects that have one
+        """
+        if kind not in APPLY_KINDS:
+            raise ValueError(f"Unsupported kind for server-side apply: {kind}")
+        
+        api_attr, resource = APPLY_KINDS[kind]
+        list_func = getattr(getattr(self, api_attr), f"list_namespaced_{resource}")
+        hashes = {}
+        for page in fastpath.iter_raw_pages(list_func, DEFAULT_PAGE_SIZE,
+                                            namespace=namespace or self.namespace):
+            for obj in page:
+                metadata = obj.get('metadata') or {}
+                spec_hash = (metadata.get('annotations') or {}).get(SPEC_HASH_ANNOTATION)
+                if spec_hash:
+                    hashes[metadata['name']] = spec_hash
+        return hashes
+
+    def apply_deployment(self, name: str, image: str, replicas: int = 1, container_port: int = 80,
+                         env_vars: Optional[Dict[str, str]] = None,
+                         labels: Optional[Dict[str, str]] = None,
+                         init_containers: Optional[List[Dict]] = None,
+                         volume_mounts: Optional[List[Dict]] = None,
+                         volumes: Optional[List[Dict]] = None,
+                         live_hashes: Optional[Dict[str, str]] = None, force: bool = False) -> str:
+        """Create or update a deployment, skipping the write when nothing changed
+        
+        Pass live_hashes=client.get_spec_hashes('Deployment') when applying many
+        deployments, so that unchanged ones cost no API call at all.
+        init_containers, volume_mounts and volumes take the same specifications
+        as create_deployment. See apply_object for force.
+        
+        Returns:
+            'applied', 'unchanged' or 'failed'
+        """
+        manifest = create_deployment_manifest(name, image, replicas=replicas, port=container_port,
+                                              env_vars=env_vars, labels=labels,
+                                              init_containers=init_containers,
+                                              volume_mounts=volume_mounts, volumes=volumes)
+        return self._report_apply(self.apply_object(manifest, live_hashes=live_hashes, force=force))
+
+    def apply_service(self, name: str, port: int, target_port: int,
+                      service_type: str = "ClusterIP",
+                      selector: Optional[Dict[str, str]] = None,
+                      live_hashes: Optional[Dict[str, str]] = None, force: bool = False) -> str:
+        """Create or update a service, skipping the write when nothing changed
+        
+        See apply_object for force.
+        
+        Returns:
+            'applied', 'unchanged' or 'failed'
+        """
+        manifest = create_service_manifest(name, port, target_port,
+                                           service_type=service_type, selector=selector)
+        return self._report_apply(self.apply_object(manifest, live_hashes=live_hashes, force=force))
+
+    def _report_apply(self, result: Dict[str, Any]) -> str:
+        """Print the outcome of an apply and return its status"""
+        if result['status'] == 'applied':
+            print(f"✅ {result['kind']} '{result['name']}' applied successfully")
+        elif result['status'] == 'unchanged':
+            print(f"➖ {result['kind']} '{result['name']}' unchanged")
+        elif result.get('conflict'):
+            print(f"❌ Conflict applying {result['kind']} '{result['name']}': {result['error']}")
+            print("💡 Another manager owns these fields; apply with force (--force-conflicts) to take them over")
+        else:
+            print(f"❌ Error applying {result['kind']} '{result['name']}': {result['error']}")
+        return result['status']
+
+    def _read_spec_hash(self, api: Any, resource: str, name: str, namespace: str) -> Optional[str]:
+        """Read the spec hash of one live object; None if it does not exist or has none"""
+        try:
+            obj = getattr(api, f"read_namespaced_{resource}")(name=name, namespace=namespace)
+        except ApiException as e:
+            if e.status == 404:
+                return None
+            raise
+        return (obj.metadata.annotations or {}).get(SPEC_HASH_ANNOTATION)
+
+    def _hash_key(self, manifest: Dict[str, Any]) -> Tuple[str, str]:
+        """Key of the live hashes a manifest is compared against: (kind, namespace)"""
+        return manifest.get('kind'), (manifest.get('metadata') or {}).get('namespace') or self.namespace
+
+    def _get_live_hashes(self, manifests: Iterator[Dict[str, Any]]) -> Dict[Tuple[str, str], Dict[str, str]]:
+        """List the live spec hashes for every (kind, namespace) the manifests use"""
+        hashes = {}
+        for kind, namespace in {self._hash_key(m) for m in manifests if m.get('kind') in APPLY_KINDS}:
+            try:
+                hashes[(kind, namespace)] = self.get_spec_hashes(kind, namespace)
+            except ApiException:
+                # Fall back to reading each object
+                continue
+        return hashes
+
+    @staticmethod
+    def _api_error_message(error: ApiException) -> str:
+        """Get the message the API server gave for a failed request"""
+        try:
+            return json.loads(error.body)['message']
+        except (TypeError, ValueError, KeyError):
+            return error.reason or str(error)
+
     # ======================
     # UTILITY METHODS
     # ======================
+    @staticmethod
+    def _selector_kwargs(label_selector: Optional[str] = None,
+                         field_selector: Optional[str] = None) -> Dict[str, str]:
+        """Build list call arguments for the selectors that were given"""
+        kwargs = {}
+        if label_selector:
+            kwargs['label_selector'] = label_selector
+        if field_selector:
+            kwargs['field_selector'] = field_selector
+        return kwargs
+
+    def _iter_pages(self, list_func: Callable, page_size: int = DEFAULT_PAGE_SIZE,
+                    **kwargs) -> Iterator[List[Any]]:
+        """Walk a list endpoint with limit/continue tokens, yielding one page of items at a time
+        
+        Args:
+            list_func: A list_namespaced_* API method
+            page_size: Maximum number of items requested per call
+            **kwargs: Extra arguments passed to every call (namespace, selectors, ...)
+        """
+        continue_token = None
+        while True:
+            if continue_token:
+                kwargs['_continue'] = continue_token
+            response = list_func(limit=page_size, **kwargs)
+            yield response.items
+            continue_token = response.metadata._continue if response.metadata else None
+            if not continue_token:
+                break
+
     def get_namespace_resources(self) -> Dict[str, int]:
         """Get a summary of resources in the namespace"""
+        if all(self._cached(kind) for kind in ('pods', 'deployments', 'services')):
+            return {kind: len(self._cached(kind)) for kind in ('pods', 'deployments', 'services')}
+        
+        list_funcs = {
+            'pods': self.core_v1.list_namespaced_pod,
+            'deployments': self.apps_v1.list_namespaced_deployment,
+            'services': self.core_v1.list_namespaced_service
+        }
+        
         try:
-            pods = len(self.core_v1.list_namespaced_pod(namespace=self.namespace).items)
-            deployments = len(self.apps_v1.list_namespaced_deployment(namespace=self.namespace).items)
-            services = len(self.core_v1.list_namespaced_service(namespace=self.namespace).items)
-            
-            return {
-                'pods': pods,
-                'deployments': deployments,
-                'services': services
-            }
+            # Count from list metadata instead of downloading every object, one kind per thread
+            with ThreadPoolExecutor(max_workers=len(list_funcs)) as executor:
+                futures = {
+                    kind: executor.submit(fastpath.count_items, list_func, namespace=self.namespace)
+                    for kind, list_func in list_funcs.items()
+                }
+                return {kind: future.result() for kind, future in futures.items()}
         except ApiException as e:
             print(f"❌ Error getting namespace resources: {e}")
             return {}
 
     def wait_for_deployment_ready(self, name: str, timeout: int = 300) -> bool:
-        """Wait for a deployment to be ready"""
-        import time
-        start_time = time.time()
+        """Wait for a deployment to be ready
+        
+        Watches the single deployment and returns as soon as all replicas of the
+        current generation are ready. Falls back to polling with backoff when the
+        watch cannot be established.
+        
+        Args:
+            name: Deployment name
+            timeout: Maximum number of seconds to wait
+            
+        Returns:
+            True if the deployment became ready, False otherwise
+        """
+        deadline = time.time() + timeout
         
-        while time.time() - start_time < timeout:
+        try:
+            deployment = self.apps_v1.read_namespaced_deployment(name=name, namespace=self.namespace)
+        except ApiException as e:
+            print(f"❌ Error checking deployment status: {e}")
+            return False
+        
+        if self._is_deployment_ready(deployment):
+            print(f"✅ Deployment '{name}' is ready")
+            return True
+        
+        try:
+            ready = self._watch_deployment_ready(name, deployment.metadata.resource_version, deadline)
+        except Exception:
+            # Watch not available (RBAC, proxies, ...); poll instead
+            ready = self._poll_deployment_ready(name, deadline)
+        
+        if ready:
+            print(f"✅ Deployment '{name}' is ready")
+        else:
+            print(f"❌ Timeout waiting for deployment '{name}' to be ready")
+        return ready
+
+    def wait_for_deployments_ready(self, names: List[str], timeout: int = 300) -> Dict[str, bool]:
+        """Wait for several deployments to be ready using a single namespace watch
+        
+        Total wait time is bounded by the slowest rollout rather than the sum of all
+        rollouts. Falls back to polling the pending deployments when the watch cannot
+        be established.
+        
+        Args:
+            names: Deployment names
+            timeout: Maximum number of seconds to wait for the whole set
+            
+        Returns:
+            Dictionary mapping each deployment name to whether it became ready
+        """
+        deadline = time.time() + timeout
+        results = {name: False for name in names}
+        
+        try:
+            self._watch_deployments_ready(results, deadline)
+        except Exception:
+            # Watch not available (RBAC, proxies, ...); poll instead
+            self._poll_deployments_ready(results, deadline)
+        
+        ready_count = sum(results.values())
+        if ready_count == len(results):
+            print(f"✅ All {len(results)} deployments are ready")
+        else:
+            pending = [name for name, ready in results.items() if not ready]
+            print(f"❌ Timeout waiting for {len(pending)} deployment(s) to be ready: {', '.join(pending)}")
+        return results
+
+    def _mark_deployment_ready(self, results: Dict[str, bool], name: str) -> None:
+        """Record and report one deployment of a bulk wait becoming ready"""
+        results[name] = True
+        print(f"✅ Deployment '{name}' is ready ({sum(results.values())}/{len(results)})")
+
+    def _watch_deployments_ready(self, results: Dict[str, bool], deadline: float) -> None:
+        """Watch all deployments in the namespace until every tracked one is ready"""
+        # Without a resourceVersion the watch starts with an ADDED event per existing object
+        resource_version = None
+        
+        while not all(results.values()) and time.time() < deadline:
+            w = watch.Watch()
             try:
-                deployment = self.apps_v1.read_namespaced_deployment(name=name, namespace=self.namespace)
-                if (deployment.status.ready_replicas == deployment.spec.replicas and 
-                    deployment.status.ready_replicas > 0):
-                    print(f"✅ Deployment '{name}' is ready")
-                    return True
+                for event in w.stream(
+                    self.apps_v1.list_namespaced_deployment,
+                    namespace=self.namespace,
+                    resource_version=resource_version,
+                    timeout_seconds=max(1, int(deadline - time.time()))
+                ):
+                    if event['type'] in ('BOOKMARK', 'DELETED'):
+                        continue
+                    deployment = event['object']
+                    name = deployment.metadata.name
+                    if results.get(name) is False and self._is_deployment_ready(deployment):
+                        self._mark_deployment_ready(results, name)
+                        if all(results.values()):
+                            return
+                    if time.time() >= deadline:
+                        return
+                resource_version = w.resource_version or resource_version
+            except ApiException as e:
+                if e.status != 410:
+                    raise
+                resource_version = None
+            finally:
+                w.stop()
+
+    def _poll_deployments_ready(self, results: Dict[str, bool], deadline: float) -> None:
+        """Poll pending deployments with exponential backoff until all are ready or the deadline passes"""
+        interval = 0.5
+        
+        while time.time() < deadline:
+            for name in [name for name, ready in results.items() if not ready]:
+                try:
+                    deployment = self.apps_v1.read_namespaced_deployment(name=name, namespace=self.namespace)
+                except ApiException:
+                    continue
+                if self._is_deployment_ready(deployment):
+                    self._mark_deployment_ready(results, name)
+            
+            if all(results.values()):
+                return
+            time.sleep(min(interval, max(0, deadline - time.time())))
+            interval = min(interval * 2, 5)
+
+    def _watch_deployment_ready(self, name: str, resource_version: Optional[str],
+                                deadline: float) -> bool:
+        """Watch one deployment until it is ready or the deadline passes"""
+        last_progress = None
+        
+        while time.time() < deadline:
+            w = watch.Watch()
+            try:
+                for event in w.stream(
+                    self.apps_v1.list_namespaced_deployment,
+                    namespace=self.namespace,
+                    field_selector=f"metadata.name={name}",
+                    resource_version=resource_version,
+                    timeout_seconds=max(1, int(deadline - time.time()))
+                ):
+                    deployment = event['object']
+                    if event['type'] == 'DELETED':
+                        print(f"❌ Deployment '{name}' was deleted while waiting")
+                        return False
+                    if event['type'] == 'BOOKMARK':
+                        continue
+                    if self._is_deployment_ready(deployment):
+                        return True
                     
-                print(f"⏳ Waiting for deployment '{name}' to be ready... ({deployment.status.ready_replicas or 0}/{deployment.spec.replicas})")
-                time.sleep(5)
-                
+                    progress = (deployment.status.ready_replicas or 0, deployment.spec.replicas)
+                    if progress != last_progress:
+                        print(f"⏳ Waiting for deployment '{name}' to be ready... ({progress[0]}/{progress[1]})")
+                        last_progress = progress
+                    if time.time() >= deadline:
+                        break
+                resource_version = w.resource_version or resource_version
+            except ApiException as e:
+                if e.status != 410:
+                    raise
+                # Our resourceVersion expired; restart the watch from the current state
+                resource_version = None
+            finally:
+                w.stop()
+        
+        return False
+
+    def _poll_deployment_ready(self, name: str, deadline: float) -> bool:
+        """Poll one deployment with exponential backoff until it is ready or the deadline passes"""
+        interval = 0.5
+        
+        while time.time() < deadline:
+            try:
+                deployment = self.apps_v1.read_namespaced_deployment(name=name, namespace=self.namespace)
             except ApiException as e:
                 print(f"❌ Error checking deployment status: {e}")
                 return False
+            
+            if self._is_deployment_ready(deployment):
+                return True
+            
+            print(f"⏳ Waiting for deployment '{name}' to be ready... ({deployment.status.ready_replicas or 0}/{deployment.spec.replicas})")
+            time.sleep(min(interval, max(0, deadline - time.time())))
+            interval = min(interval * 2, 5)
         
-        print(f"❌ Timeout waiting for deployment '{name}' to be ready")
         return False
+
+    @staticmethod
+    def _is_deployment_ready(deployment) -> bool:
+        """Check if a deployment's status is current and all desired replicas are ready"""
+        generation = deployment.metadata.generation
+        observed_generation = deployment.status.observed_generation
+        if generation is not None and (observed_generation is None or observed_generation < generation):
+            # Status still describes a previous spec
+            return False
+        
+        replicas = deployment.spec.replicas if deployment.spec.replicas is not None else 1
+        return (deployment.status.ready_replicas or 0) == replicas
@@ -0,0 +1,112 @@
+"""
+Cached AWS resource discovery for k8s-helper
+
+Default subnets and the IAM roles of clusters and node groups rarely change,
+yet EKSClient needs them for every cluster and node group created without
+explicit values. A DiscoveryCache keeps such values for a TTL, in memory and
+optionally in a JSON file (see DISCOVERY_CACHE_FILE) so that separate CLI runs
+share them. Concurrent lookups of the same key run the discovery only once.
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from .config import DEFAULT_DISCOVERY_TTL
+
+
+class DiscoveryCache:
+    """Thread-safe store of discovered values and the time they were discovered"""
+
+    def __init__(self, path: Optional[str] = None):
+        """Initialize the cache, loading the file at `path` when it exists
+
+        Args:
+            path: JSON file the cache is persisted to; None keeps it in memory only
+        """
+        self.path = os.path.expanduser(path) if path else None
+        self._lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._entries: Dict[str, Dict[str, Any]] = self._load()
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if not self.path or not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path) as f:
+                entries = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not load discovery cache {self.path}: {e}")
+            return {}
+        return entries if isinstance(entries, dict) else {}
+
+    def _save(self) -> None:
+        """Write the entries to the cache file; called with the lock held"""
+        if not self.path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            temporary = f"{self.path}.{os.getpid()}.tmp"
+            with open(temporary, 'w') as f:
+                json.dump(self._entries, f, indent=2)
+            os.replace(temporary, self.path)
+        except OSError as e:
+            print(f"Warning: Could not save discovery cache {self.path}: {e}")
+
+    def get(self, key: str, ttl: float = DEFAULT_DISCOVERY_TTL) -> Optional[Any]:
+        """Get a value discovered less than `ttl` seconds ago, or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or time.time() - entry['discovered_at'] >= ttl:
+            return None
+        return entry['value']
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a freshly discovered value"""
+        with self._lock:
+            self._entries[key] = {'value': value, 'discovered_at': time.time()}
+            self._save()
+
+    def get_or_discover(self, key: str, discover: Callable[[], Any],
+                        ttl: float = DEFAULT_DISCOVERY_TTL) -> Any:
+        """Get a cached value, calling `discover` to refresh it when missing or expired
+
+        Callers asking for the same key while it is being discovered wait for
+        that discovery instead of repeating it. Nothing is cached when
+        `discover` raises.
+        """
+        value = self.get(key, ttl)
+        if value is not None:
+            return value
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            value = self.get(key, ttl)
+            if value is None:
+                value = discover()
+                self.set(key, value)
+        return value
+
+    def invalidate(self, prefix: str = "") -> None:
+        """Forget every value whose key starts with `prefix` (everything by default)"""
+        with self._lock:
+            self._entries = {key: entry for key, entry in self._entries.items()
+                             if not key.startswith(prefix)}
+            self._save()
+
+
+# Process-wide caches keyed by file path (None for the in-memory cache)
+_caches: Dict[Optional[str], DiscoveryCache] = {}
+_caches_lock = threading.Lock()
+
+
+def shared_cache(path: Optional[str] = None) -> DiscoveryCache:
+    """Get the process-wide cache persisted to `path`, or the in-memory one for None"""
+    with _caches_lock:
+        cache = _caches.get(path)
+        if cache is None:
+            cache = _caches[path] = DiscoveryCache(path)
+        return cache
@@ -0,0 +1,140 @@
+"""
+Raw JSON fast path for k8s-helper list calls
+
+The generated kubernetes client turns every list response into model objects
+(V1Pod, V1Deployment, ...) before K8sClient reads a handful of fields from them.
+For large namespaces that deserialization dominates the cost of a list. The
+helpers here request the raw response body instead, decode it with orjson when
+it is installed (``pip install k8s-helper-cli[fast]``) and project the summary
+fields straight from the decoded dictionaries.
+"""
+
+import json
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from .config import DEFAULT_PAGE_SIZE
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+def loads(data: bytes) -> Any:
+    """Decode a JSON response body, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse a Kubernetes RFC 3339 timestamp like '2024-01-31T12:00:00Z' into an aware datetime"""
+    if not value:
+        return None
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    timestamp = datetime.fromisoformat(value)
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return timestamp
+
+
+def iter_raw_pages(list_func: Callable, page_size: int, **kwargs) -> Iterator[List[Dict[str, Any]]]:
+    """Walk a list endpoint without model deserialization, yielding decoded items page by page
+
+    Args:
+        list_func: A list_namespaced_* API method
+        page_size: Maximum number of items requested per call
+        **kwargs: Extra arguments passed to every call (namespace, selectors, ...)
+    """
+    continue_token = None
+    while True:
+        if continue_token:
+            kwargs['_continue'] = continue_token
+        response = list_func(limit=page_size, _preload_content=False, **kwargs)
+        body = loads(response.data)
+        yield body.get('items') or []
+        continue_token = (body.get('metadata') or {}).get('continue')
+        if not continue_token:
+            break
+
+
+def count_items(list_func: Callable, page_size: int = DEFAULT_PAGE_SIZE, **kwargs) -> int:
+    """Count the objects a list call would return while transferring as little as possible
+
+    Requests a single item and adds the server's remainingItemCount. The API server
+    omits that count for lists filtered by a selector; the rest of such a list is
+    paged through without building models.
+
+    Args:
+        list_func: A list_namespaced_* API method
+        page_size: Page size used if the list has to be paged through
+        **kwargs: Extra arguments passed to every call (namespace, selectors, ...)
+    """
+    response = list_func(limit=1, _preload_content=False, **kwargs)
+    body = loads(response.data)
+    count = len(body.get('items') or [])
+    metadata = body.get('metadata') or {}
+
+    continue_token = metadata.get('continue')
+    if not continue_token:
+        return count
+    if metadata.get('remainingItemCount') is not None:
+        return count + metadata['remainingItemCount']
+
+    for page in iter_raw_pages(list_func, page_size, _continue=continue_token, **kwargs):
+        count += len(page)
+    return count
+
+
+def pod_summary(pod: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the K8sClient pod summary from a decoded pod"""
+    metadata = pod.get('metadata') or {}
+    status = pod.get('status') or {}
+
+    ready = False
+    for condition in status.get('conditions') or []:
+        if condition.get('type') == 'Ready':
+            ready = condition.get('status') == 'True'
+            break
+
+    return {
+        'name': metadata.get('name'),
+        'phase': status.get('phase'),
+        'ready': ready,
+        'restarts': sum(container.get('restartCount', 0)
+                        for container in status.get('containerStatuses') or []),
+        'age': parse_timestamp(metadata.get('creationTimestamp')),
+        'node': (pod.get('spec') or {}).get('nodeName')
+    }
+
+
+def deployment_summary(deployment: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the K8sClient deployment summary from a decoded deployment"""
+    metadata = deployment.get('metadata') or {}
+    status = deployment.get('status') or {}
+
+    return {
+        'name': metadata.get('name'),
+        'replicas': (deployment.get('spec') or {}).get('replicas'),
+        'ready_replicas': status.get('readyReplicas') or 0,
+        'available_replicas': status.get('availableReplicas') or 0,
+        'created': parse_timestamp(metadata.get('creationTimestamp'))
+    }
+
+
+def event_summary(event: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the K8sClient event summary from a decoded event"""
+    involved_object = event.get('involvedObject') or {}
+
+    return {
+        'name': (event.get('metadata') or {}).get('name'),
+        'type': event.get('type'),
+        'reason': event.get('reason'),
+        'message': event.get('message'),
+        'resource': f"{involved_object.get('kind')}/{involved_object.get('name')}",
+        'first_timestamp': parse_timestamp(event.get('firstTimestamp')),
+        'last_timestamp': parse_timestamp(event.get('lastTimestamp')),
+        'count': event.get('count')
+    }
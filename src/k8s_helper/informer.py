@@ -0,0 +1,247 @@
+"""
+Informer-style local cache for k8s-helper
+
+An informer lists a resource kind once, then keeps an in-memory store current
+by watching the API server from the listed resourceVersion. Reads are served
+from the store with O(1) name lookups and a label index.
+"""
+
+import threading
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from kubernetes import watch
+from kubernetes.client.rest import ApiException
+
+from .core import DEFAULT_PAGE_SIZE
+
+
+# Resource kinds a K8sClient can cache, mapped to (API group attribute, list method)
+CACHEABLE_KINDS = {
+    'pods': ('core_v1', 'list_namespaced_pod'),
+    'deployments': ('apps_v1', 'list_namespaced_deployment'),
+    'services': ('core_v1', 'list_namespaced_service'),
+}
+
+HTTP_GONE = 410
+
+
+class Informer:
+    """Keeps a local copy of one resource kind in one namespace"""
+
+    def __init__(self, list_func: Callable, namespace: str,
+                 page_size: int = DEFAULT_PAGE_SIZE, watch_timeout: int = 300):
+        """Initialize an informer
+
+        Args:
+            list_func: A list_namespaced_* API method for the resource kind
+            namespace: Namespace to list and watch
+            page_size: Page size used for the initial list and every relist
+            watch_timeout: Seconds before a watch connection is renewed
+        """
+        self.list_func = list_func
+        self.namespace = namespace
+        self.page_size = page_size
+        self.watch_timeout = watch_timeout
+        self.resource_version: Optional[str] = None
+        self.relist_count = 0
+
+        self._items: Dict[str, Any] = {}
+        self._label_index: Dict[Tuple[str, str], Set[str]] = {}
+        self._lock = threading.RLock()
+        self._start_lock = threading.Lock()
+        self._synced = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._watch: Optional[watch.Watch] = None
+
+    # ======================
+    # LIFECYCLE
+    # ======================
+    def start(self) -> None:
+        """Do the initial list and start watching in a background thread"""
+        with self._start_lock:
+            if self._thread is not None:
+                return
+
+            self._relist()
+            self._thread = threading.Thread(
+                target=self._run,
+                name=f"informer-{self.namespace}",
+                daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop watching; the store keeps its last known state"""
+        self._stopped.set()
+        if self._watch is not None:
+            self._watch.stop()
+
+    def has_synced(self) -> bool:
+        """Check if the initial list has completed"""
+        return self._synced.is_set()
+
+    # ======================
+    # READS
+    # ======================
+    def get(self, name: str) -> Optional[Any]:
+        """Get an object by name, or None if it is not in the store"""
+        with self._lock:
+            return self._items.get(name)
+
+    def list(self, labels: Optional[Dict[str, str]] = None) -> List[Any]:
+        """List objects, optionally restricted to those carrying all given labels
+
+        Args:
+            labels: Equality label selector as a dictionary
+
+        Returns:
+            Objects sorted by name. They are shared with the store and must not be modified.
+        """
+        with self._lock:
+            if not labels:
+                names = self._items.keys()
+            else:
+                matches = [self._label_index.get(item, set()) for item in labels.items()]
+                names = set.intersection(*matches) if matches else set()
+            return [self._items[name] for name in sorted(names)]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._items)
+
+    # ======================
+    # STORE MAINTENANCE
+    # ======================
+    def _relist(self) -> None:
+        """Replace the store with a fresh paginated list"""
+        items: Dict[str, Any] = {}
+        resource_version = None
+        continue_token = None
+
+        while True:
+            kwargs = {'namespace': self.namespace, 'limit': self.page_size}
+            if continue_token:
+                kwargs['_continue'] = continue_token
+            response = self.list_func(**kwargs)
+            for obj in response.items:
+                items[obj.metadata.name] = obj
+            # Every page of a continued list reports the snapshot's resourceVersion
+            resource_version = response.metadata.resource_version
+            continue_token = response.metadata._continue
+            if not continue_token:
+                break
+
+        label_index: Dict[Tuple[str, str], Set[str]] = {}
+        for name, obj in items.items():
+            for label in (obj.metadata.labels or {}).items():
+                label_index.setdefault(label, set()).add(name)
+
+        with self._lock:
+            self._items = items
+            self._label_index = label_index
+            self.resource_version = resource_version
+            self.relist_count += 1
+        self._synced.set()
+
+    def _apply_event(self, event_type: str, obj: Any) -> None:
+        """Apply a single watch event to the store"""
+        name = obj.metadata.name
+        with self._lock:
+            previous = self._items.pop(name, None)
+            if previous is not None:
+                self._unindex(name, previous)
+            if event_type in ('ADDED', 'MODIFIED'):
+                self._items[name] = obj
+                for label in (obj.metadata.labels or {}).items():
+                    self._label_index.setdefault(label, set()).add(name)
+
+    def _unindex(self, name: str, obj: Any) -> None:
+        """Remove an object's labels from the label index"""
+        for label in (obj.metadata.labels or {}).items():
+            names = self._label_index.get(label)
+            if names is not None:
+                names.discard(name)
+                if not names:
+                    del self._label_index[label]
+
+    def _run(self) -> None:
+        """Watch loop: resume from the last resourceVersion, relist when it expires"""
+        backoff = 1.0
+        while not self._stopped.is_set():
+            try:
+                self._watch = watch.Watch()
+                for event in self._watch.stream(
+                    self.list_func,
+                    namespace=self.namespace,
+                    resource_version=self.resource_version,
+                    allow_watch_bookmarks=True,
+                    timeout_seconds=self.watch_timeout
+                ):
+                    if event['type'] != 'BOOKMARK':
+                        self._apply_event(event['type'], event['object'])
+                    # Bookmarks only move the resourceVersion forward
+                    self.resource_version = self._watch.resource_version
+                    if self._stopped.is_set():
+                        break
+                backoff = 1.0
+            except ApiException as e:
+                if e.status == HTTP_GONE:
+                    self._relist_safely()
+                else:
+                    self._stopped.wait(backoff)
+                    backoff = min(backoff * 2, 30.0)
+            except Exception:
+                # Connection dropped; retry with backoff
+                self._stopped.wait(backoff)
+                backoff = min(backoff * 2, 30.0)
+
+    def _relist_safely(self) -> None:
+        """Relist after the watch expired, backing off while the API is unavailable"""
+        backoff = 1.0
+        while not self._stopped.is_set():
+            try:
+                self._relist()
+                return
+            except Exception:
+                self._stopped.wait(backoff)
+                backoff = min(backoff * 2, 30.0)
+
+
+# Process-wide informers shared by every K8sClient
+_informers: Dict[Tuple[Any, ...], Informer] = {}
+_informers_lock = threading.Lock()
+
+
+def get_informer(kind: str, namespace: str, list_func: Callable,
+                 key: Tuple[Any, ...] = ()) -> Informer:
+    """Get the shared informer for a kind/namespace, starting it on first use
+
+    Args:
+        kind: Resource kind, one of CACHEABLE_KINDS
+        namespace: Namespace to cache
+        list_func: List method used if the informer has to be created
+        key: Extra key parts identifying the cluster connection
+
+    Returns:
+        A started, synced Informer
+    """
+    if kind not in CACHEABLE_KINDS:
+        raise ValueError(f"Unsupported kind for caching: {kind}")
+
+    cache_key = key + (kind, namespace)
+    with _informers_lock:
+        informer = _informers.get(cache_key)
+        if informer is None:
+            informer = Informer(list_func, namespace)
+            _informers[cache_key] = informer
+    informer.start()
+    return informer
+
+
+def stop_all_informers() -> None:
+    """Stop and forget every shared informer"""
+    with _informers_lock:
+        for informer in _informers.values():
+            informer.stop()
+        _informers.clear()
@@ -0,0 +1,202 @@
+"""
+Per-call instrumentation for k8s-helper
+
+Every request sent through a RequestLayer (see ratelimit) produces one event
+describing the call. Events are passed to the hooks registered with add_hook;
+without hooks nothing is recorded. MetricsRegistry is a ready-made hook that
+keeps per-call latency samples and reports counts, percentiles and totals.
+
+Timeline records the phases of a longer workflow, such as provisioning a
+cluster, with their start and end times so overlapping phases can be seen.
+
+Latency is measured until the response headers arrive; bodies that callers
+stream or read later are not included. Bytes come from the Content-Length
+header, or from the body when the client has already loaded it.
+"""
+
+import contextlib
+import json
+import math
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+
+Hook = Callable[[Dict[str, Any]], None]
+
+# Hooks called for every finished request; copied on write so emit never locks
+_hooks: Tuple[Hook, ...] = ()
+_hooks_lock = threading.Lock()
+
+
+def add_hook(hook: Hook) -> None:
+    """Call `hook` with an event for every API request
+
+    Events are dictionaries with 'api' ('kubernetes' or 'aws'), 'call'
+    (Kubernetes verb or AWS operation), 'resource', 'status', 'bytes' and
+    'seconds'. Hooks run on the requesting thread and must be quick.
+    """
+    global _hooks
+    with _hooks_lock:
+        _hooks = _hooks + (hook,)
+
+
+def remove_hook(hook: Hook) -> None:
+    """Stop calling a hook added with add_hook"""
+    global _hooks
+    with _hooks_lock:
+        _hooks = tuple(h for h in _hooks if h != hook)
+
+
+def is_enabled() -> bool:
+    """Whether any hook is registered, i.e. whether events need to be built"""
+    return bool(_hooks)
+
+
+def emit(event: Dict[str, Any]) -> None:
+    """Pass an event to every registered hook"""
+    for hook in _hooks:
+        hook(event)
+
+
+def k8s_call(method: str, url: str) -> Tuple[str, str]:
+    """Derive the Kubernetes verb and resource of a request from its method and URL
+
+    '/api/v1/namespaces/default/pods/web-1/log' becomes ('get', 'pods/log') and a
+    GET of '/apis/apps/v1/namespaces/default/deployments?watch=true' becomes
+    ('watch', 'deployments').
+    """
+    parts = urlsplit(url)
+    segments = [segment for segment in parts.path.split('/') if segment]
+    if segments[:1] == ['api']:
+        segments = segments[2:]
+    elif segments[:1] == ['apis']:
+        segments = segments[3:]
+    if len(segments) > 2 and segments[0] == 'namespaces':
+        segments = segments[2:]
+
+    resource = segments[0] if segments else parts.path
+    if len(segments) > 2:
+        resource = f"{resource}/{segments[2]}"
+    collection = len(segments) < 2
+
+    method = method.upper()
+    if method == 'GET':
+        if parse_qs(parts.query).get('watch') in (['true'], ['1']):
+            verb = 'watch'
+        else:
+            verb = 'list' if collection else 'get'
+    elif method == 'DELETE':
+        verb = 'deletecollection' if collection else 'delete'
+    else:
+        verb = {'POST': 'create', 'PUT': 'update', 'PATCH': 'patch'}.get(method, method.lower())
+    return verb, resource
+
+
+def _percentile(samples: List[float], percent: float) -> float:
+    """Nearest-rank percentile of sorted samples"""
+    rank = math.ceil(percent / 100 * len(samples))
+    return samples[min(max(rank, 1), len(samples)) - 1]
+
+
+class MetricsRegistry:
+    """Thread-safe store of request latencies, grouped by API, call and resource"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget everything recorded so far"""
+        with self._lock:
+            self._calls: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+
+    def record(self, event: Dict[str, Any]) -> None:
+        """Add one request event; usable directly as a hook"""
+        key = (event['api'], event['call'], event['resource'])
+        status = event.get('status')
+        failed = status is None or not (200 <= status < 400)
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = {'samples': [], 'errors': 0, 'bytes': 0, 'statuses': {}}
+            call['samples'].append(event['seconds'])
+            call['errors'] += failed
+            call['bytes'] += event.get('bytes') or 0
+            call['statuses'][str(status)] = call['statuses'].get(str(status), 0) + 1
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """Per-call breakdown, most total time first
+
+        Returns:
+            One dictionary per (api, call, resource) with count, errors, bytes,
+            statuses, and p50/p95/p99/total latencies in milliseconds
+        """
+        with self._lock:
+            calls = {key: dict(call, samples=sorted(call['samples']), statuses=dict(call['statuses']))
+                     for key, call in self._calls.items()}
+
+        rows = []
+        for (api, name, resource), call in calls.items():
+            samples = call['samples']
+            rows.append({
+                'api': api,
+                'call': name,
+                'resource': resource,
+                'count': len(samples),
+                'errors': call['errors'],
+                'bytes': call['bytes'],
+                'statuses': call['statuses'],
+                'p50_ms': round(_percentile(samples, 50) * 1000, 2),
+                'p95_ms': round(_percentile(samples, 95) * 1000, 2),
+                'p99_ms': round(_percentile(samples, 99) * 1000, 2),
+                'total_ms': round(sum(samples) * 1000, 2),
+            })
+        rows.sort(key=lambda row: row['total_ms'], reverse=True)
+        return rows
+
+    def to_json(self, path: Optional[str] = None) -> str:
+        """Serialize the summary as JSON, writing it to `path` when given"""
+        document = json.dumps({'calls': self.summary()}, indent=2)
+        if path:
+            with open(path, 'w') as f:
+                f.write(document + "\n")
+        return document
+
+
+# Registry used by the CLI --profile option
+registry = MetricsRegistry()
+
+
+class Timeline:
+    """Thread-safe record of named phases, timed from the creation of the timeline"""
+
+    def __init__(self):
+        self._start = time.monotonic()
+        self._lock = threading.Lock()
+        self._phases: List[Tuple[float, Dict[str, Any]]] = []
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Record the enclosed block as phase `name`, marking it failed if it raises"""
+        started = time.monotonic()
+        ok = False
+        try:
+            yield
+            ok = True
+        finally:
+            finished = time.monotonic()
+            with self._lock:
+                self._phases.append((started, {
+                    'phase': name,
+                    'start_s': round(started - self._start, 3),
+                    'end_s': round(finished - self._start, 3),
+                    'seconds': round(finished - started, 3),
+                    'ok': ok,
+                }))
+
+    def phases(self) -> List[Dict[str, Any]]:
+        """Recorded phases in the order they started"""
+        with self._lock:
+            return [phase for _, phase in sorted(self._phases, key=lambda entry: entry[0])]
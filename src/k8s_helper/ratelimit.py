@@ -0,0 +1,383 @@
+"""
+Client-side rate limiting and retries for k8s-helper
+
+Every Kubernetes API request made through a shared ApiClient, and every AWS call
+made by EKSClient, goes through a RequestLayer. The layer spaces requests with a
+token bucket (QPS and burst) and retries throttled (429) and transient server
+error responses with exponential backoff and full jitter, honouring Retry-After.
+Counters of requests, retries and waits are kept for inspection, and every
+attempt is reported to the instrumentation hooks in metrics.
+"""
+
+import random
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, Optional
+
+from kubernetes.client.rest import ApiException
+
+from . import metrics
+from .config import DEFAULT_BURST, DEFAULT_MAX_RETRIES, DEFAULT_QPS
+
+
+# HTTP statuses worth retrying: throttled, or a server/proxy that may recover
+RETRYABLE_STATUSES = (429, 500, 502, 503, 504)
+
+# Methods whose effect does not depend on how often they are sent; a POST that
+# failed with a 5xx may still have been applied, so only its 429s are retried
+IDEMPOTENT_METHODS = ('GET', 'HEAD', 'OPTIONS', 'PUT', 'PATCH', 'DELETE')
+
+# AWS operations that only read; like idempotent methods, their server and
+# connection errors are retried. Other operations are retried after a server
+# error only when they carry a client request token.
+READ_ONLY_AWS_PREFIXES = ('Describe', 'List', 'Get')
+
+# AWS error codes that mean "slow down"
+THROTTLING_ERROR_CODES = (
+    'Throttling',
+    'ThrottlingException',
+    'ThrottledException',
+    'RequestThrottled',
+    'RequestThrottledException',
+    'RequestLimitExceeded',
+    'TooManyRequestsException',
+    'SlowDown',
+)
+
+# Attribute under which an ApiClient's layer is stored
+_LAYER_ATTR = '_k8s_helper_request_layer'
+
+
+class TokenBucket:
+    """Thread-safe token bucket allowing `qps` requests per second with bursts of `burst`"""
+
+    def __init__(self, qps: Optional[float] = DEFAULT_QPS, burst: int = DEFAULT_BURST):
+        """Initialize the bucket full
+
+        Args:
+            qps: Sustained requests per second; None or 0 disables limiting
+            burst: Requests that may be sent at once after an idle period
+        """
+        self.qps = qps
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token, sleeping until one is available
+
+        Returns:
+            Number of seconds spent waiting
+        """
+        if not self.qps:
+            return 0.0
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.qps)
+            self._updated = now
+            # Reserve the token now; a negative balance queues later callers behind us
+            self._tokens -= 1
+            wait = -self._tokens / self.qps if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class RequestStats:
+    """Thread-safe counters describing the requests sent through a RequestLayer"""
+
+    FIELDS = ('requests', 'retries', 'throttled', 'server_errors', 'failures',
+              'throttle_waits', 'throttle_wait_seconds', 'retry_wait_seconds')
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def add(self, **counts: float) -> None:
+        """Increment counters by the given amounts"""
+        with self._lock:
+            for name, value in counts.items():
+                self._counts[name] += value
+
+    def reset(self) -> None:
+        """Set every counter back to zero"""
+        with self._lock:
+            self._counts = {name: 0 for name in self.FIELDS}
+
+    def snapshot(self) -> Dict[str, float]:
+        """Get a copy of the current counters"""
+        with self._lock:
+            counts = dict(self._counts)
+        counts['throttle_wait_seconds'] = round(counts['throttle_wait_seconds'], 3)
+        counts['retry_wait_seconds'] = round(counts['retry_wait_seconds'], 3)
+        return counts
+
+
+class RequestLayer:
+    """Rate limiter, retry policy and counters shared by the clients of one API"""
+
+    def __init__(self, qps: Optional[float] = DEFAULT_QPS, burst: int = DEFAULT_BURST,
+                 max_retries: int = DEFAULT_MAX_RETRIES, base_delay: float = 0.5,
+                 max_delay: float = 30.0):
+        """Initialize the layer
+
+        Args:
+            qps: Sustained requests per second; None or 0 disables limiting
+            burst: Requests that may be sent at once after an idle period
+            max_retries: Retries after the first attempt before giving up
+            base_delay: Backoff before the first retry, doubled on every retry
+            max_delay: Upper bound for a single backoff or Retry-After wait
+        """
+        self.limiter = TokenBucket(qps, burst)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.stats = RequestStats()
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Seconds to wait before retry number `attempt` (0-based)
+
+        A server-provided Retry-After wins; otherwise the delay is drawn uniformly
+        from zero to the exponential backoff ("full jitter").
+        """
+        if retry_after is not None:
+            return min(max(retry_after, 0.0), self.max_delay)
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    def call(self, send: Callable[[], Any], classify: Callable[[Any, Optional[Exception]], Optional[Dict]]) -> Any:
+        """Send a request through the limiter, retrying while it is classified as retryable
+
+        Args:
+            send: Callable performing one attempt
+            classify: Called with (result, error) after each attempt; returns None
+                when the outcome is final, or a dict with 'throttled' (bool),
+                'retry_after' (seconds or None) and an optional 'cleanup' callable
+                releasing the failed attempt
+        """
+        attempt = 0
+        while True:
+            waited = self.limiter.acquire()
+            self.stats.add(requests=1)
+            if waited:
+                self.stats.add(throttle_waits=1, throttle_wait_seconds=waited)
+
+            result, error = None, None
+            try:
+                result = send()
+            except Exception as e:
+                error = e
+
+            verdict = classify(result, error)
+            if verdict is None:
+                if error is not None:
+                    raise error
+                return result
+
+            self.stats.add(**{'throttled' if verdict['throttled'] else 'server_errors': 1})
+            if attempt >= self.max_retries:
+                self.stats.add(failures=1)
+                if error is not None:
+                    raise error
+                return result
+
+            if verdict.get('cleanup'):
+                verdict['cleanup']()
+            delay = self.backoff(attempt, verdict.get('retry_after'))
+            self.stats.add(retries=1, retry_wait_seconds=delay)
+            time.sleep(delay)
+            attempt += 1
+
+
+def is_transient_aws_error(error: Exception) -> bool:
+    """Whether an AWS error is throttling, a transient server error or a connection problem
+
+    Such errors are worth waiting out in long-running loops even after the
+    RequestLayer has used up its retries.
+    """
+    from botocore.exceptions import ClientError, HTTPClientError
+    from botocore.exceptions import ConnectionError as BotoConnectionError
+
+    if isinstance(error, (BotoConnectionError, HTTPClientError)):
+        return True
+    if not isinstance(error, ClientError):
+        return False
+    response = error.response or {}
+    code = (response.get('Error') or {}).get('Code')
+    status = (response.get('ResponseMetadata') or {}).get('HTTPStatusCode')
+    return code in THROTTLING_ERROR_CODES or status in RETRYABLE_STATUSES
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds (HTTP dates are ignored)"""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _response_bytes(headers: Any, data: Any = None) -> Optional[int]:
+    """Size of a response body from its Content-Length header or its already loaded data"""
+    length = headers.get('Content-Length') or headers.get('content-length')
+    if length is not None:
+        try:
+            return int(length)
+        except (TypeError, ValueError):
+            pass
+    if isinstance(data, (bytes, str)):
+        return len(data)
+    return None
+
+
+def install_k8s_request_layer(api_client: Any, layer: Optional[RequestLayer] = None) -> RequestLayer:
+    """Route every request of a kubernetes ApiClient through a RequestLayer
+
+    Installing twice keeps the first layer, so clients sharing an ApiClient share
+    one limiter and one set of counters.
+
+    Returns:
+        The layer used by the ApiClient
+    """
+    existing = getattr(api_client, _LAYER_ATTR, None)
+    if isinstance(existing, RequestLayer):
+        return existing
+
+    layer = layer or RequestLayer()
+    rest_client = api_client.rest_client
+    request = rest_client.request
+
+    def limited_request(method, url, *args, **kwargs):
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+
+        def classify(response, error):
+            if error is not None:
+                # Older clients raise for non-2xx responses
+                if not isinstance(error, ApiException):
+                    return None
+                status, headers, cleanup = error.status, error.headers or {}, None
+            else:
+                status = response.status
+                headers = getattr(response, 'headers', None) or {}
+                cleanup = getattr(getattr(response, 'response', response), 'release_conn', None)
+
+            if status not in RETRYABLE_STATUSES or (status != 429 and not idempotent):
+                return None
+            return {
+                'throttled': status == 429,
+                'retry_after': parse_retry_after(headers.get('Retry-After')),
+                'cleanup': cleanup
+            }
+
+        def send():
+            if not metrics.is_enabled():
+                return request(method, url, *args, **kwargs)
+            start = time.perf_counter()
+            response, status, headers = None, None, {}
+            try:
+                response = request(method, url, *args, **kwargs)
+                status, headers = response.status, getattr(response, 'headers', None) or {}
+                return response
+            except ApiException as e:
+                status, headers = e.status, e.headers or {}
+                raise
+            finally:
+                verb, resource = metrics.k8s_call(method, url)
+                metrics.emit({
+                    'api': 'kubernetes', 'call': verb, 'resource': resource, 'status': status,
+                    'bytes': _response_bytes(headers, getattr(response, 'data', None)),
+                    'seconds': time.perf_counter() - start
+                })
+
+        return layer.call(send, classify)
+
+    rest_client.request = limited_request
+    setattr(api_client, _LAYER_ATTR, layer)
+    return layer
+
+
+def install_boto_request_layer(boto_client: Any, layer: RequestLayer) -> RequestLayer:
+    """Route every call of a boto3 client through a RequestLayer
+
+    The client should be created with botocore's own retries disabled (see
+    BOTO_NO_RETRIES in core) so that attempts are not multiplied. Throttling
+    is retried for every operation. Server and connection errors are retried
+    only for read-only operations (READ_ONLY_AWS_PREFIXES) and for operations
+    taking an idempotency token, which is filled in once so that every attempt
+    is the same request; a failed CreateRole, say, may have been applied.
+    """
+    # botocore is only loaded by EKS commands; keep it out of Kubernetes-only ones
+    from botocore.exceptions import ClientError, HTTPClientError
+    from botocore.exceptions import ConnectionError as BotoConnectionError
+    from botocore.model import OperationNotFoundError
+
+    make_api_call = boto_client._make_api_call
+    service_model = boto_client.meta.service_model
+    token_members: Dict[str, Optional[str]] = {}
+
+    def idempotency_token_member(operation_name):
+        if operation_name not in token_members:
+            member = None
+            try:
+                input_shape = service_model.operation_model(operation_name).input_shape
+            except OperationNotFoundError:
+                input_shape = None
+            members = getattr(input_shape, 'members', None)
+            if isinstance(members, dict):
+                member = next((name for name, shape in members.items()
+                               if shape.metadata.get('idempotencyToken')), None)
+            token_members[operation_name] = member
+        return token_members[operation_name]
+
+    def classify(result, error, retry_server_errors):
+        if retry_server_errors and isinstance(error, (BotoConnectionError, HTTPClientError)):
+            return {'throttled': False, 'retry_after': None}
+        if not isinstance(error, ClientError):
+            return None
+        response = error.response or {}
+        code = (response.get('Error') or {}).get('Code')
+        metadata = response.get('ResponseMetadata') or {}
+        status = metadata.get('HTTPStatusCode')
+        throttled = code in THROTTLING_ERROR_CODES or status == 429
+        if not throttled and not (retry_server_errors and status in RETRYABLE_STATUSES):
+            return None
+        headers = metadata.get('HTTPHeaders') or {}
+        return {'throttled': throttled, 'retry_after': parse_retry_after(headers.get('retry-after'))}
+
+    service = service_model.service_name
+
+    def send(operation_name, api_params):
+        if not metrics.is_enabled():
+            return make_api_call(operation_name, api_params)
+        start = time.perf_counter()
+        response = {}
+        try:
+            response = make_api_call(operation_name, api_params)
+            return response
+        except ClientError as e:
+            response = e.response or {}
+            raise
+        finally:
+            metadata = (response.get('ResponseMetadata') or {}) if isinstance(response, dict) else {}
+            metrics.emit({
+                'api': 'aws', 'call': operation_name, 'resource': service,
+                'status': metadata.get('HTTPStatusCode'),
+                'bytes': _response_bytes(metadata.get('HTTPHeaders') or {}),
+                'seconds': time.perf_counter() - start
+            })
+
+    def limited_api_call(operation_name, api_params):
+        token_member = idempotency_token_member(operation_name)
+        if token_member and not api_params.get(token_member):
+            # botocore would generate a new token for every attempt
+            api_params = dict(api_params, **{token_member: str(uuid.uuid4())})
+        retry_server_errors = operation_name.startswith(READ_ONLY_AWS_PREFIXES) or bool(token_member)
+        return layer.call(lambda: send(operation_name, api_params),
+                          lambda result, error: classify(result, error, retry_server_errors))
+
+    boto_client._make_api_call = limited_api_call
+    return layer
@@ -0,0 +1,858 @@
+"""
+In-process fakes of the Kubernetes and AWS APIs for tests and benchmarks
+
+FakeKubeServer speaks enough of the Kubernetes REST API for the real
+K8sClient to run against it: namespaced CRUD for the core and apps kinds,
+list pagination with limit/continue and remainingItemCount, label and field
+selectors, deletecollection, pod logs and watch streams. Deployments roll
+out by themselves after a configurable delay, and every request can be
+slowed down by a fixed latency.
+
+EKSHarness does the same for EKSClient on top of moto's in-memory AWS
+backends, delaying and counting every AWS call.
+
+Example:
+    with FakeKubeServer(latency=0.002) as server:
+        server.seed("pods", 10000)
+        client = K8sClient(config_file=server.write_kubeconfig(tmp_path / "kubeconfig"))
+        pods = client.list_pods()
+        print(server.request_counts)
+"""
+
+import base64
+import bisect
+import contextlib
+import copy
+import heapq
+import itertools
+import json
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import yaml
+
+from .metrics import k8s_call
+from .utils import create_deployment_manifest
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+# Served resources, mapped to (API path prefix, kind, namespaced)
+RESOURCES = {
+    'pods': ('/api/v1', 'Pod', True),
+    'services': ('/api/v1', 'Service', True),
+    'configmaps': ('/api/v1', 'ConfigMap', True),
+    'secrets': ('/api/v1', 'Secret', True),
+    'persistentvolumeclaims': ('/api/v1', 'PersistentVolumeClaim', True),
+    'events': ('/api/v1', 'Event', True),
+    'namespaces': ('/api/v1', 'Namespace', False),
+    'deployments': ('/apis/apps/v1', 'Deployment', True),
+    'statefulsets': ('/apis/apps/v1', 'StatefulSet', True),
+    'replicasets': ('/apis/apps/v1', 'ReplicaSet', True),
+}
+
+# Number of watch events kept for watches resuming from a resourceVersion
+EVENT_HISTORY = 10000
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Benchmarks open many pooled connections at once
+    request_queue_size = 256
+
+
+def _dumps(value: Any) -> bytes:
+    """Encode a response body, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(',', ':')).encode()
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def make_pod(name: str, namespace: str = "default", labels: Optional[Dict[str, str]] = None,
+             phase: str = "Running", ready: bool = True, node: str = "node-0") -> Dict[str, Any]:
+    """Build a pod shaped like one returned by a real API server"""
+    return {
+        'apiVersion': 'v1',
+        'kind': 'Pod',
+        'metadata': {'name': name, 'namespace': namespace, 'labels': labels or {'app': 'web'}},
+        'spec': {
+            'nodeName': node,
+            'containers': [{
+                'name': 'web',
+                'image': 'nginx:1.25',
+                'ports': [{'containerPort': 80, 'protocol': 'TCP'}],
+                'resources': {'requests': {'cpu': '100m', 'memory': '128Mi'}},
+            }],
+            'restartPolicy': 'Always',
+        },
+        'status': {
+            'phase': phase,
+            'podIP': '10.0.0.1',
+            'startTime': _now(),
+            'conditions': [
+                {'type': 'Initialized', 'status': 'True'},
+                {'type': 'Ready', 'status': 'True' if ready else 'False'},
+                {'type': 'PodScheduled', 'status': 'True'},
+            ],
+            'containerStatuses': [{
+                'name': 'web', 'ready': ready, 'restartCount': 0, 'image': 'nginx:1.25',
+                'imageID': 'docker.io/library/nginx@sha256:0', 'state': {'running': {'startedAt': _now()}},
+            }],
+        },
+    }
+
+
+def make_object(resource: str, name: str, namespace: str = "default",
+                labels: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """Build a minimal object of a served resource"""
+    if resource == 'pods':
+        return make_pod(name, namespace, labels)
+    if resource == 'deployments':
+        manifest = create_deployment_manifest(name, "nginx:1.25", replicas=1, labels=labels)
+        manifest['metadata']['namespace'] = namespace
+        return manifest
+    prefix, kind, _ = RESOURCES[resource]
+    obj = {
+        'apiVersion': prefix.split('/', 2)[-1],
+        'kind': kind,
+        'metadata': {'name': name, 'namespace': namespace, 'labels': labels or {'app': 'web'}},
+    }
+    if resource == 'services':
+        obj['spec'] = {'type': 'ClusterIP', 'clusterIP': '10.96.0.1',
+                       'ports': [{'port': 80, 'targetPort': 80, 'protocol': 'TCP'}]}
+    elif resource in ('configmaps', 'secrets'):
+        obj['data'] = {}
+    return obj
+
+
+def _match_labels(labels: Dict[str, str], selector: Optional[str]) -> bool:
+    """Check labels against an equality or existence based label selector"""
+    if not selector:
+        return True
+    for requirement in selector.split(','):
+        requirement = requirement.strip()
+        if not requirement:
+            continue
+        if '!=' in requirement:
+            key, value = requirement.split('!=', 1)
+            if labels.get(key.strip()) == value.strip():
+                return False
+        elif '=' in requirement:
+            key, value = requirement.replace('==', '=').split('=', 1)
+            if labels.get(key.strip()) != value.strip():
+                return False
+        elif requirement.startswith('!'):
+            if requirement[1:] in labels:
+                return False
+        elif requirement not in labels:
+            return False
+    return True
+
+
+def _match_fields(obj: Dict[str, Any], selector: Optional[str]) -> bool:
+    """Check an object against a field selector like 'metadata.name=web,status.phase!=Failed'"""
+    if not selector:
+        return True
+    for requirement in selector.split(','):
+        negate = '!=' in requirement
+        path, value = requirement.replace('!=', '=').replace('==', '=').split('=', 1)
+        current: Any = obj
+        for part in path.strip().split('.'):
+            current = current.get(part) if isinstance(current, dict) else None
+        if (str(current) if current is not None else '') == value.strip():
+            if negate:
+                return False
+        elif not negate:
+            return False
+    return True
+
+
+def _merge(target: Dict[str, Any], patch: Dict[str, Any]) -> Dict[str, Any]:
+    """JSON merge patch (RFC 7386); lists are replaced"""
+    for key, value in patch.items():
+        if value is None:
+            target.pop(key, None)
+        elif isinstance(value, dict) and isinstance(target.get(key), dict):
+            _merge(target[key], value)
+        else:
+            target[key] = copy.deepcopy(value)
+    return target
+
+
+class ApiError(Exception):
+    """An error answered with a Kubernetes Status object"""
+
+    REASONS = {400: 'BadRequest', 404: 'NotFound', 405: 'MethodNotAllowed', 409: 'AlreadyExists',
+               410: 'Expired', 415: 'UnsupportedMediaType', 422: 'Invalid'}
+
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+    def status(self) -> Dict[str, Any]:
+        return {'kind': 'Status', 'apiVersion': 'v1', 'metadata': {}, 'status': 'Failure',
+                'message': self.message, 'reason': self.REASONS.get(self.code, 'InternalError'),
+                'code': self.code}
+
+
+class FakeKubeServer:
+    """Kubernetes API server stand-in holding objects in memory
+
+    Attributes:
+        latency: Seconds every request is delayed before it is handled
+        rollout_delay: Seconds after a deployment change until it reports ready
+        deletion_delay: Seconds a deleted object stays (with a deletionTimestamp)
+            before it is removed, like an object waiting for finalizers
+        request_counts: Requests handled, keyed by (verb, resource)
+    """
+
+    def __init__(self, latency: float = 0.0, rollout_delay: float = 0.0,
+                 deletion_delay: float = 0.0, watch_timeout: int = 300,
+                 host: str = "127.0.0.1", port: int = 0):
+        """Initialize the server; nothing is served before start()
+
+        Args:
+            latency: Seconds every request is delayed before it is handled
+            rollout_delay: Seconds after a deployment change until it reports ready
+            deletion_delay: Seconds deleted objects linger before they are gone
+            watch_timeout: Seconds a watch without timeoutSeconds stays open
+            host: Interface to listen on
+            port: Port to listen on; 0 picks a free one
+        """
+        self.latency = latency
+        self.rollout_delay = rollout_delay
+        self.deletion_delay = deletion_delay
+        self.watch_timeout = watch_timeout
+        self.request_counts: Counter = Counter()
+        self.logs: Dict[Tuple[str, str], str] = {}
+
+        # resource -> {(namespace, name): object}, plus a sorted key cache for paging.
+        # Stored objects are never modified in place, so responses can be encoded
+        # outside the lock.
+        self._objects: Dict[str, Dict[Tuple[str, str], Dict[str, Any]]] = {r: {} for r in RESOURCES}
+        self._sorted_keys: Dict[str, Optional[List[Tuple[str, str]]]] = {r: None for r in RESOURCES}
+        self._resource_version = 0
+        self._events: List[Tuple[int, str, str, Dict[str, Any]]] = []
+        self._event_versions: List[int] = []
+        self._truncated_at = 0
+        self._changed = threading.Condition()
+        self._stopping = False
+
+        self._scheduled: List[Tuple[float, int, Callable[[], None]]] = []
+        self._scheduled_ids = itertools.count()
+        self._scheduler = threading.Thread(target=self._run_scheduled, daemon=True,
+                                           name="fake-kube-scheduler")
+
+        self._httpd = _HTTPServer((host, port), self._handler_class())
+        self._thread = threading.Thread(target=self._httpd.serve_forever, args=(0.05,),
+                                        daemon=True, name="fake-kube-server")
+
+    # ======================
+    # LIFECYCLE
+    # ======================
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'FakeKubeServer':
+        """Start serving requests on a background thread"""
+        self._thread.start()
+        self._scheduler.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving, ending open watches"""
+        with self._changed:
+            self._stopping = True
+            self._changed.notify_all()
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> 'FakeKubeServer':
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+    def write_kubeconfig(self, path: Any, namespace: str = "default") -> str:
+        """Write a kubeconfig pointing at this server and return its path"""
+        kubeconfig = {
+            'apiVersion': 'v1',
+            'kind': 'Config',
+            'clusters': [{'name': 'fake', 'cluster': {'server': self.url}}],
+            'users': [{'name': 'fake', 'user': {'token': 'fake-token'}}],
+            'contexts': [{'name': 'fake', 'context': {'cluster': 'fake', 'user': 'fake',
+                                                      'namespace': namespace}}],
+            'current-context': 'fake',
+        }
+        with open(path, 'w') as f:
+            yaml.safe_dump(kubeconfig, f)
+        return str(path)
+
+    # ======================
+    # OBJECT STORE
+    # ======================
+    def seed(self, resource: str, count: int, namespace: str = "default",
+             labels: Optional[Dict[str, str]] = None, prefix: Optional[str] = None,
+             factory: Optional[Callable[[str, str], Dict[str, Any]]] = None) -> None:
+        """Bulk-load objects without producing watch events
+
+        Args:
+            resource: Resource name, one of RESOURCES (e.g. 'pods')
+            count: Number of objects to create
+            namespace: Namespace of the objects
+            labels: Labels of every object
+            prefix: Name prefix; objects are named '<prefix>-00000', ...
+            factory: Called with (name, namespace) to build each object instead of make_object
+        """
+        prefix = prefix or resource.rstrip('s')
+        width = max(5, len(str(count)))
+        with self._changed:
+            for i in range(count):
+                name = f"{prefix}-{i:0{width}d}"
+                obj = factory(name, namespace) if factory else make_object(resource, name, namespace, labels)
+                self._stamp(resource, obj, namespace)
+                if resource == 'deployments':
+                    self._mark_rolled_out(obj)
+                self._objects[resource][(namespace, name)] = obj
+            self._sorted_keys[resource] = None
+
+    def clear(self, resource: str, namespace: Optional[str] = None) -> None:
+        """Drop stored objects of a resource without producing watch events"""
+        with self._changed:
+            objects = self._objects[resource]
+            for key in [key for key in objects if namespace is None or key[0] == namespace]:
+                del objects[key]
+            self._sorted_keys[resource] = None
+
+    def get(self, resource: str, name: str, namespace: str = "default") -> Optional[Dict[str, Any]]:
+        """Get a copy of a stored object"""
+        with self._changed:
+            obj = self._objects[resource].get((namespace if RESOURCES[resource][2] else '', name))
+            return copy.deepcopy(obj) if obj is not None else None
+
+    def count(self, resource: str, namespace: Optional[str] = None) -> int:
+        """Number of stored objects of a resource, optionally in one namespace"""
+        with self._changed:
+            return sum(1 for ns, _ in self._objects[resource] if namespace is None or ns == namespace)
+
+    def _stamp(self, resource: str, obj: Dict[str, Any], namespace: str) -> None:
+        """Fill in the server-managed metadata of a new object"""
+        metadata = obj.setdefault('metadata', {})
+        if RESOURCES[resource][2]:
+            metadata['namespace'] = namespace
+        metadata.setdefault('uid', str(uuid.uuid4()))
+        metadata.setdefault('creationTimestamp', _now())
+        metadata['generation'] = 1
+        self._resource_version += 1
+        metadata['resourceVersion'] = str(self._resource_version)
+        obj.setdefault('apiVersion', RESOURCES[resource][0].split('/', 2)[-1])
+        obj.setdefault('kind', RESOURCES[resource][1])
+
+    def _keys(self, resource: str) -> List[Tuple[str, str]]:
+        keys = self._sorted_keys[resource]
+        if keys is None:
+            keys = self._sorted_keys[resource] = sorted(self._objects[resource])
+        return keys
+
+    def _record(self, resource: str, event_type: str, obj: Dict[str, Any]) -> None:
+        """Store a watch event and wake watchers; the caller holds the lock"""
+        self._events.append((self._resource_version, resource, event_type, obj))
+        self._event_versions.append(self._resource_version)
+        if len(self._events) > EVENT_HISTORY:
+            dropped = len(self._events) - EVENT_HISTORY
+            self._truncated_at = self._event_versions[dropped - 1]
+            del self._events[:dropped]
+            del self._event_versions[:dropped]
+        self._changed.notify_all()
+
+    def _put(self, resource: str, key: Tuple[str, str], obj: Dict[str, Any], event_type: str) -> None:
+        """Store an object under a new resourceVersion; the caller holds the lock"""
+        if event_type != 'ADDED':
+            self._resource_version += 1
+            obj['metadata']['resourceVersion'] = str(self._resource_version)
+        if key not in self._objects[resource]:
+            self._sorted_keys[resource] = None
+        self._objects[resource][key] = obj
+        self._record(resource, event_type, obj)
+
+    def _remove(self, resource: str, key: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+        """Remove an object, producing a DELETED event; the caller holds the lock"""
+        obj = self._objects[resource].pop(key, None)
+        if obj is None:
+            return None
+        obj = copy.deepcopy(obj)
+        self._sorted_keys[resource] = None
+        self._resource_version += 1
+        obj['metadata']['resourceVersion'] = str(self._resource_version)
+        self._record(resource, 'DELETED', obj)
+        return obj
+
+    # ======================
+    # SIMULATED CONTROLLERS
+    # ======================
+    def _schedule(self, delay: float, action: Callable[[], None]) -> None:
+        with self._changed:
+            heapq.heappush(self._scheduled, (time.monotonic() + delay, next(self._scheduled_ids), action))
+            self._changed.notify_all()
+
+    def _run_scheduled(self) -> None:
+        """Run delayed actions (rollouts, finalization) in order of their due time"""
+        with self._changed:
+            while not self._stopping:
+                if not self._scheduled:
+                    self._changed.wait()
+                    continue
+                due, _, action = self._scheduled[0]
+                wait = due - time.monotonic()
+                if wait > 0:
+                    self._changed.wait(wait)
+                    continue
+                heapq.heappop(self._scheduled)
+                action()
+
+    @staticmethod
+    def _mark_rolled_out(deployment: Dict[str, Any]) -> None:
+        replicas = (deployment.get('spec') or {}).get('replicas', 1)
+        deployment['status'] = {
+            'observedGeneration': deployment['metadata']['generation'],
+            'replicas': replicas, 'updatedReplicas': replicas,
+            'readyReplicas': replicas, 'availableReplicas': replicas,
+        }
+
+    def _start_rollout(self, key: Tuple[str, str], generation: int) -> None:
+        """Report a deployment ready once rollout_delay has passed; the caller holds the lock"""
+        def finish():
+            deployment = self._objects['deployments'].get(key)
+            if deployment is not None and deployment['metadata']['generation'] == generation:
+                deployment = copy.deepcopy(deployment)
+                self._mark_rolled_out(deployment)
+                self._put('deployments', key, deployment, 'MODIFIED')
+
+        heapq.heappush(self._scheduled, (time.monotonic() + self.rollout_delay,
+                                         next(self._scheduled_ids), finish))
+        self._changed.notify_all()
+
+    def _delete(self, resource: str, key: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+        """Delete an object now, or after deletion_delay; the caller holds the lock"""
+        obj = self._objects[resource].get(key)
+        if obj is None or self.deletion_delay <= 0:
+            return self._remove(resource, key)
+        if 'deletionTimestamp' not in obj['metadata']:
+            obj = copy.deepcopy(obj)
+            obj['metadata']['deletionTimestamp'] = _now()
+            self._put(resource, key, obj, 'MODIFIED')
+            heapq.heappush(self._scheduled, (time.monotonic() + self.deletion_delay,
+                                             next(self._scheduled_ids),
+                                             lambda: self._remove(resource, key)))
+            self._changed.notify_all()
+        return obj
+
+    # ======================
+    # REQUEST HANDLING
+    # ======================
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            # Headers and body are separate writes; avoid Nagle/delayed-ACK stalls between them
+            disable_nagle_algorithm = True
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                server._handle(self, 'GET')
+
+            def do_POST(self):
+                server._handle(self, 'POST')
+
+            def do_PUT(self):
+                server._handle(self, 'PUT')
+
+            def do_PATCH(self):
+                server._handle(self, 'PATCH')
+
+            def do_DELETE(self):
+                server._handle(self, 'DELETE')
+
+        return Handler
+
+    @staticmethod
+    def _route(path: str) -> Tuple[str, Optional[str], Optional[str], Optional[str]]:
+        """Split a request path into (resource, namespace, name, subresource)"""
+        segments = [segment for segment in path.split('/') if segment]
+        if segments[:1] == ['api']:
+            segments = segments[2:]
+        elif segments[:1] == ['apis']:
+            segments = segments[3:]
+        else:
+            raise ApiError(404, f"the server could not find the requested resource ({path})")
+
+        if segments[:1] == ['namespaces'] and len(segments) >= 3:
+            namespace, segments = segments[1], segments[2:]
+        else:
+            namespace = None
+        if not segments or segments[0] not in RESOURCES:
+            raise ApiError(404, f"the server could not find the requested resource ({path})")
+        resource = segments[0]
+        name = segments[1] if len(segments) > 1 else None
+        subresource = segments[2] if len(segments) > 2 else None
+        return resource, namespace, name, subresource
+
+    def _handle(self, request: BaseHTTPRequestHandler, method: str) -> None:
+        if self.latency:
+            time.sleep(self.latency)
+        parts = urlsplit(request.path)
+        query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+        self.request_counts[k8s_call(method, request.path)] += 1
+
+        length = int(request.headers.get('Content-Length') or 0)
+        body = request.rfile.read(length) if length else b''
+        try:
+            resource, namespace, name, subresource = self._route(parts.path)
+            if method == 'GET' and query.get('watch') in ('true', '1'):
+                self._watch(request, resource, namespace, query)
+                return
+            status, payload = self._dispatch(method, resource, namespace, name, subresource,
+                                             query, body, request.headers.get('Content-Type') or '')
+        except ApiError as e:
+            status, payload = e.code, e.status()
+        except ValueError as e:
+            status, payload = 400, ApiError(400, f"invalid request body: {e}").status()
+
+        if isinstance(payload, str):
+            data, content_type = payload.encode(), 'text/plain'
+        else:
+            data, content_type = _dumps(payload), 'application/json'
+        request.send_response(status)
+        request.send_header('Content-Type', content_type)
+        request.send_header('Content-Length', str(len(data)))
+        request.end_headers()
+        request.wfile.write(data)
+
+    def _dispatch(self, method: str, resource: str, namespace: Optional[str], name: Optional[str],
+                  subresource: Optional[str], query: Dict[str, str], body: bytes,
+                  content_type: str) -> Tuple[int, Any]:
+        namespaced = RESOURCES[resource][2]
+        ns = (namespace or '') if namespaced else ''
+
+        if subresource == 'log' and resource == 'pods' and method == 'GET':
+            with self._changed:
+                if (ns, name) not in self._objects['pods']:
+                    raise ApiError(404, f'pods "{name}" not found')
+            return 200, self.logs.get((ns, name), '')
+        if subresource:
+            raise ApiError(404, f"subresource {subresource} is not served")
+
+        if name is None:
+            if method == 'GET':
+                return 200, self._list(resource, namespace if namespaced else None, query)
+            if method == 'POST':
+                return 201, self._create(resource, ns, json.loads(body or b'{}'))
+            if method == 'DELETE':
+                return 200, self._delete_collection(resource, namespace, query)
+            raise ApiError(405, f"{method} is not allowed on a collection")
+
+        key = (ns, name)
+        with self._changed:
+            if method == 'GET':
+                obj = self._objects[resource].get(key)
+                if obj is None:
+                    raise ApiError(404, f'{resource} "{name}" not found')
+                return 200, obj
+            if method == 'DELETE':
+                obj = self._delete(resource, key)
+                if obj is None:
+                    raise ApiError(404, f'{resource} "{name}" not found')
+                return 200, obj
+            if method == 'PUT':
+                return 200, self._update(resource, key, json.loads(body), replace=True)
+            if method == 'PATCH':
+                patch = json.loads(body)
+                if 'json-patch' in content_type:
+                    raise ApiError(415, "json-patch is not supported by the fake server")
+                if 'apply-patch' in content_type and key not in self._objects[resource]:
+                    self._stamp(resource, patch, ns)
+                    self._put(resource, key, patch, 'ADDED')
+                    if resource == 'deployments':
+                        self._start_rollout(key, 1)
+                    return 201, patch
+                return 200, self._update(resource, key, patch, replace=False)
+        raise ApiError(405, f"{method} is not allowed")
+
+    def _list(self, resource: str, namespace: Optional[str], query: Dict[str, str]) -> Dict[str, Any]:
+        limit = int(query.get('limit') or 0)
+        label_selector = query.get('labelSelector')
+        field_selector = query.get('fieldSelector')
+
+        with self._changed:
+            keys = self._keys(resource)
+            if 'continue' in query:
+                start_key = tuple(json.loads(base64.urlsafe_b64decode(query['continue'])))
+                start = bisect.bisect_right(keys, start_key)
+            else:
+                start = bisect.bisect_left(keys, (namespace, '')) if namespace is not None else 0
+
+            items, last_key, index = [], None, start
+            objects = self._objects[resource]
+            while index < len(keys) and (not limit or len(items) < limit):
+                key = keys[index]
+                index += 1
+                if namespace is not None and key[0] != namespace:
+                    break
+                obj = objects[key]
+                if _match_labels(obj['metadata'].get('labels') or {}, label_selector) and \
+                        _match_fields(obj, field_selector):
+                    items.append(obj)
+                    last_key = key
+
+            metadata: Dict[str, Any] = {'resourceVersion': str(self._resource_version)}
+            more = index < len(keys) and (namespace is None or keys[index][0] == namespace)
+            if limit and more and last_key is not None:
+                metadata['continue'] = base64.urlsafe_b64encode(json.dumps(last_key).encode()).decode()
+                if not label_selector and not field_selector:
+                    end = bisect.bisect_left(keys, (namespace + '\0', '')) if namespace is not None else len(keys)
+                    metadata['remainingItemCount'] = end - index
+            return {'kind': f"{RESOURCES[resource][1]}List", 'apiVersion': 'v1',
+                    'metadata': metadata, 'items': items}
+
+    def _create(self, resource: str, namespace: str, obj: Dict[str, Any]) -> Dict[str, Any]:
+        name = (obj.get('metadata') or {}).get('name')
+        if not name:
+            raise ApiError(422, f"{resource} name is required")
+        key = (namespace, name)
+        with self._changed:
+            if key in self._objects[resource]:
+                raise ApiError(409, f'{resource} "{name}" already exists')
+            self._stamp(resource, obj, namespace)
+            if resource == 'deployments':
+                obj['status'] = {}
+            self._put(resource, key, obj, 'ADDED')
+            if resource == 'deployments':
+                self._start_rollout(key, 1)
+            return obj
+
+    def _update(self, resource: str, key: Tuple[str, str], change: Dict[str, Any],
+                replace: bool) -> Dict[str, Any]:
+        """Replace or merge-patch an object; the caller holds the lock"""
+        current = self._objects[resource].get(key)
+        if current is None:
+            raise ApiError(404, f'{resource} "{key[1]}" not found')
+        updated = copy.deepcopy(current)
+        if replace:
+            metadata = updated['metadata']
+            updated = change
+            updated['metadata'] = _merge(dict(metadata), change.get('metadata') or {})
+        else:
+            _merge(updated, change)
+
+        spec_changed = updated.get('spec') != current.get('spec')
+        if spec_changed:
+            updated['metadata']['generation'] = current['metadata'].get('generation', 1) + 1
+        self._put(resource, key, updated, 'MODIFIED')
+        if resource == 'deployments' and spec_changed:
+            self._start_rollout(key, updated['metadata']['generation'])
+        return updated
+
+    def _delete_collection(self, resource: str, namespace: Optional[str],
+                           query: Dict[str, str]) -> Dict[str, Any]:
+        with self._changed:
+            matched = [
+                key for key, obj in self._objects[resource].items()
+                if (namespace is None or key[0] == namespace)
+                and _match_labels(obj['metadata'].get('labels') or {}, query.get('labelSelector'))
+                and _match_fields(obj, query.get('fieldSelector'))
+            ]
+            items = [self._delete(resource, key) for key in matched]
+            return {'kind': f"{RESOURCES[resource][1]}List", 'apiVersion': 'v1',
+                    'metadata': {'resourceVersion': str(self._resource_version)}, 'items': items}
+
+    # ======================
+    # WATCH
+    # ======================
+    def _watch_events(self, resource: str, namespace: Optional[str], query: Dict[str, str],
+                      deadline: float) -> Iterator[Dict[str, Any]]:
+        """Yield watch events for a resource until the deadline or server stop"""
+        label_selector = query.get('labelSelector')
+        field_selector = query.get('fieldSelector')
+
+        def visible(obj):
+            return ((namespace is None or obj['metadata'].get('namespace', '') == namespace)
+                    and _match_labels(obj['metadata'].get('labels') or {}, label_selector)
+                    and _match_fields(obj, field_selector))
+
+        with self._changed:
+            resource_version = query.get('resourceVersion')
+            if resource_version in (None, '', '0'):
+                # Start with the current state, like a real API server
+                initial = [obj for obj in self._objects[resource].values() if visible(obj)]
+                position = self._resource_version
+            else:
+                position = int(resource_version)
+                if position < self._truncated_at:
+                    yield {'type': 'ERROR', 'object': ApiError(410, f"too old resource version: {position}").status()}
+                    return
+                initial = []
+        for obj in initial:
+            yield {'type': 'ADDED', 'object': obj}
+
+        while True:
+            with self._changed:
+                start = bisect.bisect_right(self._event_versions, position)
+                pending = [(rv, event_type, obj) for rv, kind, event_type, obj in self._events[start:]
+                           if kind == resource]
+                if not pending:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0 or self._stopping:
+                        return
+                    self._changed.wait(min(remaining, 1.0))
+                    continue
+                position = pending[-1][0]
+            for _, event_type, obj in pending:
+                if visible(obj):
+                    yield {'type': event_type, 'object': obj}
+
+    def _watch(self, request: BaseHTTPRequestHandler, resource: str, namespace: Optional[str],
+               query: Dict[str, str]) -> None:
+        timeout = int(query.get('timeoutSeconds') or self.watch_timeout)
+        request.send_response(200)
+        request.send_header('Content-Type', 'application/json')
+        request.send_header('Transfer-Encoding', 'chunked')
+        request.end_headers()
+        try:
+            for event in self._watch_events(resource, namespace, query, time.monotonic() + timeout):
+                line = _dumps(event) + b'\n'
+                request.wfile.write(f"{len(line):x}\r\n".encode() + line + b"\r\n")
+                request.wfile.flush()
+            request.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+# AWS services EKSClient talks to
+EKS_SERVICES = ('eks', 'ec2', 'iam', 'sts')
+
+
+class EKSHarness:
+    """EKSClient running against moto's in-memory AWS backends
+
+    Every AWS call made by a client from client() is delayed by `latency`
+    seconds, like a round trip to the real endpoints, and counted by service
+    and operation. measure() groups those calls under a scenario name together
+    with the scenario's wall time. Requires moto (``pip install -e ".[bench]"``).
+
+    Attributes:
+        latency: Seconds every AWS call is delayed before moto answers it
+        results: Measured scenarios, keyed by name, each with 'calls' (total),
+            'operations' ({"service:Operation": count}) and 'seconds'
+    """
+
+    def __init__(self, region: str = "us-west-2", latency: float = 0.0):
+        """Initialize the harness; nothing is mocked before start()
+
+        Args:
+            region: AWS region of the clients
+            latency: Seconds every AWS call is delayed
+        """
+        # moto is a test dependency only
+        from moto import mock_aws
+
+        self.region = region
+        self.latency = latency
+        self.results: Dict[str, Dict[str, Any]] = {}
+        # AWS managed policies are needed to attach the EKS policies to new roles
+        self._mock = mock_aws(config={'iam': {'load_aws_managed_policies': True}})
+        self._calls: Optional[Counter] = None
+        self._lock = threading.Lock()
+
+    def start(self) -> 'EKSHarness':
+        """Start mocking AWS and load the backends, so their set-up is not measured"""
+        import boto3
+
+        from . import metrics
+
+        self._mock.start()
+        boto3.client('iam', region_name=self.region).list_roles()
+        boto3.client('ec2', region_name=self.region).describe_subnets()
+        boto3.client('eks', region_name=self.region).list_clusters()
+        metrics.add_hook(self._count)
+        return self
+
+    def stop(self) -> None:
+        """Stop mocking AWS, discarding every resource created"""
+        from . import metrics
+
+        metrics.remove_hook(self._count)
+        self._mock.stop()
+
+    def __enter__(self) -> 'EKSHarness':
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+    def client(self, **kwargs: Any) -> Any:
+        """Create an EKSClient whose calls are delayed and counted
+
+        Client-side rate limiting is off unless `qps` is given, so only the
+        client's own calls are measured. Each client gets its own discovery
+        cache, so nothing discovered in another mocked account is reused.
+        """
+        from .core import EKSClient
+        from .discovery import DiscoveryCache
+
+        kwargs.setdefault('qps', None)
+        kwargs.setdefault('discovery_cache', DiscoveryCache())
+        eks = EKSClient(region=self.region, **kwargs)
+        for service in EKS_SERVICES:
+            getattr(eks, f"{service}_client").meta.events.register('before-call', self._delay)
+        return eks
+
+    def _delay(self, **kwargs: Any) -> None:
+        if self.latency:
+            time.sleep(self.latency)
+
+    def _count(self, event: Dict[str, Any]) -> None:
+        if event['api'] != 'aws':
+            return
+        with self._lock:
+            if self._calls is not None:
+                self._calls[f"{event['resource']}:{event['call']}"] += 1
+
+    @contextlib.contextmanager
+    def measure(self, name: str) -> Iterator[Dict[str, Any]]:
+        """Count the AWS calls and wall time of the enclosed block as scenario `name`
+
+        Yields:
+            The scenario's result, filled in when the block exits
+        """
+        result: Dict[str, Any] = {}
+        with self._lock:
+            self._calls = Counter()
+        start = time.perf_counter()
+        try:
+            yield result
+        finally:
+            seconds = time.perf_counter() - start
+            with self._lock:
+                calls, self._calls = self._calls, None
+            result.update(calls=sum(calls.values()), operations=dict(sorted(calls.items())),
+                          seconds=round(seconds, 3))
+            self.results[name] = result
@@ -2,12 +2,18 @@
 Utility functions for k8s-helper
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterable, Iterator, BinaryIO
 import yaml
 import json
+import copy
+import gzip
+import hashlib
+import os
 from datetime import datetime, timezone
 import re
 
+from .config import TABLE_MAX_COLUMN_WIDTH
+
 
 def format_age(timestamp) -> str:
     """Format a timestamp to show age (e.g., '2d', '3h', '45m')"""
@@ -36,35 +42,58 @@ def format_age(timestamp) -> str:
         return "Just now"
 
 
-def format_resource_table(resources: List[Dict[str, Any]], headers: List[str]) -> str:
-    """Format a list of resources as a table"""
+def format_resource_table(resources: List[Dict[str, Any]], headers: List[str],
+                          show_header: bool = True,
+                          col_widths: Optional[Dict[str, int]] = None) -> str:
+    """Format a list of resources as a table
+    
+    When printing a table page by page, pass the same (initially empty)
+    col_widths dictionary for every page: the first page fixes the widths,
+    capped at TABLE_MAX_COLUMN_WIDTH, and cells on later pages that do not
+    fit are truncated so the columns stay aligned under the header.
+    """
     if not resources:
         return "No resources found"
     
-    # Calculate column widths
-    col_widths = {}
-    for header in headers:
-        col_widths[header] = len(header)
+    paged = col_widths is not None
+    if col_widths is None:
+        col_widths = {}
     
-    for resource in resources:
+    # Calculate column widths
+    if not col_widths:
         for header in headers:
-            value = str(resource.get(header, 'N/A'))
-            col_widths[header] = max(col_widths[header], len(value))
+            col_widths[header] = len(header)
+        
+        for resource in resources:
+            for header in headers:
+                value = str(resource.get(header, 'N/A'))
+                col_widths[header] = max(col_widths[header], len(value))
+        
+        if paged:
+            for header in headers:
+                col_widths[header] = min(col_widths[header], max(len(header), TABLE_MAX_COLUMN_WIDTH))
+    
+    def cell(resource: Dict[str, Any], header: str) -> str:
+        value = str(resource.get(header, 'N/A'))
+        if len(value) > col_widths[header]:
+            value = value[:col_widths[header] - 1] + "…"
+        return value.ljust(col_widths[header])
     
     # Build the table
     header_line = " | ".join(header.ljust(col_widths[header]) for header in headers)
     separator = "-" * len(header_line)
     
-    lines = [header_line, separator]
+    lines = [header_line, separator] if show_header else []
     
     for resource in resources:
-        row = " | ".join(str(resource.get(header, 'N/A')).ljust(col_widths[header]) for header in headers)
+        row = " | ".join(cell(resource, header) for header in headers)
         lines.append(row)
     
     return "\n".join(lines)
 
 
-def format_pod_list(pods: List[Dict[str, Any]]) -> str:
+def format_pod_list(pods: List[Dict[str, Any]], show_header: bool = True,
+                    col_widths: Optional[Dict[str, int]] = None) -> str:
     """Format pod list for display"""
     if not pods:
         return "No pods found"
@@ -81,10 +110,12 @@ def format_pod_list(pods: List[Dict[str, Any]]) -> str:
         }
         formatted_pods.append(formatted_pod)
     
-    return format_resource_table(formatted_pods, ['NAME', 'READY', 'STATUS', 'RESTARTS', 'AGE', 'NODE'])
+    return format_resource_table(formatted_pods, ['NAME', 'READY', 'STATUS', 'RESTARTS', 'AGE', 'NODE'],
+                                 show_header=show_header, col_widths=col_widths)
 
 
-def format_deployment_list(deployments: List[Dict[str, Any]]) -> str:
+def format_deployment_list(deployments: List[Dict[str, Any]], show_header: bool = True,
+                           col_widths: Optional[Dict[str, int]] = None) -> str:
     """Format deployment list for display"""
     if not deployments:
         return "No deployments found"
@@ -100,7 +131,8 @@ def format_deployment_list(deployments: List[Dict[str, Any]]) -> str:
         }
         formatted_deployments.append(formatted_deployment)
     
-    return format_resource_table(formatted_deployments, ['NAME', 'READY', 'UP-TO-DATE', 'AVAILABLE', 'AGE'])
+    return format_resource_table(formatted_deployments, ['NAME', 'READY', 'UP-TO-DATE', 'AVAILABLE', 'AGE'],
+                                 show_header=show_header, col_widths=col_widths)
 
 
 def format_service_list(services: List[Dict[str, Any]]) -> str:
@@ -182,6 +214,90 @@ def parse_labels(labels_string: str) -> Dict[str, str]:
     return parse_env_vars(labels_string)  # Same format
 
 
+def parse_equality_selector(selector: str) -> Optional[Dict[str, str]]:
+    """Parse a label selector made only of equality terms like 'app=web,tier==front'
+    
+    Returns:
+        The selector as a dictionary, or None if it uses set-based or
+        inequality terms that cannot be matched with a plain label lookup
+    """
+    labels = {}
+    if not selector:
+        return labels
+    
+    for term in selector.split(','):
+        if '!' in term or '=' not in term:
+            return None
+        key, value = term.split('==', 1) if '==' in term else term.split('=', 1)
+        key, value = key.strip(), value.strip()
+        if not key or ' ' in key or ' ' in value:
+            return None
+        labels[key] = value
+    
+    return labels
+
+
+def log_timestamp_key(line: str) -> str:
+    """Sort key for a log line prefixed with an RFC 3339 timestamp (kubectl logs --timestamps)
+    
+    The API server trims trailing zeros from fractional seconds, so the fraction
+    is padded to nanoseconds to keep string comparison chronological.
+    """
+    timestamp = line.split(' ', 1)[0]
+    seconds, _, fraction = timestamp.rstrip('Z').partition('.')
+    return f"{seconds}.{fraction.ljust(9, '0')}"
+
+
+def log_timestamp(line: str) -> Optional[datetime]:
+    """Get the timestamp prefixed to a log line, truncated to whole seconds"""
+    try:
+        return datetime.strptime(line[:19], '%Y-%m-%dT%H:%M:%S').replace(tzinfo=timezone.utc)
+    except ValueError:
+        return None
+
+
+def parse_duration(duration: str) -> int:
+    """Parse a duration like '30s', '5m', '2h' or '1d' (or plain seconds) into seconds"""
+    units = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+    match = re.fullmatch(r'(\d+)([smhd]?)', duration.strip())
+    if not match:
+        raise ValueError(f"Invalid duration: {duration}")
+    value, unit = match.groups()
+    return int(value) * units.get(unit or 's')
+
+
+# File name suffix for each supported log export compression
+COMPRESSION_SUFFIXES = {None: '', 'gzip': '.gz', 'zstd': '.zst'}
+
+
+def open_compressed(path: str, compression: Optional[str] = None) -> BinaryIO:
+    """Open a file for binary writing, optionally compressing with gzip or zstd"""
+    if compression not in COMPRESSION_SUFFIXES:
+        raise ValueError(f"Unsupported compression: {compression}")
+    if compression == 'gzip':
+        return gzip.open(path, 'wb')
+    if compression == 'zstd':
+        try:
+            import zstandard
+        except ImportError:
+            raise ValueError("zstd compression requires the zstandard package "
+                             "(pip install k8s-helper-cli[zstd])")
+        return zstandard.ZstdCompressor().stream_writer(open(path, 'wb'))
+    return open(path, 'wb')
+
+
+def iter_chunks(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Group an iterable into lists of at most `size` items"""
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
 def safe_get(dictionary: Dict, key: str, default: Any = None) -> Any:
     """Safely get a value from a dictionary with nested key support"""
     try:
@@ -223,10 +339,37 @@ def print_status(message: str, status: str = "info"):
     print(f"{emoji} {message}")
 
 
+def _volume_mounts_manifest(volume_mounts: List[Dict]) -> List[Dict[str, Any]]:
+    """Convert volume mount specifications (name, mount_path, read_only) to manifest form"""
+    return [{"name": vm.get('name'), "mountPath": vm.get('mount_path'),
+             "readOnly": vm.get('read_only', False)} for vm in volume_mounts]
+
+
+def _volume_manifest(volume: Dict) -> Optional[Dict[str, Any]]:
+    """Convert a volume specification (see K8sClient.create_deployment) to manifest form"""
+    volume_type = volume.get('type')
+    if volume_type == 'pvc':
+        return {"name": volume['name'], "persistentVolumeClaim": {"claimName": volume['claim_name']}}
+    if volume_type == 'secret':
+        return {"name": volume['name'], "secret": {"secretName": volume['secret_name']}}
+    if volume_type == 'configmap':
+        return {"name": volume['name'], "configMap": {"name": volume['config_map_name']}}
+    if volume_type == 'empty_dir':
+        return {"name": volume['name'], "emptyDir": {}}
+    return None
+
+
 def create_deployment_manifest(name: str, image: str, replicas: int = 1, 
-                             port: int = 80, env_vars: Optional[Dict[str, str]] = None,
-                             labels: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
-    """Create a deployment manifest dictionary"""
+                               port: int = 80, env_vars: Optional[Dict[str, str]] = None,
+                               labels: Optional[Dict[str, str]] = None,
+                               init_containers: Optional[List[Dict]] = None,
+                               volume_mounts: Optional[List[Dict]] = None,
+                               volumes: Optional[List[Dict]] = None) -> Dict[str, Any]:
+    """Create a deployment manifest dictionary
+    
+    init_containers, volume_mounts and volumes take the same specifications
+    as K8sClient.create_deployment.
+    """
     if labels is None:
         labels = {"app": name}
     
@@ -267,8 +410,31 @@ def create_deployment_manifest(name: str, image: str, replicas: int = 1,
         }
     }
     
+    pod_spec = manifest["spec"]["template"]["spec"]
     if env_list:
-        manifest["spec"]["template"]["spec"]["containers"][0]["env"] = env_list
+        pod_spec["containers"][0]["env"] = env_list
+    
+    if volume_mounts:
+        pod_spec["containers"][0]["volumeMounts"] = _volume_mounts_manifest(volume_mounts)
+    
+    if init_containers:
+        pod_spec["initContainers"] = []
+        for init_container in init_containers:
+            init_manifest = {"name": init_container['name'], "image": init_container['image']}
+            if init_container.get('command'):
+                init_manifest["command"] = init_container['command']
+            if init_container.get('args'):
+                init_manifest["args"] = init_container['args']
+            if init_container.get('env_vars'):
+                init_manifest["env"] = [{"name": k, "value": v} for k, v in init_container['env_vars'].items()]
+            if init_container.get('volume_mounts'):
+                init_manifest["volumeMounts"] = _volume_mounts_manifest(init_container['volume_mounts'])
+            pod_spec["initContainers"].append(init_manifest)
+    
+    if volumes:
+        volume_list = [v for v in (_volume_manifest(volume) for volume in volumes) if v]
+        if volume_list:
+            pod_spec["volumes"] = volume_list
     
     return manifest
 
@@ -299,3 +465,79 @@ def create_service_manifest(name: str, port: int, target_port: int,
     }
     
     return manifest
+
+
+# Annotation recording the content hash of the manifest an object was applied from
+SPEC_HASH_ANNOTATION = "k8s-helper.io/spec-hash"
+
+
+def manifest_hash(manifest: Dict[str, Any]) -> str:
+    """Hash a manifest's content, ignoring its own spec-hash annotation"""
+    content = copy.deepcopy(manifest)
+    annotations = content.get('metadata', {}).get('annotations') or {}
+    annotations.pop(SPEC_HASH_ANNOTATION, None)
+    if not annotations:
+        content.get('metadata', {}).pop('annotations', None)
+    
+    encoded = json.dumps(content, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(encoded.encode()).hexdigest()[:16]
+
+
+def with_spec_hash(manifest: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a copy of a manifest annotated with its content hash"""
+    annotated = copy.deepcopy(manifest)
+    metadata = annotated.setdefault('metadata', {})
+    metadata.setdefault('annotations', {})[SPEC_HASH_ANNOTATION] = manifest_hash(manifest)
+    return annotated
+
+
+# Apply order for manifest kinds: objects in a tier may depend on earlier tiers.
+# Kinds not listed are applied with the workloads.
+MANIFEST_TIERS = [
+    ('namespaces', {'Namespace', 'CustomResourceDefinition', 'StorageClass', 'PriorityClass'}),
+    ('config', {'ServiceAccount', 'Secret', 'ConfigMap', 'PersistentVolume', 'PersistentVolumeClaim',
+                'Role', 'ClusterRole', 'RoleBinding', 'ClusterRoleBinding',
+                'LimitRange', 'ResourceQuota'}),
+    ('workloads', {'Deployment', 'StatefulSet', 'DaemonSet', 'ReplicaSet', 'Pod', 'Job', 'CronJob'}),
+    ('services', {'Service', 'Ingress', 'HorizontalPodAutoscaler', 'PodDisruptionBudget', 'NetworkPolicy'}),
+]
+
+MANIFEST_EXTENSIONS = ('.yaml', '.yml', '.json')
+
+
+def manifest_tier(manifest: Dict[str, Any]) -> int:
+    """Get the index of the MANIFEST_TIERS tier a manifest is applied in"""
+    kind = manifest.get('kind')
+    for index, (_, kinds) in enumerate(MANIFEST_TIERS):
+        if kind in kinds:
+            return index
+    return 2
+
+
+def load_manifests(path: str) -> Iterator[Dict[str, Any]]:
+    """Load Kubernetes objects from a YAML file or a directory of YAML files
+    
+    Documents are parsed one at a time with the libyaml loader when PyYAML was
+    built with it. Directories are walked recursively in name order, empty
+    documents are skipped and List objects are expanded into their items.
+    """
+    if os.path.isdir(path):
+        files = sorted(
+            os.path.join(root, name)
+            for root, _, names in os.walk(path)
+            for name in names
+            if name.endswith(MANIFEST_EXTENSIONS)
+        )
+    else:
+        files = [path]
+    
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    for file_path in files:
+        with open(file_path) as f:
+            for document in yaml.load_all(f, Loader=loader):
+                if not document:
+                    continue
+                if document.get('kind', '').endswith('List') and 'items' in document:
+                    yield from document['items']
+                else:
+                    yield document
@@ -0,0 +1,120 @@
+"""
+Adaptive polling of long-running AWS operations for k8s-helper
+
+A Waiter polls the status of one or more resources, such as an EKS cluster
+and its node groups, until every one reaches the wanted status. Each resource
+is checked on its own schedule: a short first interval that grows
+exponentially up to a cap, with jitter so concurrent waiters do not poll in
+lockstep. Status transitions are reported to a progress callback, and
+transient errors (throttling, 5xx, connection problems) are waited out
+instead of ending the wait.
+"""
+
+import heapq
+import random
+import time
+from typing import Callable, Dict, Iterable, Optional
+
+from .config import EKS_WAIT_INITIAL_DELAY, EKS_WAIT_MAX_DELAY, EKS_WAIT_MULTIPLIER
+from .ratelimit import is_transient_aws_error
+
+
+# Called with (resource, status, previous status or None, seconds since the wait started)
+ProgressCallback = Callable[[str, str, Optional[str], float], None]
+
+
+class WaitFailed(Exception):
+    """A resource reached a status from which the wanted status cannot follow"""
+
+    def __init__(self, resource: str, status: str):
+        super().__init__(f"{resource} reached status {status}")
+        self.resource = resource
+        self.status = status
+
+
+class Waiter:
+    """Polls status checks with exponentially growing, jittered intervals"""
+
+    def __init__(self, initial_delay: float = EKS_WAIT_INITIAL_DELAY,
+                 multiplier: float = EKS_WAIT_MULTIPLIER, max_delay: float = EKS_WAIT_MAX_DELAY,
+                 jitter: float = 0.2,
+                 is_transient: Callable[[Exception], bool] = is_transient_aws_error):
+        """Initialize the waiter
+
+        Args:
+            initial_delay: Seconds between the first and second check
+            multiplier: Factor the interval grows by after every check
+            max_delay: Upper bound for an interval
+            jitter: Fraction by which an interval is randomly shortened or lengthened
+            is_transient: Decides whether an error raised by a check is waited out
+        """
+        self.initial_delay = initial_delay
+        self.multiplier = multiplier
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.is_transient = is_transient
+
+    def delay(self, attempt: int) -> float:
+        """Seconds to wait after check number `attempt` (0-based)"""
+        delay = min(self.max_delay, self.initial_delay * self.multiplier ** attempt)
+        return delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def wait(self, checks: Dict[str, Callable[[], str]], timeout: float,
+             success: str = 'ACTIVE', failure: Iterable[str] = (),
+             on_progress: Optional[ProgressCallback] = None) -> Dict[str, Optional[str]]:
+        """Poll every check until all report `success`, one reports a failure, or time runs out
+
+        Args:
+            checks: Resource name mapped to a callable returning its current status
+            timeout: Seconds to wait in total
+            success: Status every resource has to reach
+            failure: Statuses that end the wait with WaitFailed
+            on_progress: Called whenever a resource's status changes, including
+                the first status seen
+
+        Returns:
+            The last status of every resource (None if it could never be read);
+            all equal to `success` unless the wait timed out
+
+        Raises:
+            WaitFailed: A resource reached one of the `failure` statuses
+        """
+        failure = set(failure)
+        start = time.monotonic()
+        deadline = start + timeout
+        statuses: Dict[str, Optional[str]] = {name: None for name in checks}
+        attempts = {name: 0 for name in checks}
+        # (time of the next check, resource); every resource is checked right away
+        schedule = [(start, name) for name in checks]
+        heapq.heapify(schedule)
+
+        while schedule:
+            due, name = heapq.heappop(schedule)
+            now = time.monotonic()
+            if due > now:
+                time.sleep(due - now)
+
+            try:
+                status = checks[name]()
+            except Exception as e:
+                if not self.is_transient(e):
+                    raise
+                status = statuses[name]
+            else:
+                if status != statuses[name]:
+                    if on_progress:
+                        on_progress(name, status, statuses[name], time.monotonic() - start)
+                    statuses[name] = status
+                if status == success:
+                    continue
+                if status in failure:
+                    raise WaitFailed(name, status)
+
+            now = time.monotonic()
+            if now >= deadline:
+                break
+            next_check = min(now + self.delay(attempts[name]), deadline)
+            attempts[name] += 1
+            heapq.heappush(schedule, (next_check, name))
+
+        return statuses
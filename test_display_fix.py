@@ -60,7 +60,8 @@ class TestDisplayFix(unittest.TestCase):
         # Verify that the EKS client methods were called
         mock_client.get_cluster_status.assert_called_once_with('test-cluster')
         mock_client.create_nodegroup.assert_called_once()
-        mock_client.wait_for_nodegroup_active.assert_called_once_with('test-cluster', 'test-nodegroup')
+        mock_client.wait_for_nodegroup_active.assert_called_once()
+        self.assertEqual(mock_client.wait_for_nodegroup_active.call_args.args, ('test-cluster', 'test-nodegroup'))
 
     @patch('k8s_helper.core.EKSClient')
     def test_create_nodegroup_with_ssh_key(self, mock_eks_client):
@@ -0,0 +1,15 @@
+"""
+Shared fixtures for k8s-helper tests
+"""
+
+import pytest
+
+from k8s_helper.core import reset_api_clients
+
+
+@pytest.fixture(autouse=True)
+def fresh_api_clients():
+    """Give every test its own kubeconfig load instead of a process-wide ApiClient"""
+    reset_api_clients()
+    yield
+    reset_api_clients()
@@ -0,0 +1,158 @@
+"""
+Tests for the asyncio facade
+"""
+
+import asyncio
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from k8s_helper.aio import AsyncK8sClient
+
+
+def _sync_client():
+    """Build a stand-in K8sClient"""
+    client = Mock()
+    client.namespace = "default"
+    return client
+
+
+class TestAsyncK8sClient:
+    """Test cases for AsyncK8sClient"""
+
+    def test_calls_run_concurrently_off_the_loop(self):
+        """Test blocking calls are awaited concurrently instead of one after another"""
+        sync = _sync_client()
+
+        def slow_list_pods(**kwargs):
+            time.sleep(0.2)
+            return [{'name': "web-1"}]
+        sync.list_pods.side_effect = slow_list_pods
+
+        async def main():
+            async with AsyncK8sClient(client=sync, max_workers=10) as k8s:
+                start = time.perf_counter()
+                results = await asyncio.gather(*(k8s.list_pods(label_selector="app=web") for _ in range(10)))
+                return results, time.perf_counter() - start
+
+        results, elapsed = asyncio.run(main())
+
+        assert results == [[{'name': "web-1"}]] * 10
+        assert elapsed < 1.0
+        sync.list_pods.assert_called_with(label_selector="app=web")
+
+    def test_iter_methods_become_async_iterators(self):
+        """Test generator methods are consumed with async for"""
+        sync = _sync_client()
+        sync.iter_pods.side_effect = lambda **kwargs: iter({'name': f"web-{i}"} for i in range(5))
+
+        async def main():
+            async with AsyncK8sClient(client=sync) as k8s:
+                return [pod['name'] async for pod in k8s.iter_pods(page_size=2)]
+
+        assert asyncio.run(main()) == [f"web-{i}" for i in range(5)]
+
+    @patch('k8s_helper.aio.watch.Watch')
+    def test_watch_streams_events_and_stops(self, mock_watch_class):
+        """Test watch events are delivered and the watch is stopped when the consumer leaves"""
+        sync = _sync_client()
+        events = [{'type': 'ADDED', 'object': f"web-{i}"} for i in range(3)]
+        mock_watch_class.return_value.stream.return_value = iter(events)
+
+        async def main():
+            async with AsyncK8sClient(client=sync) as k8s:
+                received = []
+                async for event in k8s.watch("pods", timeout_seconds=30, label_selector="app=web"):
+                    received.append(event['object'])
+                    if len(received) == 2:
+                        break
+                return received
+
+        assert asyncio.run(main()) == ["web-0", "web-1"]
+        mock_watch_class.return_value.stream.assert_called_once_with(
+            sync.core_v1.list_namespaced_pod, namespace="default",
+            timeout_seconds=30, label_selector="app=web"
+        )
+        mock_watch_class.return_value.stop.assert_called()
+
+    def test_with_namespace_shares_thread_pool(self):
+        """Test namespace views reuse the parent's threads"""
+        sync = _sync_client()
+        sync.with_namespace.return_value.namespace = "staging"
+
+        k8s = AsyncK8sClient(client=sync)
+        view = k8s.with_namespace("staging")
+
+        assert view.namespace == "staging"
+        assert view._executor is k8s._executor
+        asyncio.run(k8s.close())
+
+    def test_watch_rejects_unknown_kind(self):
+        """Test only supported kinds can be watched"""
+        k8s = AsyncK8sClient(client=_sync_client())
+
+        with pytest.raises(ValueError):
+            k8s.watch("nodes")
+        asyncio.run(k8s.close())
+
+
+class TestAsyncK8sClientAgainstFakeServer:
+    """AsyncK8sClient driving a real K8sClient against the in-process fake API server"""
+
+    @pytest.fixture
+    def server(self):
+        from k8s_helper.testing import FakeKubeServer
+        with FakeKubeServer() as fake:
+            yield fake
+
+    @pytest.fixture
+    def k8s(self, server, tmp_path):
+        from k8s_helper.core import K8sClient
+        return K8sClient(config_file=server.write_kubeconfig(tmp_path / "kubeconfig"))
+
+    def test_open_streams_do_not_starve_calls(self, server, k8s):
+        """Test lists keep completing while more watches are open than there are call workers"""
+        server.seed("pods", 50)
+
+        async def watch_for(client, name):
+            async for event in client.watch("services", timeout_seconds=10):
+                if event['type'] == 'ADDED' and event['object'].metadata.name == name:
+                    return name
+
+        async def main():
+            async with AsyncK8sClient(client=k8s, max_workers=2, max_streams=4) as client:
+                watches = [asyncio.ensure_future(watch_for(client, "web")) for _ in range(4)]
+                await asyncio.sleep(0.2)
+                lists = await asyncio.wait_for(
+                    asyncio.gather(*(client.list_pods() for _ in range(10))), timeout=5)
+                await client.create_service("web", port=80, target_port=8080)
+                return lists, await asyncio.wait_for(asyncio.gather(*watches), timeout=5)
+
+        lists, watched = asyncio.run(main())
+
+        assert [len(pods) for pods in lists] == [50] * 10
+        assert watched == ["web"] * 4
+
+    def test_log_streams_run_alongside_lists(self, server, k8s):
+        """Test concurrent log streams and lists each get their own results"""
+        server.seed("pods", 3)
+        names = [f"pod-{i:05d}" for i in range(3)]
+        for name in names:
+            server.logs[("default", name)] = "".join(f"{name} line {n}\n" for n in range(100))
+
+        async def read_log(client, name):
+            return [line async for line in client.stream_logs(name)]
+
+        async def main():
+            async with AsyncK8sClient(client=k8s, max_workers=2, max_streams=2) as client:
+                return await asyncio.wait_for(asyncio.gather(
+                    *(read_log(client, name) for name in names),
+                    *(client.list_pods() for _ in range(5))
+                ), timeout=10)
+
+        results = asyncio.run(main())
+
+        for name, lines in zip(names, results):
+            assert lines == [f"{name} line {n}" for n in range(100)]
+        assert [len(pods) for pods in results[3:]] == [3] * 5
@@ -0,0 +1,134 @@
+"""
+Benchmarks of the real K8sClient against the in-process fake API server
+
+Requires pytest-benchmark (``pip install -e ".[bench]"``) and is skipped
+without it. Run with ``make bench``; results are saved under .benchmarks/ so
+that ``make bench-compare`` can compare a change against the last run. Each
+benchmark records the API requests it made and its peak traced memory in
+extra_info. Set K8S_HELPER_BENCH_SIZES (default "1000,10000,50000") to choose
+the namespace sizes.
+"""
+
+import os
+import timeit
+import tracemalloc
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from k8s_helper.core import K8sClient
+from k8s_helper.testing import FakeKubeServer
+
+
+SIZES = [int(size) for size in os.environ.get("K8S_HELPER_BENCH_SIZES", "1000,10000,50000").split(",")]
+
+# Deployments created or awaited per round by the write benchmarks
+WRITE_BATCH = 100
+
+
+@pytest.fixture(scope="module", params=SIZES, ids=lambda size: f"{size}-objects")
+def seeded_server(request):
+    """A fake API server holding `size` pods"""
+    with FakeKubeServer() as server:
+        server.seed("pods", request.param)
+        server.size = request.param
+        yield server
+
+
+@pytest.fixture
+def server():
+    """An empty fake API server whose deployments roll out after a short delay"""
+    with FakeKubeServer(rollout_delay=0.01) as fake:
+        yield fake
+
+
+def _client(server, tmp_path):
+    """A K8sClient without client-side rate limiting, so the client itself is measured"""
+    return K8sClient(config_file=server.write_kubeconfig(tmp_path / "kubeconfig"), qps=None)
+
+
+def _record(benchmark, server, func, **extra):
+    """Run func once more with tracing on, recording peak memory and request counts"""
+    server.request_counts.clear()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    benchmark.extra_info.update(
+        extra,
+        requests=sum(server.request_counts.values()),
+        peak_memory_mb=round(peak / 2 ** 20, 1)
+    )
+
+
+@pytest.mark.parametrize("fast", [False, True], ids=["models", "raw-json"])
+def test_list_pods(benchmark, seeded_server, tmp_path, fast):
+    """List every pod in a namespace through the model and the raw JSON paths"""
+    k8s = _client(seeded_server, tmp_path)
+
+    pods = benchmark.pedantic(k8s.list_pods, kwargs={'fast': fast}, rounds=3, warmup_rounds=1)
+
+    assert len(pods) == seeded_server.size
+    _record(benchmark, seeded_server, lambda: k8s.list_pods(fast=fast), objects=seeded_server.size)
+
+
+def test_raw_json_list_beats_models(benchmark, seeded_server, tmp_path):
+    """List pods through the raw JSON path and check it is faster than the model path"""
+    k8s = _client(seeded_server, tmp_path)
+
+    def best_of_three(fast):
+        return min(timeit.repeat(lambda: k8s.list_pods(fast=fast), number=1, repeat=3))
+
+    pods = benchmark.pedantic(k8s.list_pods, kwargs={'fast': True}, rounds=3, warmup_rounds=1)
+    models_seconds, raw_seconds = best_of_three(False), best_of_three(True)
+
+    assert len(pods) == seeded_server.size
+    benchmark.extra_info.update(objects=seeded_server.size, speedup=round(models_seconds / raw_seconds, 1))
+    assert raw_seconds < models_seconds
+
+
+def test_count_namespace_resources(benchmark, seeded_server, tmp_path):
+    """Count pods, deployments and services from list metadata"""
+    k8s = _client(seeded_server, tmp_path)
+
+    counts = benchmark.pedantic(k8s.get_namespace_resources, rounds=5, warmup_rounds=1)
+
+    assert counts['pods'] == seeded_server.size
+    _record(benchmark, seeded_server, k8s.get_namespace_resources, objects=seeded_server.size)
+
+
+def test_create_deployments(benchmark, server, tmp_path):
+    """Create a batch of deployments one request after another"""
+    k8s = _client(server, tmp_path)
+
+    def create_batch():
+        for i in range(WRITE_BATCH):
+            k8s.create_deployment(f"web-{i}", "nginx:1.25", replicas=2)
+
+    benchmark.pedantic(create_batch, setup=lambda: server.clear("deployments"), rounds=3)
+
+    assert server.count("deployments") == WRITE_BATCH
+    server.clear("deployments")
+    _record(benchmark, server, create_batch, objects=WRITE_BATCH)
+
+
+def test_wait_for_deployments_ready(benchmark, server, tmp_path):
+    """Wait for a batch of rolling-out deployments through a single watch"""
+    k8s = _client(server, tmp_path)
+    names = [f"web-{i}" for i in range(WRITE_BATCH)]
+
+    def start_rollouts():
+        server.clear("deployments")
+        for name in names:
+            k8s.create_deployment(name, "nginx:1.25", replicas=2)
+
+    results = benchmark.pedantic(k8s.wait_for_deployments_ready, args=(names,),
+                                 kwargs={'timeout': 60}, setup=start_rollouts, rounds=3)
+
+    assert all(results.values())
+    start_rollouts()
+    _record(benchmark, server, lambda: k8s.wait_for_deployments_ready(names, timeout=60),
+            objects=WRITE_BATCH)
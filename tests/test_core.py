@@ -2,11 +2,16 @@
 Tests for k8s-helper core functionality
 """
 
+import gzip
+import itertools
+import json
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from kubernetes.client.rest import ApiException
+from botocore.exceptions import ClientError
+from kubernetes.utils import FailToCreateError
 
-from k8s_helper.core import K8sClient
+from k8s_helper.core import K8sClient, EKSClient, MultiRegionEKS
 from k8s_helper.utils import (
     format_age, 
     validate_name, 
@@ -16,10 +21,62 @@ from k8s_helper.utils import (
     parse_labels,
     format_pod_list,
     format_deployment_list,
-    format_service_list
+    format_service_list,
+    iter_chunks,
+    create_deployment_manifest,
+    load_manifests,
+    log_timestamp_key,
+    manifest_tier,
+    parse_duration,
+    parse_equality_selector,
+    manifest_hash,
+    with_spec_hash,
+    SPEC_HASH_ANNOTATION
 )
 
 
+def _mock_pod(name):
+    """Build a minimal pod object as returned by the Kubernetes API"""
+    pod = Mock()
+    pod.metadata.name = name
+    pod.status.phase = "Running"
+    pod.status.conditions = []
+    pod.status.container_statuses = []
+    pod.spec.node_name = "node-1"
+    return pod
+
+
+def _mock_page(items, continue_token=None):
+    """Build a list response page carrying an optional continue token"""
+    page = Mock()
+    page.items = items
+    page.metadata._continue = continue_token
+    return page
+
+
+def _mock_deployment(name, replicas=2, ready=0, generation=1, observed_generation=1):
+    """Build a deployment object with the status fields used for readiness"""
+    deployment = Mock()
+    deployment.metadata.name = name
+    deployment.metadata.generation = generation
+    deployment.metadata.resource_version = "10"
+    deployment.spec.replicas = replicas
+    deployment.status.ready_replicas = ready
+    deployment.status.observed_generation = observed_generation
+    return deployment
+
+
+def _mock_log_stream(chunks, error=None):
+    """Build a raw log response streaming the given chunks, optionally failing afterwards"""
+    def stream(amt=None):
+        yield from chunks
+        if error:
+            raise error
+    response = Mock()
+    response.stream.side_effect = stream
+    return response
+
+
 class TestK8sClient:
     """Test cases for K8sClient class"""
     
@@ -57,6 +114,23 @@ class TestK8sClient:
         mock_load_config.assert_called_once()
         mock_incluster.assert_called_once()
     
+    @patch('k8s_helper.core.config.load_kube_config')
+    @patch('k8s_helper.core.client.AppsV1Api')
+    @patch('k8s_helper.core.client.CoreV1Api')
+    def test_clients_share_api_client(self, mock_core_v1, mock_apps_v1, mock_load_config):
+        """Test kubeconfig is parsed once and the ApiClient is shared across clients"""
+        first = K8sClient(namespace="a", pool_size=50)
+        second = K8sClient(namespace="b")
+        view = first.with_namespace("c")
+        other_context = K8sClient(context="staging")
+        
+        assert first.api_client is second.api_client is view.api_client
+        assert other_context.api_client is not first.api_client
+        assert view.namespace == "c"
+        assert first.api_client.configuration.connection_pool_maxsize == 50
+        assert mock_load_config.call_count == 2
+        mock_apps_v1.assert_called_with(other_context.api_client)
+    
     @patch('k8s_helper.core.config.load_kube_config')
     @patch('k8s_helper.core.client.AppsV1Api')
     @patch('k8s_helper.core.client.CoreV1Api')
@@ -172,6 +246,653 @@ class TestK8sClient:
         assert result == mock_response
         mock_core_v1_instance.create_namespaced_service.assert_called_once()
 
+    
+    @patch('k8s_helper.core.config.load_kube_config')
+    @patch('k8s_helper.core.client.AppsV1Api')
+    @patch('k8s_helper.core.client.CoreV1Api')
+    def test_iter_pods_follows_continue_token(self, mock_core_v1, mock_apps_v1, mock_load_config):
+        """Test pods are fetched page by page using continue tokens"""
+        mock_core_v1_instance = Mock()
+        mock_core_v1.return_value = mock_core_v1_instance
+        mock_core_v1_instance.list_namespaced_pod.side_effect = [
+            _mock_page([_mock_pod("pod-1"), _mock_pod("pod-2")], continue_token="next"),
+            _mock_page([_mock_pod("pod-3")])
+        ]
+        
+        client = K8sClient()
+        pods = client.iter_pods(page_size=2)
+        
+        assert next(pods)['name'] == "pod-1"
+        assert mock_core_v1_instance.list_namespaced_pod.call_count == 1
+        assert [pod['name'] for pod in pods] == ["pod-2", "pod-3"]
+        mock_core_v1_instance.list_namespaced_pod.assert_called_with(
+            limit=2, namespace="default", _continue="next"
+        )
+    
+    @patch('k8s_helper.core.config.load_kube_config')
+    @patch('k8s_helper.core.client.AppsV1Api')
+    @patch('k8s_helper.core.client.CoreV1Api')
+    def test_pods_error_after_first_page_is_not_a_short_list(self, mock_core_v1, mock_apps_v1, mock_load_config):
+        """Test an expired continue token fails the listing instead of truncating it"""
+        mock_core_v1_instance = Mock()
+        mock_core_v1.return_value = mock_core_v1_instance
+        first_page = _mock_page([_mock_pod("pod-1"), _mock_pod("pod-2")], continue_token="next")
+        mock_core_v1_instance.list_namespaced_pod.side_effect = [first_page, ApiException(status=410)]
+        
+        client = K8sClient()
+        pods = client.iter_pods(page_size=2, fast=False)
+        assert [next(pods)['name'], next(pods)['name']] == ["pod-1", "pod-2"]
+        with pytest.raises(ApiException):
+            next(pods)
+        
+        mock_core_v1_instance.list_namespaced_pod.side_effect = [first_page, ApiException(status=410)]
+        assert client.list_pods(page_size=2, fast=False) == []
+    
+    @patch('k8s_helper.core.config.load_kube_config')
+    @patch('k8s_helper.core.client.AppsV1Api')
+    @patch('k8s_helper.core.client.CoreV1Api')
+    def test_list_deployments_api_exception(self, mock_core_v1, mock_apps_v1, mock_load_config):
+        """Test listing deployments returns an empty list on API errors"""
+        mock_apps_v1_instance = Mock()
+        mock_apps_v1.return_value = mock_apps_v1_instance
+        mock_apps_v1_instance.list_namespaced_deployment.side_effect = ApiException("API Error")
+        
+        client = K8sClient()
+        
+        assert client.list_deployments() == []
+    
+    @patch('k8s_helper.core.config.load_kube_config')
+    @patch('k8s_helper.core.client.AppsV1Api')
+    @patch('k8s_helper.core.client.CoreV1Api')
+    def test_list_pods_passes_selectors_to_api(self, mock_core_v1, mock_apps_v1, mock_load_config):
+        """Test selectors are sent to the API server instead of filtered locally"""
+        mock_core_v1_instance = Mock()
+        mock_core_v1.return_value = mock_core_v1_instance
+        mock_core_v1_instance.list_namespaced_pod.return_value = _mock_page([_mock_pod("web-1")])
+        
+        client = K8sClient()
+        pods = client.list_pods(label_selector="app=web", field_selector="status.phase=Running")
+        
+        assert [p['name'] for p in pods] == ["web-1"]
+        mock_core_v1_instance.list_namespaced_pod.assert_called_once_with(
+            limit=500, namespace="default",
+            label_selector="app=web", field_selector="status.phase=Running"
+        )
+    
+    @patch('k8s_helper.core.config.load_kube_config')
+    @patch('k8s_helper.core.client.AppsV1Api')
+    @patch('k8s_helper.core.client.CoreV1Api')
+    def test_get_events_filters_resource_server_side(self, mock_core_v1, mock_apps_v1, mock_load_config):
+        """Test events for a resource are selected with an involvedObject field selector"""
+        mock_core_v1_instance = Mock()
+        mock_core_v1.return_value = mock_core_v1_instance
+        mock_core_v1_instance.list_namespaced_event.return_value = _mock_page([])
+        
+        client = K8sClient()
+        client.get_events("web-1", field_selector="type=Warning")
+        
+        kwargs = mock_core_v1_instance.list_namespaced_event.call_args.kwargs
+        assert kwargs['field_selector'] == "involvedObject.name=web-1,type=Warning"
+        assert 'label_selector' not in kwargs
+
+    
+    @patch('k8s_helper.core.watch.Watch')
+    @patch('k8s_helper.core.config.load_kube_config')
+    @patch('k8s_helper.core.client.AppsV1Api')
+    @patch('k8s_helper.core.client.CoreV1Api')
+    def test_wait_for_deployment_ready_uses_watch(self, mock_core_v1, mock_apps_v1, mock_load_config, mock_watch):
+        """Test readiness is detected from watch events without polling"""
+        mock_apps_v1_instance = Mock()
+        mock_apps_v1.return_value = mock_apps_v1_instance
+        mock_apps_v1_instance.read_namespaced_deployment.return_value = _mock_deployment("web", ready=0)
+        mock_watch.return_value.stream.return_value = iter([
+            {'type': 'MODIFIED', 'object': _mock_deployment("web", ready=1)},
+            {'type': 'MODIFIED', 'object': _mock_deployment("web", ready=2)}
+        ])
+        
+        client = K8sClient()
+        
+        assert client.wait_for_deployment_ready("web", timeout=10) is True
+        mock_apps_v1_instance.read_namespaced_deployment.assert_called_once()
+        _, kwargs = mock_watch.return_value.stream.call_args
+        assert kwargs['field_selector'] == "metadata.name=web"
+        assert kwargs['resource_version'] == "10"
+    
+    @patch('k8s_helper.core.time.sleep')
+    @patch('k8s_helper.core.watch.Watch')
+    @patch('k8s_helper.core.config.load_kube_config')
+    @patch('k8s_helper.core.client.AppsV1Api')
+    @patch('k8s_helper.core.client.CoreV1Api')
+    def test_wait_for_deployment_ready_falls_back_to_polling(self, mock_core_v1, mock_apps_v1, mock_load_config,
+                                                             mock_watch, mock_sleep):
+        """Test polling with backoff is used when the watch fails"""
+        mock_apps_v1_instance = Mock()
+        mock_apps_v1.return_value = mock_apps_v1_instance
+        mock_apps_v1_instance.read_namespaced_deployment.side_effect = [
+            _mock_deployment("web", ready=0),
+            _mock_deployment("web", ready=1),
+            _mock_deployment("web", ready=2)
+        ]
+        mock_watch.return_value.stream.side_effect = ApiException(status=403, reason="Forbidden")
+        
+        client = K8sClient()
+        
+        assert client.wait_for_deployment_ready("web", timeout=10) is True
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.5]
+    
+    @patch('k8s_helper.core.watch.Watch')
+    @patch('k8s_helper.core.config.load_kube_config')
+    @patch('k8s_helper.core.client.AppsV1Api')
+    @patch('k8s_helper.core.client.CoreV1Api')
+    def test_wait_for_deployments_ready_single_watch(self, mock_core_v1, mock_apps_v1, mock_load_config, mock_watch):
+        """Test many deployments are tracked through one namespace watch"""
+        mock_watch.return_value.stream.return_value = iter([
+            {'type': 'ADDED', 'object': _mock_deployment("web", ready=2)},
+            {'type': 'ADDED', 'object': _mock_deployment("other", ready=2)},
+            {'type': 'ADDED', 'object': _mock_deployment("api", ready=0)},
+            {'type': 'MODIFIED', 'object': _mock_deployment("api", ready=2)},
+            {'type': 'MODIFIED', 'object': _mock_deployment("never-read", ready=2)}
+        ])
+        
+        client = K8sClient()
+        results = client.wait_for_deployments_ready(["web", "api"], timeout=10)
+        
+        assert results == {"web": True, "api": True}
+        mock_watch.return_value.stream.assert_called_once()
+        mock_apps_v1.return_value.read_namespaced_deployment.assert_not_called()
+    
+    @patch('k8s_helper.core.time.time')
+    @patch('k8s_helper.core.watch.Watch')
+    @patch('k8s_helper.core.config.load_kube_config')
+    @patch('k8s_helper.core.client.AppsV1Api')
+    @patch('k8s_helper.core.client.CoreV1Api')
+    def test_wait_for_deployments_ready_timeout(self, mock_core_v1, mock_apps_v1, mock_load_config,
+                                                mock_watch, mock_time):
+        """Test deployments that never become ready are reported as False"""
+        mock_time.side_effect = itertools.count(0, 3)
+        mock_watch.return_value.stream.return_value = iter([
+            {'type': 'ADDED', 'object': _mock_deployment("web", ready=2)},
+            {'type': 'ADDED', 'object': _mock_deployment("api", ready=0)}
+        ])
+        
+        client = K8sClient()
+        results = client.wait_for_deployments_ready(["web", "api"], timeout=10)
+        
+        assert results == {"web": True, "api": False}
+    
+    @patch('k8s_helper.core.config.load_kube_config')
+    @patch('k8s_helper.core.client.AppsV1Api')
+    @patch('k8s_helper.core.client.CoreV1Api')
+    def test_stream_logs_yields_lines_across_chunks(self, mock_core_v1, mock_apps_v1, mock_load_config):
+        """Test lines split over several chunks are reassembled"""
+        mock_core_v1_instance = Mock()
+        mock_core_v1.return_value = mock_core_v1_instance
+        response = _mock_log_stream([b"first li", b"ne\nsecond line\nth", b"ird"])
+        mock_core_v1_instance.read_namespaced_pod_log.return_value = response
+        
+        client = K8sClient()
+        lines = list(client.stream_logs("web-1", since_seconds=60, limit_bytes=1024, previous=True))
+        
+        assert lines == ["first line", "second line", "third"]
+        response.release_conn.assert_called_once()
+        kwargs = mock_core_v1_instance.read_namespaced_pod_log.call_args.kwargs
+        assert kwargs['_preload_content'] is False
+        assert (kwargs['since_seconds'], kwargs['limit_bytes'], kwargs['previous']) == (60, 1024, True)
+    
+    @patch('k8s_helper.core.time.sleep')
+    @patch('k8s_helper.core.config.load_kube_config')
+    @patch('k8s_helper.core.client.AppsV1Api')
+    @patch('k8s_helper.core.client.CoreV1Api')
+    def test_stream_logs_follow_resumes_after_drop(self, mock_core_v1, mock_apps_v1, mock_load_config, mock_sleep):
+        """Test a dropped follow stream reconnects and skips lines it already yielded"""
+        mock_core_v1_instance = Mock()
+        mock_core_v1.return_value = mock_core_v1_instance
+        mock_core_v1_instance.read_namespaced_pod_log.side_effect = [
+            _mock_log_stream([b"2024-01-31T12:00:00Z one\n2024-01-31T12:00:01Z two\n"],
+                             error=ConnectionResetError("dropped")),
+            _mock_log_stream([b"2024-01-31T12:00:01Z two\n2024-01-31T12:00:02Z three\n"])
+        ]
+        mock_core_v1_instance.read_namespaced_pod.return_value.status.phase = "Succeeded"
+        
+        client = K8sClient()
+        lines = list(client.stream_logs("web-1", follow=True, tail_lines=10))
+        
+        assert lines == ["one", "two", "three"]
+        resumed = mock_core_v1_instance.read_namespaced_pod_log.call_args.kwargs
+        assert 'tail_lines' not in resumed
+        assert resumed['since_seconds'] >= 1
+        assert resumed['follow'] is True and resumed['timestamps'] is True
+
+    @patch('k8s_helper.core.time.sleep')
+    @patch('k8s_helper.core.config.load_kube_config')
+    @patch('k8s_helper.core.client.AppsV1Api')
+    @patch('k8s_helper.core.client.CoreV1Api')
+    def test_stream_logs_resume_keeps_new_lines_sharing_a_timestamp(self, mock_core_v1, mock_apps_v1,
+                                                                    mock_load_config, mock_sleep):
+        """Test only exact replays are skipped when lines after a reconnect share the last timestamp"""
+        mock_core_v1_instance = Mock()
+        mock_core_v1.return_value = mock_core_v1_instance
+        mock_core_v1_instance.read_namespaced_pod_log.side_effect = [
+            _mock_log_stream([b"2024-01-31T12:00:01Z one\n2024-01-31T12:00:01Z two\n"],
+                             error=ConnectionResetError("dropped")),
+            _mock_log_stream([b"2024-01-31T12:00:01Z one\n2024-01-31T12:00:01Z two\n"
+                              b"2024-01-31T12:00:01Z two\n2024-01-31T12:00:01Z three\n"])
+        ]
+        mock_core_v1_instance.read_namespaced_pod.return_value.status.phase = "Succeeded"
+
+        client = K8sClient()
+        lines = list(client.stream_logs("web-1", follow=True))
+
+        assert lines == ["one", "two", "two", "three"]
+
+    @patch('k8s_helper.core.time.sleep')
+    @patch('k8s_helper.core.config.load_kube_config')
+    @patch('k8s_helper.core.client.AppsV1Api')
+    @patch('k8s_helper.core.client.CoreV1Api')
+    def test_stream_logs_keeps_out_of_order_lines_before_a_reconnect(self, mock_core_v1, mock_apps_v1,
+                                                                     mock_load_config, mock_sleep):
+        """Test lines older than the last one are only skipped while replaying after a reconnect"""
+        mock_core_v1_instance = Mock()
+        mock_core_v1.return_value = mock_core_v1_instance
+        mock_core_v1_instance.read_namespaced_pod_log.side_effect = [
+            _mock_log_stream([b"2024-01-31T12:00:02Z two\n2024-01-31T12:00:01Z late\nno timestamp\n"],
+                             error=ConnectionResetError("dropped")),
+            _mock_log_stream([b"2024-01-31T12:00:01Z late\n2024-01-31T12:00:02Z two\n"
+                              b"2024-01-31T12:00:03Z three\n2024-01-31T12:00:02Z late again\n"])
+        ]
+        mock_core_v1_instance.read_namespaced_pod.return_value.status.phase = "Succeeded"
+
+        client = K8sClient()
+        lines = list(client.stream_logs("web-1", follow=True, timestamps=True))
+
+        assert lines == ["2024-01-31T12:00:02Z two", "2024-01-31T12:00:01Z late", "no timestamp",
+                         "2024-01-31T12:00:03Z three", "2024-01-31T12:00:02Z late again"]
+
+    @patch('k8s_helper.core.config.load_kube_config')
+    @patch('k8s_helper.core.client.AppsV1Api')
+    @patch('k8s_helper.core.client.CoreV1Api')
+    def test_export_logs_writes_compressed_files_and_resumes(self, mock_core_v1, mock_apps_v1,
+                                                             mock_load_config, tmp_path):
+        """Test logs are exported with a manifest and a second run only retries failures"""
+        pods = {"metadata": {}, "items": [
+            {"metadata": {"name": "web-1"}, "spec": {"containers": [{"name": "app"}, {"name": "proxy"}]}},
+            {"metadata": {"name": "web-2"}, "spec": {"containers": [{"name": "app"}]}}
+        ]}
+        fail = {"web-2"}
+        def read_log(name, container, **kwargs):
+            if name in fail:
+                raise ApiException(status=500, reason="Internal error")
+            return _mock_log_stream([f"{name}/{container} line\n".encode()])
+        mock_core_v1_instance = Mock()
+        mock_core_v1.return_value = mock_core_v1_instance
+        mock_core_v1_instance.list_namespaced_pod.return_value = Mock(data=json.dumps(pods).encode())
+        mock_core_v1_instance.read_namespaced_pod_log.side_effect = read_log
+        
+        client = K8sClient()
+        manifest = client.export_logs(str(tmp_path), compression="gzip")
+        
+        assert [(e['file'], e['status']) for e in manifest['files']] == [
+            ("web-1/app.log.gz", "complete"), ("web-1/proxy.log.gz", "complete"),
+            ("web-2/app.log.gz", "failed")
+        ]
+        assert manifest['status'] == "incomplete"
+        assert manifest['files'][0]['bytes'] == len(b"web-1/app line\n")
+        with gzip.open(tmp_path / "web-1" / "app.log.gz") as f:
+            assert f.read() == b"web-1/app line\n"
+        assert not list(tmp_path.rglob("*.part"))
+        
+        fail.clear()
+        mock_core_v1_instance.read_namespaced_pod_log.reset_mock()
+        manifest = client.export_logs(str(tmp_path), compression="gzip")
+        
+        assert manifest['status'] == "complete"
+        assert all(e['status'] == "complete" for e in manifest['files'])
+        mock_core_v1_instance.read_namespaced_pod_log.assert_called_once()
+        assert json.loads((tmp_path / "manifest.json").read_text()) == manifest
+    
+    def test_cli_export_logs_fails_on_api_error_and_partial_export(self, tmp_path):
+        """Test export-logs exits non-zero when listing pods fails or a log could not be exported"""
+        from typer.testing import CliRunner
+        from k8s_helper.cli import app
+        
+        client = Mock()
+        client.export_logs.side_effect = ApiException(status=403, reason="Forbidden")
+        with patch('k8s_helper.cli.get_k8s_client', return_value=client):
+            result = CliRunner().invoke(app, ["export-logs", str(tmp_path), "--namespace", "locked"])
+        
+        assert result.exit_code == 1
+        assert "❌ Failed to list pods in locked: (403) Forbidden" in result.output
+        assert "Traceback" not in result.output
+        
+        client.export_logs.side_effect = None
+        client.export_logs.return_value = {'status': 'incomplete', 'files': [
+            {'pod': "web-1", 'container': "app", 'status': 'complete', 'bytes': 10},
+            {'pod': "web-2", 'container': "app", 'status': 'failed', 'error': "boom"}
+        ]}
+        with patch('k8s_helper.cli.get_k8s_client', return_value=client):
+            result = CliRunner().invoke(app, ["export-logs", str(tmp_path)])
+        
+        assert result.exit_code == 1
+        assert "1 of 2 logs failed" in result.output
+        assert "✅" not in result.output
+    
+    @patch('k8s_helper.core.config.load_kube_config')
+    @patch('k8s_helper.core.client.AppsV1Api')
+    @patch('k8s_helper.core.client.CoreV1Api')
+    def test_logs_by_selector_merges_by_timestamp(self, mock_core_v1, mock_apps_v1, mock_load_config):
+        """Test logs from several pods are merged into one timeline"""
+        logs = {
+            "web-1": "2024-01-31T12:00:00.5Z start\n2024-01-31T12:00:02Z done",
+            "web-2": "2024-01-31T12:00:00.25Z start\n2024-01-31T12:00:01Z working",
+        }
+        mock_core_v1_instance = Mock()
+        mock_core_v1.return_value = mock_core_v1_instance
+        mock_core_v1_instance.read_namespaced_pod_log.side_effect = lambda name, **kwargs: logs[name]
+        
+        client = K8sClient()
+        with patch.object(client, 'iter_pods', return_value=iter([{'name': "web-1"}, {'name': "web-2"}])):
+            lines = list(client.iter_logs_by_selector("app=web", timestamps=True))
+        
+        assert [(pod, line.split()[1]) for pod, line in lines] == [
+            ("web-2", "start"), ("web-1", "start"), ("web-2", "working"), ("web-1", "done")
+        ]
+        assert mock_core_v1_instance.read_namespaced_pod_log.call_args.kwargs['timestamps'] is True
+    
+    @patch('k8s_helper.core.config.load_kube_config')
+    @patch('k8s_helper.core.client.AppsV1Api')
+    @patch('k8s_helper.core.client.CoreV1Api')
+    def test_logs_by_selector_skips_unreadable_pods(self, mock_core_v1, mock_apps_v1, mock_load_config):
+        """Test a pod whose log cannot be read does not stop the others"""
+        def read_log(name, **kwargs):
+            if name == "web-2":
+                raise ApiException(status=400, reason="ContainerCreating")
+            return "line one\nline two"
+        mock_core_v1_instance = Mock()
+        mock_core_v1.return_value = mock_core_v1_instance
+        mock_core_v1_instance.read_namespaced_pod_log.side_effect = read_log
+        
+        client = K8sClient()
+        with patch.object(client, 'iter_pods', return_value=iter([{'name': "web-1"}, {'name': "web-2"}])):
+            lines = list(client.iter_logs_by_selector("app=web"))
+        
+        assert lines == [("web-1", "line one"), ("web-1", "line two")]
+    
+    @patch('k8s_helper.core.k8s_utils.create_from_dict')
+    @patch('k8s_helper.core.config.load_kube_config')
+    @patch('k8s_helper.core.client.AppsV1Api')
+    @patch('k8s_helper.core.client.CoreV1Api')
+    def test_apply_manifests_submits_tiers_in_order(self, mock_core_v1, mock_apps_v1, mock_load_config,
+                                                    mock_create, tmp_path):
+        """Test dependencies are created first and existing objects are reported"""
+        (tmp_path / "app.yaml").write_text(
+            "kind: Service\nmetadata: {name: web}\n---\n"
+            "kind: Deployment\nmetadata: {name: web}\n---\n"
+            "kind: Namespace\nmetadata: {name: shop}\n"
+        )
+        (tmp_path / "config").mkdir()
+        (tmp_path / "config" / "secret.yml").write_text("kind: Secret\nmetadata: {name: creds}\n")
+        
+        def create(api_client, manifest, namespace):
+            if manifest['kind'] == "Secret":
+                raise FailToCreateError([ApiException(status=409, reason="Conflict")])
+            if manifest['kind'] == "Service":
+                raise FailToCreateError([ApiException(status=422, reason="Invalid")])
+        mock_create.side_effect = create
+        
+        client = K8sClient()
+        summary = client.apply_manifests(str(tmp_path), max_workers=4)
+        
+        assert [call.args[1]['kind'] for call in mock_create.call_args_list] == [
+            "Namespace", "Secret", "Deployment", "Service"
+        ]
+        assert [(r['kind'], r['status']) for r in summary['results']] == [
+            ("Namespace", "created"), ("Secret", "exists"), ("Deployment", "created"), ("Service", "failed")
+        ]
+        assert (summary['total'], summary['created'], summary['exists'], summary['failed']) == (4, 2, 1, 1)
+        assert summary['results'][3]['error'] == "Invalid"
+    
+    @patch('k8s_helper.core.config.load_kube_config')
+    @patch('k8s_helper.core.client.AppsV1Api')
+    @patch('k8s_helper.core.client.CoreV1Api')
+    def test_apply_deployment_skips_unchanged(self, mock_core_v1, mock_apps_v1, mock_load_config):
+        """Test a redeploy with the same spec makes no write, and a changed spec is applied"""
+        mock_apps_v1_instance = Mock()
+        mock_apps_v1.return_value = mock_apps_v1_instance
+        live = with_spec_hash(create_deployment_manifest("web", "nginx:1.25", replicas=2))
+        mock_apps_v1_instance.list_namespaced_deployment.return_value = Mock(
+            data=json.dumps({"metadata": {}, "items": [live]}).encode()
+        )
+        
+        client = K8sClient()
+        hashes = client.get_spec_hashes("Deployment")
+        
+        assert client.apply_deployment("web", "nginx:1.25", replicas=2, live_hashes=hashes) == "unchanged"
+        mock_apps_v1_instance.patch_namespaced_deployment.assert_not_called()
+        
+        assert client.apply_deployment("web", "nginx:1.26", replicas=2, live_hashes=hashes) == "applied"
+        kwargs = mock_apps_v1_instance.patch_namespaced_deployment.call_args.kwargs
+        assert kwargs['_content_type'] == "application/apply-patch+yaml"
+        assert kwargs['field_manager'] == "k8s-helper" and kwargs['force'] is False
+        assert kwargs['body']['metadata']['annotations'][SPEC_HASH_ANNOTATION] != \
+            live['metadata']['annotations'][SPEC_HASH_ANNOTATION]
+    
+    @patch('k8s_helper.core.config.load_kube_config')
+    @patch('k8s_helper.core.client.AppsV1Api')
+    @patch('k8s_helper.core.client.CoreV1Api')
+    def test_apply_service_creates_missing_object(self, mock_core_v1, mock_apps_v1, mock_load_config):
+        """Test an object that does not exist yet is read once and then applied"""
+        mock_core_v1_instance = Mock()
+        mock_core_v1.return_value = mock_core_v1_instance
+        mock_core_v1_instance.read_namespaced_service.side_effect = ApiException(status=404, reason="Not Found")
+        
+        client = K8sClient()
+        
+        assert client.apply_service("web", 80, 8080) == "applied"
+        mock_core_v1_instance.patch_namespaced_service.assert_called_once()
+
+    @patch('k8s_helper.core.config.load_kube_config')
+    @patch('k8s_helper.core.client.AppsV1Api')
+    @patch('k8s_helper.core.client.CoreV1Api')
+    def test_apply_reports_field_conflicts_unless_forced(self, mock_core_v1, mock_apps_v1, mock_load_config):
+        """Test fields owned by another manager fail the apply as a conflict and are only taken with force"""
+        mock_apps_v1_instance = Mock()
+        mock_apps_v1.return_value = mock_apps_v1_instance
+        mock_apps_v1_instance.read_namespaced_deployment.side_effect = ApiException(status=404, reason="Not Found")
+        conflict = ApiException(status=409, reason="Conflict")
+        conflict.body = json.dumps({'message': 'Apply failed with 1 conflict: conflict with "hpa": .spec.replicas'})
+        mock_apps_v1_instance.patch_namespaced_deployment.side_effect = [conflict, Mock()]
+        manifest = create_deployment_manifest("web", "nginx:1.25", replicas=2)
+        
+        client = K8sClient()
+        result = client.apply_object(manifest)
+        
+        assert (result['status'], result['conflict']) == ("failed", True)
+        assert ".spec.replicas" in result['error']
+        assert mock_apps_v1_instance.patch_namespaced_deployment.call_args.kwargs['force'] is False
+        
+        assert client.apply_object(manifest, force=True)['status'] == "applied"
+        assert mock_apps_v1_instance.patch_namespaced_deployment.call_args.kwargs['force'] is True
+    
+    @patch('k8s_helper.core.watch.Watch')
+    @patch('k8s_helper.core.config.load_kube_config')
+    @patch('k8s_helper.core.client.AppsV1Api')
+    @patch('k8s_helper.core.client.CoreV1Api')
+    def test_delete_by_selector_uses_deletecollection_and_waits(self, mock_core_v1, mock_apps_v1,
+                                                                mock_load_config, mock_watch):
+        """Test each kind is deleted with one request and the wait ends on the DELETED events"""
+        mock_apps_v1_instance = Mock()
+        mock_apps_v1.return_value = mock_apps_v1_instance
+        listed = {"metadata": {"resourceVersion": "42"},
+                  "items": [{"metadata": {"name": f"web-{i}"}} for i in range(150)]}
+        mock_apps_v1_instance.list_namespaced_deployment.return_value = Mock(data=json.dumps(listed).encode())
+        mock_watch.return_value.stream.return_value = iter(
+            {'type': 'DELETED', 'object': _mock_deployment(f"web-{i}", ready=2)} for i in range(150)
+        )
+        
+        client = K8sClient()
+        results = client.delete_by_selector(["deployments"], "env=preview", wait=True, timeout=10)
+        
+        assert results == {'deployments': {'matched': 150, 'deleted': 150, 'failed': 0, 'remaining': 0}}
+        mock_apps_v1_instance.delete_collection_namespaced_deployment.assert_called_once_with(
+            namespace="default", _preload_content=False, label_selector="env=preview"
+        )
+        mock_apps_v1_instance.delete_namespaced_deployment.assert_not_called()
+        assert mock_watch.return_value.stream.call_args.kwargs['resource_version'] == "42"
+    
+    @patch('k8s_helper.core.config.load_kube_config')
+    @patch('k8s_helper.core.client.AppsV1Api')
+    @patch('k8s_helper.core.client.CoreV1Api')
+    def test_delete_by_selector_falls_back_to_individual_deletes(self, mock_core_v1, mock_apps_v1,
+                                                                 mock_load_config):
+        """Test servers without deletecollection for a kind get parallel single deletes"""
+        mock_core_v1_instance = Mock()
+        mock_core_v1.return_value = mock_core_v1_instance
+        listed = {"metadata": {}, "items": [{"metadata": {"name": f"svc-{i}"}} for i in range(5)]}
+        mock_core_v1_instance.list_namespaced_service.return_value = Mock(data=json.dumps(listed).encode())
+        mock_core_v1_instance.delete_collection_namespaced_service.side_effect = \
+            ApiException(status=405, reason="Method Not Allowed")
+        
+        def delete_service(name, **kwargs):
+            if name == "svc-3":
+                raise ApiException(status=403, reason="Forbidden")
+        mock_core_v1_instance.delete_namespaced_service.side_effect = delete_service
+        
+        client = K8sClient()
+        results = client.delete_by_selector(["services"], "env=preview")
+        
+        assert results == {'services': {'matched': 5, 'deleted': 4, 'failed': 1}}
+        assert mock_core_v1_instance.delete_namespaced_service.call_count == 5
+    
+    @patch('k8s_helper.core.config.load_kube_config')
+    @patch('k8s_helper.core.client.AppsV1Api')
+    @patch('k8s_helper.core.client.CoreV1Api')
+    def test_delete_by_selector_requires_selector(self, mock_core_v1, mock_apps_v1, mock_load_config):
+        """Test a missing selector or unknown kind is rejected before anything is deleted"""
+        client = K8sClient()
+        
+        with pytest.raises(ValueError):
+            client.delete_by_selector(["deployments"], None)
+        with pytest.raises(ValueError):
+            client.delete_by_selector(["nodes"], "env=preview")
+        mock_apps_v1.return_value.delete_collection_namespaced_deployment.assert_not_called()
+    
+    def test_is_deployment_ready_honours_observed_generation(self):
+        """Test a stale status is never reported as ready"""
+        assert K8sClient._is_deployment_ready(_mock_deployment("web", ready=2)) is True
+        assert K8sClient._is_deployment_ready(
+            _mock_deployment("web", ready=2, generation=2, observed_generation=1)
+        ) is False
+        assert K8sClient._is_deployment_ready(_mock_deployment("web", ready=1)) is False
+
+
+class TestEKSClient:
+    """Test cases for EKSClient"""
+    
+    @staticmethod
+    def _describe_nodegroup(clusterName, nodegroupName):
+        if nodegroupName == "broken":
+            raise Exception("AccessDenied")
+        return {'nodegroup': {
+            'nodegroupName': nodegroupName,
+            'status': 'ACTIVE',
+            'instanceTypes': ['t3.medium'],
+            'amiType': 'AL2_x86_64',
+            'capacityType': 'ON_DEMAND',
+            'scalingConfig': {'minSize': 1, 'maxSize': 3, 'desiredSize': 2},
+            'createdAt': None,
+            'nodegroupArn': f"arn:{nodegroupName}"
+        }}
+    
+    @patch('boto3.client')
+    def test_list_nodegroups_paginates_and_keeps_order(self, mock_boto_client):
+        """Test node groups from every page are described and returned in order"""
+        eks = Mock()
+        mock_boto_client.return_value = eks
+        eks.get_paginator.return_value.paginate.return_value = [
+            {'nodegroups': ['ng-a', 'ng-b']},
+            {'nodegroups': ['broken', 'ng-c']}
+        ]
+        eks.describe_nodegroup.side_effect = self._describe_nodegroup
+        
+        client = EKSClient(region="us-west-2")
+        nodegroups = client.list_nodegroups("demo", max_workers=2)
+        
+        assert [ng['name'] for ng in nodegroups] == ['ng-a', 'ng-b', 'ng-c']
+        eks.get_paginator.assert_called_once_with('list_nodegroups')
+        assert eks.describe_nodegroup.call_count == 4
+    
+    @patch('boto3.client')
+    def test_iter_nodegroups_empty_cluster(self, mock_boto_client):
+        """Test a cluster without node groups makes no describe calls"""
+        eks = Mock()
+        mock_boto_client.return_value = eks
+        eks.get_paginator.return_value.paginate.return_value = [{'nodegroups': []}]
+        
+        client = EKSClient(region="us-west-2")
+        
+        assert list(client.iter_nodegroups("demo")) == []
+        eks.describe_nodegroup.assert_not_called()
+
+    
+    @patch('k8s_helper.waiters.time.sleep')
+    @patch('boto3.client')
+    def test_wait_for_active_waits_for_cluster_and_nodegroups(self, mock_boto_client, mock_sleep):
+        """Test a cluster and its node groups are awaited together until all are active"""
+        eks = Mock()
+        mock_boto_client.return_value = eks
+        eks.describe_cluster.side_effect = [{'cluster': {'status': 'CREATING'}},
+                                            {'cluster': {'status': 'ACTIVE'}}]
+        nodegroup_statuses = {'ng-a': ['CREATING', 'ACTIVE'], 'ng-b': ['ACTIVE']}
+        eks.describe_nodegroup.side_effect = lambda clusterName, nodegroupName: {
+            'nodegroup': {'status': nodegroup_statuses[nodegroupName].pop(0)}
+        }
+        
+        client = EKSClient(region="us-west-2")
+        statuses = client.wait_for_active("demo", ["ng-a", "ng-b"], timeout=60)
+        
+        assert statuses == {'cluster/demo': 'ACTIVE', 'nodegroup/ng-a': 'ACTIVE', 'nodegroup/ng-b': 'ACTIVE'}
+        assert eks.describe_cluster.call_count == 2
+        assert eks.describe_nodegroup.call_count == 3
+        assert all(c.args[0] <= 30 * 1.2 for c in mock_sleep.call_args_list)
+
+    
+    @patch('boto3.client')
+    def test_multi_region_inventory_merges_regions_and_reports_errors(self, mock_boto_client):
+        """Test clusters from every region are merged and sorted, and a failing region is reported"""
+        def eks_for(region, clusters):
+            eks = Mock()
+            if clusters is None:
+                eks.get_paginator.return_value.paginate.side_effect = ClientError(
+                    {'Error': {'Code': 'UnrecognizedClientException', 'Message': "Invalid token"}}, 'ListClusters')
+                return eks
+            eks.get_paginator.return_value.paginate.return_value = [{'clusters': list(clusters)}]
+            eks.describe_cluster.side_effect = lambda name: {'cluster': {
+                'name': name, 'status': clusters[name], 'version': "1.29", 'createdAt': None,
+                'arn': f"arn:{region}:{name}"
+            }}
+            return eks
+        
+        eks_clients = {
+            'us-west-2': eks_for('us-west-2', {'web': 'ACTIVE', 'api': 'ACTIVE'}),
+            'eu-west-1': eks_for('eu-west-1', {'batch': 'CREATING'}),
+            'ap-south-1': eks_for('ap-south-1', None),
+        }
+        mock_boto_client.side_effect = lambda service, region_name, config: (
+            eks_clients[region_name] if service == 'eks' else Mock())
+        
+        inventory = MultiRegionEKS(['us-west-2', 'eu-west-1', 'ap-south-1', 'us-west-2'])
+        result = inventory.inventory(include_nodegroups=False, sort_by='name')
+        
+        assert [(c['region'], c['name']) for c in result['clusters']] == [
+            ('us-west-2', 'api'), ('eu-west-1', 'batch'), ('us-west-2', 'web')
+        ]
+        assert result['regions']['us-west-2']['clusters'] == 2
+        assert result['regions']['eu-west-1']['error'] is None
+        assert "Invalid token" in result['regions']['ap-south-1']['error']
+        assert inventory.client('us-west-2') is inventory.client('us-west-2')
+        with pytest.raises(ValueError):
+            inventory.inventory(sort_by='owner')
+
 
 class TestUtils:
     """Test cases for utility functions"""
@@ -257,6 +978,112 @@ class TestUtils:
         assert 'Running' in result
         assert 'node-1' in result
     
+    def test_format_pod_list_without_header(self):
+        """Test pod list formatting for continuation pages"""
+        pods = [
+            {
+                'name': 'test-pod-2',
+                'ready': False,
+                'phase': 'Pending',
+                'restarts': 1,
+                'age': None,
+                'node': None
+            }
+        ]
+        
+        result = format_pod_list(pods, show_header=False)
+        assert 'NAME' not in result
+        assert result.startswith('test-pod-2')
+
+    def test_paged_table_columns_stay_aligned(self):
+        """Test later pages reuse the column offsets of the header printed with the first page"""
+        import io
+        from rich.console import Console
+        from k8s_helper import cli
+
+        def pod(name, node):
+            return {'name': name, 'ready': True, 'phase': 'Running', 'restarts': 0, 'age': None, 'node': node}
+
+        rows = [pod('a', 'n1'), pod('b', 'n2'),
+                pod('a-much-longer-pod-name', 'node-with-a-long-name'), pod('x' * 80, 'n3')]
+        output = io.StringIO()
+        with patch.object(cli, 'console', Console(file=output, width=500)):
+            cli.print_paged_table(iter(rows), format_pod_list, page_size=2)
+
+        header, _, first, _, second, third = output.getvalue().splitlines()
+        offsets = [i for i, c in enumerate(header) if c == '|']
+        assert [i for i, c in enumerate(first) if c == '|'] == offsets
+        assert [i for i, c in enumerate(second) if c == '|'] == offsets
+        assert [i for i, c in enumerate(third) if c == '|'] == offsets
+        assert second.startswith('a-m…')
+
+    def test_iter_chunks(self):
+        """Test grouping an iterable into fixed-size chunks"""
+        assert list(iter_chunks(range(5), 2)) == [[0, 1], [2, 3], [4]]
+        assert list(iter_chunks([], 2)) == []
+    
+    def test_log_timestamp_key_is_chronological(self):
+        """Test trimmed fractional seconds still sort in time order"""
+        assert log_timestamp_key("2024-01-31T12:00:00.12Z a") < log_timestamp_key("2024-01-31T12:00:00.123Z b")
+        assert log_timestamp_key("2024-01-31T12:00:00Z a") < log_timestamp_key("2024-01-31T12:00:00.1Z b")
+    
+    def test_parse_duration(self):
+        """Test durations with units are converted to seconds"""
+        assert parse_duration("90") == 90
+        assert parse_duration("5m") == 300
+        assert parse_duration("2h") == 7200
+        with pytest.raises(ValueError):
+            parse_duration("five minutes")
+    
+    def test_load_manifests_expands_documents_and_lists(self, tmp_path):
+        """Test multi-document files and List objects yield one manifest per object"""
+        (tmp_path / "objects.yaml").write_text(
+            "kind: ConfigMap\nmetadata: {name: a}\n---\n---\n"
+            "kind: List\nitems:\n- {kind: Pod, metadata: {name: b}}\n- {kind: Service, metadata: {name: c}}\n"
+        )
+        (tmp_path / "notes.txt").write_text("not a manifest")
+        
+        manifests = list(load_manifests(str(tmp_path)))
+        
+        assert [m['metadata']['name'] for m in manifests] == ["a", "b", "c"]
+        assert [manifest_tier(m) for m in manifests] == [1, 2, 3]
+        assert manifest_tier({'kind': "Widget"}) == 2
+    
+    def test_manifest_hash_ignores_its_own_annotation(self):
+        """Test annotating a manifest with its hash does not change the hash"""
+        manifest = create_deployment_manifest("web", "nginx:1.25")
+        annotated = with_spec_hash(manifest)
+        
+        assert manifest_hash(annotated) == manifest_hash(manifest)
+        assert 'annotations' not in manifest['metadata']
+        assert manifest_hash(create_deployment_manifest("web", "nginx:1.26")) != manifest_hash(manifest)
+
+    def test_deployment_manifest_with_init_containers_and_volumes(self):
+        """Test init containers and volumes use the create_deployment specifications"""
+        manifest = create_deployment_manifest(
+            "web", "nginx:1.25",
+            init_containers=[{'name': "migrate", 'image': "busybox", 'command': ["sh"], 'env_vars': {"A": "1"}}],
+            volume_mounts=[{'name': "data-volume", 'mount_path': "/data"}],
+            volumes=[{'name': "data-volume", 'type': 'pvc', 'claim_name': "data"},
+                     {'name': "creds-volume", 'type': 'secret', 'secret_name': "creds"}]
+        )
+        pod_spec = manifest['spec']['template']['spec']
+
+        assert pod_spec['initContainers'] == [{"name": "migrate", "image": "busybox", "command": ["sh"],
+                                               "env": [{"name": "A", "value": "1"}]}]
+        assert pod_spec['containers'][0]['volumeMounts'] == [{"name": "data-volume", "mountPath": "/data",
+                                                              "readOnly": False}]
+        assert pod_spec['volumes'] == [{"name": "data-volume", "persistentVolumeClaim": {"claimName": "data"}},
+                                       {"name": "creds-volume", "secret": {"secretName": "creds"}}]
+
+    def test_parse_equality_selector(self):
+        """Test only equality label selectors are turned into dictionaries"""
+        assert parse_equality_selector("app=web, tier==front") == {"app": "web", "tier": "front"}
+        assert parse_equality_selector(None) == {}
+        assert parse_equality_selector("app!=web") is None
+        assert parse_equality_selector("env in (prod,qa)") is None
+        assert parse_equality_selector("app") is None
+    
     def test_format_deployment_list_empty(self):
         """Test deployment list formatting with empty list"""
         result = format_deployment_list([])
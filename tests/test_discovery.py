@@ -0,0 +1,91 @@
+"""
+Tests for the AWS discovery cache
+"""
+
+import threading
+import time
+from unittest.mock import Mock, patch
+
+from k8s_helper.discovery import DiscoveryCache
+
+
+class TestDiscoveryCache:
+    """Test cases for DiscoveryCache"""
+
+    def test_values_expire_after_ttl(self):
+        """Test a value is reused within its TTL and discovered again afterwards"""
+        cache = DiscoveryCache()
+        discover = Mock(side_effect=[["subnet-a", "subnet-b"], ["subnet-c", "subnet-d"]])
+
+        assert cache.get_or_discover("default/us-west-2/default-subnets", discover, ttl=60) == ["subnet-a", "subnet-b"]
+        assert cache.get_or_discover("default/us-west-2/default-subnets", discover, ttl=60) == ["subnet-a", "subnet-b"]
+        with patch('k8s_helper.discovery.time.time', return_value=time.time() + 61):
+            assert cache.get_or_discover("default/us-west-2/default-subnets", discover, ttl=60) == ["subnet-c", "subnet-d"]
+        assert discover.call_count == 2
+
+    def test_concurrent_lookups_discover_once(self):
+        """Test callers racing for a missing key share a single discovery"""
+        cache = DiscoveryCache()
+        started = threading.Event()
+
+        def discover():
+            started.set()
+            time.sleep(0.05)
+            return "arn:aws:iam::123456789012:role/eks-nodegroup-role"
+
+        discover_mock = Mock(side_effect=discover)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(
+            cache.get_or_discover("nodegroup-role", discover_mock))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert discover_mock.call_count == 1
+        assert len(set(results)) == 1 and len(results) == 8
+
+    def test_persisted_between_instances(self, tmp_path):
+        """Test a file-backed cache is loaded by a later instance and invalidated by prefix"""
+        path = str(tmp_path / "cache" / "discovery-cache.json")
+        DiscoveryCache(path).set("default/us-west-2/cluster-role", "arn:cluster")
+        DiscoveryCache(path).set("default/eu-west-1/cluster-role", "arn:other")
+
+        reloaded = DiscoveryCache(path)
+        assert reloaded.get("default/us-west-2/cluster-role") == "arn:cluster"
+
+        reloaded.invalidate("default/us-west-2/")
+        assert DiscoveryCache(path).get("default/us-west-2/cluster-role") is None
+        assert DiscoveryCache(path).get("default/eu-west-1/cluster-role") == "arn:other"
+
+    def test_unreadable_file_is_ignored(self, tmp_path):
+        """Test a corrupt cache file starts an empty cache instead of failing"""
+        path = tmp_path / "discovery-cache.json"
+        path.write_text("{not json")
+
+        assert DiscoveryCache(str(path)).get("anything") is None
+
+    @patch('boto3.client')
+    def test_eks_clients_share_values_only_within_an_account(self, mock_boto_client):
+        """Test discovered values are keyed by the caller's account, not the profile name"""
+        from k8s_helper.core import EKSClient
+
+        accounts = iter(["111111111111", "111111111111", "222222222222"])
+
+        def boto_client(service, region_name, config):
+            client = Mock()
+            if service == 'sts':
+                client.get_caller_identity.return_value = {'Account': next(accounts)}
+            return client
+
+        mock_boto_client.side_effect = boto_client
+        cache = DiscoveryCache()
+        discover = Mock(side_effect=[["subnet-a"], ["subnet-b"]])
+        first, same_account, other_account = (EKSClient(region="us-west-2", discovery_cache=cache)
+                                              for _ in range(3))
+
+        assert first._discover('default-subnets', discover) == ["subnet-a"]
+        assert same_account._discover('default-subnets', discover) == ["subnet-a"]
+        assert other_account._discover('default-subnets', discover) == ["subnet-b"]
+        assert first._discover('default-subnets', discover) == ["subnet-a"]
+        first.sts_client.get_caller_identity.assert_called_once_with()
@@ -0,0 +1,146 @@
+"""
+AWS call and wall time budgets for EKSClient operations
+
+Each scenario runs the real EKSClient against moto (see EKSHarness) with a
+fixed latency added to every AWS call, and fails when it makes more calls
+than its budget in eks_budgets.json or runs slower than the budgeted time
+plus K8S_HELPER_EKS_TIME_TOLERANCE (default 0.5, i.e. 50%). Wall time is only
+checked without coverage or another tracer, which slows moto down several
+times; ``make bench-eks`` runs without coverage. Skipped without moto. After a deliberate change, ``make bench-eks-update`` re-measures the
+scenarios and rewrites the budgets.
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("moto")
+
+from k8s_helper.testing import EKSHarness
+
+
+BUDGETS_PATH = Path(__file__).with_name("eks_budgets.json")
+UPDATE_BUDGETS = os.environ.get("K8S_HELPER_UPDATE_BUDGETS") == "1"
+TIME_TOLERANCE = float(os.environ.get("K8S_HELPER_EKS_TIME_TOLERANCE", "0.5"))
+
+# Absolute slack on top of the relative tolerance, for scheduler noise
+TIME_GRACE = 0.1
+
+with open(BUDGETS_PATH) as f:
+    BUDGETS = json.load(f)
+
+NODEGROUP_COUNT = 20
+
+
+def _traced():
+    """Whether coverage or another tracer is slowing this process down"""
+    coverage = sys.modules.get("coverage")
+    return sys.gettrace() is not None or bool(coverage and coverage.Coverage.current())
+
+
+def create_cluster_with_default_subnets_and_nodegroup(harness, eks):
+    """A first cluster in a fresh account: subnets, both roles, cluster and node group"""
+    with harness.measure("create_cluster_with_default_subnets_and_nodegroup"):
+        info = eks.create_cluster("demo", wait_for_cluster=True)
+    assert 'nodegroup_info' in info
+
+
+def create_cluster_with_existing_roles(harness, eks):
+    """A further cluster, reusing the roles created for an earlier one"""
+    eks._create_or_get_cluster_role()
+    eks._create_or_get_nodegroup_role()
+    with harness.measure("create_cluster_with_existing_roles"):
+        info = eks.create_cluster("demo", wait_for_cluster=True)
+    assert 'nodegroup_info' in info
+
+
+def create_nodegroup_with_cluster_subnets(harness, eks):
+    """A node group on an existing cluster, taking its subnets from the cluster"""
+    eks.create_cluster("demo", create_nodegroup=False)
+    with harness.measure("create_nodegroup_with_cluster_subnets"):
+        eks.create_nodegroup("demo", "workers")
+
+
+def create_ten_nodegroups(harness, eks):
+    """Ten node groups with the default role and the cluster's subnets"""
+    eks.create_cluster("demo", create_nodegroup=False)
+    with harness.measure("create_ten_nodegroups"):
+        for index in range(10):
+            eks.create_nodegroup("demo", f"workers-{index}")
+
+
+def provision_cluster_with_three_nodegroups(harness, eks):
+    """The provisioning pipeline: discovery, cluster, then three node groups in parallel"""
+    with harness.measure("provision_cluster_with_three_nodegroups"):
+        result = eks.provision("demo", [{'nodegroup_name': f"workers-{index}"} for index in range(3)])
+    assert set(result['statuses'].values()) == {'ACTIVE'} and len(result['statuses']) == 4
+
+
+def list_nodegroups(harness, eks):
+    """Describing every node group of a cluster"""
+    cluster = eks.create_cluster("demo", create_nodegroup=False)
+    role_arn = eks._create_or_get_nodegroup_role()
+    for index in range(NODEGROUP_COUNT):
+        eks.create_nodegroup("demo", f"workers-{index}", subnets=cluster['subnets'], node_role_arn=role_arn)
+    with harness.measure("list_nodegroups"):
+        nodegroups = eks.list_nodegroups("demo")
+    assert len(nodegroups) == NODEGROUP_COUNT
+
+
+SCENARIOS = [
+    create_cluster_with_default_subnets_and_nodegroup,
+    create_cluster_with_existing_roles,
+    create_nodegroup_with_cluster_subnets,
+    create_ten_nodegroups,
+    provision_cluster_with_three_nodegroups,
+    list_nodegroups,
+]
+
+# Results collected while updating the budgets
+_measured = {}
+
+
+@pytest.fixture(scope="module", autouse=True)
+def write_budgets():
+    """Rewrite eks_budgets.json from the measured results when updating"""
+    yield
+    if UPDATE_BUDGETS and _measured:
+        budgets = dict(BUDGETS, scenarios=dict(BUDGETS['scenarios'], **_measured))
+        with open(BUDGETS_PATH, 'w') as f:
+            json.dump(budgets, f, indent=2)
+            f.write("\n")
+
+
+@pytest.fixture
+def harness():
+    """A fresh mocked AWS account"""
+    with EKSHarness(latency=BUDGETS['latency']) as eks_harness:
+        yield eks_harness
+
+
+@pytest.mark.parametrize("scenario", SCENARIOS, ids=lambda scenario: scenario.__name__)
+def test_scenario_within_budget(harness, scenario):
+    """Test a scenario makes no more AWS calls and takes no longer than budgeted"""
+    scenario(harness, harness.client())
+    name = scenario.__name__
+    result = harness.results[name]
+
+    if UPDATE_BUDGETS:
+        _measured[name] = result
+        return
+
+    budget = BUDGETS['scenarios'].get(name)
+    assert budget is not None, f"No budget for {name}; run 'make bench-eks-update'"
+    assert result['calls'] <= budget['calls'], (
+        f"{name} made {result['calls']} AWS calls, budget is {budget['calls']}\n"
+        f"measured: {result['operations']}\nbudgeted: {budget['operations']}"
+    )
+    if _traced():
+        return
+    limit = budget['seconds'] * (1 + TIME_TOLERANCE) + TIME_GRACE
+    assert result['seconds'] <= limit, (
+        f"{name} took {result['seconds']}s, budget is {budget['seconds']}s (limit {limit:.3f}s)"
+    )
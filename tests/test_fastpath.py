@@ -0,0 +1,177 @@
+"""
+Tests for the raw JSON list fast path
+"""
+
+import json
+from datetime import datetime, timezone
+from unittest.mock import Mock, patch
+
+import pytest
+from kubernetes import client as k8s_client
+
+from k8s_helper import fastpath
+from k8s_helper.core import K8sClient
+
+
+
+def _pod_list_body(count):
+    """Build a PodList response body shaped like a real API server response"""
+    pods = []
+    for i in range(count):
+        ready = "True" if i % 7 else "False"
+        pods.append({
+            "metadata": {
+                "name": f"web-{i:05d}",
+                "namespace": "default",
+                "uid": f"00000000-0000-0000-0000-{i:012d}",
+                "resourceVersion": str(1000 + i),
+                "creationTimestamp": "2024-01-31T12:00:00Z",
+                "labels": {"app": "web", "pod-template-hash": "5d4f8c"},
+                "ownerReferences": [{
+                    "apiVersion": "apps/v1", "kind": "ReplicaSet", "name": "web-5d4f8c",
+                    "uid": "11111111-1111-1111-1111-111111111111", "controller": True
+                }]
+            },
+            "spec": {
+                "nodeName": f"node-{i % 20}",
+                "containers": [{
+                    "name": "web",
+                    "image": "nginx:1.25",
+                    "ports": [{"containerPort": 80, "protocol": "TCP"}],
+                    "resources": {"requests": {"cpu": "100m", "memory": "128Mi"}},
+                    "env": [{"name": "MODE", "value": "production"}]
+                }],
+                "restartPolicy": "Always",
+                "serviceAccountName": "default"
+            },
+            "status": {
+                "phase": "Running" if i % 11 else "Pending",
+                "podIP": f"10.0.{i // 250}.{i % 250}",
+                "startTime": "2024-01-31T12:00:05Z",
+                "conditions": [
+                    {"type": "Initialized", "status": "True"},
+                    {"type": "Ready", "status": ready},
+                    {"type": "PodScheduled", "status": "True"}
+                ],
+                "containerStatuses": [{
+                    "name": "web", "ready": ready == "True", "restartCount": i % 3,
+                    "image": "nginx:1.25", "imageID": "docker.io/library/nginx@sha256:abc",
+                    "state": {"running": {"startedAt": "2024-01-31T12:00:06Z"}}
+                }]
+            }
+        })
+    body = {"apiVersion": "v1", "kind": "PodList", "metadata": {"resourceVersion": "99999"}, "items": pods}
+    return json.dumps(body).encode()
+
+
+def _deserialize(body):
+    """Turn a response body into client models, as the API client does for a normal list call"""
+    api_client = k8s_client.ApiClient()
+    try:
+        return api_client.deserialize(body.decode(), 'V1PodList', 'application/json')
+    except TypeError:
+        # Older clients deserialize a response object
+        return api_client.deserialize(Mock(data=body.decode()), 'V1PodList')
+
+
+def _list_func(body):
+    """Fake list_namespaced_pod answering both the model and the raw path from one body"""
+    def list_namespaced_pod(_preload_content=True, **kwargs):
+        if _preload_content:
+            return _deserialize(body)
+        return Mock(data=body)
+    return list_namespaced_pod
+
+
+@pytest.fixture
+def k8s():
+    """A K8sClient with the kubeconfig loading and API groups mocked out"""
+    with patch('k8s_helper.core.config.load_kube_config'), \
+            patch('k8s_helper.core.client.AppsV1Api'), \
+            patch('k8s_helper.core.client.CoreV1Api'):
+        yield K8sClient()
+
+
+class TestFastPath:
+    """Test cases for the raw JSON fast path"""
+
+    def test_pod_summaries_match_model_path(self, k8s):
+        """Test the fast path yields exactly the summaries built from client models"""
+        k8s.core_v1.list_namespaced_pod = _list_func(_pod_list_body(50))
+
+        assert k8s.list_pods(fast=True) == k8s.list_pods()
+
+    def test_raw_pages_follow_continue_token(self):
+        """Test the raw pager requests unparsed content and follows continue tokens"""
+        pages = [
+            json.dumps({"metadata": {"continue": "next"}, "items": [{"metadata": {"name": "a"}}]}),
+            json.dumps({"metadata": {}, "items": [{"metadata": {"name": "b"}}]})
+        ]
+        list_func = Mock(side_effect=[Mock(data=page.encode()) for page in pages])
+
+        names = [item['metadata']['name']
+                 for page in fastpath.iter_raw_pages(list_func, 1, namespace="default")
+                 for item in page]
+
+        assert names == ["a", "b"]
+        list_func.assert_called_with(limit=1, _preload_content=False,
+                                     namespace="default", _continue="next")
+
+    def test_count_items_uses_remaining_item_count(self):
+        """Test counting needs one single-item request when the server reports the remainder"""
+        body = {"metadata": {"continue": "next", "remainingItemCount": 29999}, "items": [{}]}
+        list_func = Mock(return_value=Mock(data=json.dumps(body).encode()))
+
+        assert fastpath.count_items(list_func, namespace="default") == 30000
+        list_func.assert_called_once_with(limit=1, _preload_content=False, namespace="default")
+
+    def test_count_items_pages_without_remaining_item_count(self):
+        """Test selector-filtered lists, which carry no remainder, are paged through"""
+        pages = [
+            {"metadata": {"continue": "a"}, "items": [{}]},
+            {"metadata": {"continue": "b"}, "items": [{}, {}]},
+            {"metadata": {}, "items": [{}]}
+        ]
+        list_func = Mock(side_effect=[Mock(data=json.dumps(page).encode()) for page in pages])
+
+        assert fastpath.count_items(list_func, page_size=2, label_selector="app=web") == 4
+        list_func.assert_called_with(limit=2, _preload_content=False,
+                                     label_selector="app=web", _continue="b")
+
+    def test_namespace_resources_counted_from_metadata(self, k8s):
+        """Test each kind is counted with a single-item request"""
+        def counted(total):
+            body = {"metadata": {"continue": "next", "remainingItemCount": total - 1}, "items": [{}]}
+            return Mock(return_value=Mock(data=json.dumps(body).encode()))
+
+        k8s.core_v1.list_namespaced_pod = counted(30000)
+        k8s.apps_v1.list_namespaced_deployment = counted(120)
+        k8s.core_v1.list_namespaced_service = counted(40)
+
+        assert k8s.get_namespace_resources() == {'pods': 30000, 'deployments': 120, 'services': 40}
+        for list_func in (k8s.core_v1.list_namespaced_pod, k8s.apps_v1.list_namespaced_deployment,
+                          k8s.core_v1.list_namespaced_service):
+            assert list_func.call_args.kwargs['limit'] == 1
+
+    def test_recent_events_keeps_newest(self, k8s):
+        """Test only the newest events are returned, newest first"""
+        events = [
+            {"metadata": {"name": f"ev-{i}"}, "type": "Normal", "reason": "Pulled",
+             "involvedObject": {"kind": "Pod", "name": "web-1"},
+             "lastTimestamp": f"2024-01-31T12:{i:02d}:00Z"}
+            for i in (3, 9, 1, 7)
+        ]
+        events.append({"metadata": {"name": "no-time"}, "involvedObject": {}})
+        body = {"metadata": {}, "items": events}
+        k8s.core_v1.list_namespaced_event = Mock(return_value=Mock(data=json.dumps(body).encode()))
+
+        recent = k8s.get_recent_events(limit=2)
+
+        assert [event['name'] for event in recent] == ["ev-9", "ev-7"]
+        assert recent[0]['resource'] == "Pod/web-1"
+
+    def test_parse_timestamp(self):
+        """Test API timestamps become timezone-aware datetimes"""
+        assert fastpath.parse_timestamp("2024-01-31T12:00:00Z") == \
+            datetime(2024, 1, 31, 12, tzinfo=timezone.utc)
+        assert fastpath.parse_timestamp(None) is None
@@ -0,0 +1,147 @@
+"""
+Tests for the k8s-helper informer cache
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+from kubernetes.client.rest import ApiException
+
+from k8s_helper.core import K8sClient
+from k8s_helper.informer import Informer, get_informer, stop_all_informers
+
+
+def _mock_object(name, labels=None):
+    """Build a minimal API object with metadata"""
+    obj = Mock()
+    obj.metadata.name = name
+    obj.metadata.labels = labels or {}
+    return obj
+
+
+def _mock_list(items, resource_version="100", continue_token=None):
+    """Build a list response"""
+    response = Mock()
+    response.items = items
+    response.metadata.resource_version = resource_version
+    response.metadata._continue = continue_token
+    return response
+
+
+class TestInformer:
+    """Test cases for the Informer store"""
+
+    def test_relist_builds_store_and_label_index(self):
+        """Test the initial list fills the store across pages"""
+        list_func = Mock(side_effect=[
+            _mock_list([_mock_object("web-1", {"app": "web"})], continue_token="next"),
+            _mock_list([_mock_object("db-1", {"app": "db"}),
+                        _mock_object("web-2", {"app": "web", "tier": "front"})])
+        ])
+
+        informer = Informer(list_func, "default", page_size=1)
+        informer._relist()
+
+        assert informer.has_synced()
+        assert len(informer) == 3
+        assert informer.resource_version == "100"
+        assert informer.get("db-1").metadata.name == "db-1"
+        assert informer.get("missing") is None
+        assert [o.metadata.name for o in informer.list({"app": "web"})] == ["web-1", "web-2"]
+        assert [o.metadata.name for o in informer.list({"app": "web", "tier": "front"})] == ["web-2"]
+        list_func.assert_called_with(namespace="default", limit=1, _continue="next")
+
+    def test_watch_events_update_store_and_index(self):
+        """Test ADDED, MODIFIED and DELETED events keep the index consistent"""
+        informer = Informer(Mock(), "default")
+
+        informer._apply_event('ADDED', _mock_object("web-1", {"app": "web"}))
+        informer._apply_event('MODIFIED', _mock_object("web-1", {"app": "api"}))
+
+        assert informer.list({"app": "web"}) == []
+        assert len(informer.list({"app": "api"})) == 1
+
+        informer._apply_event('DELETED', _mock_object("web-1", {"app": "api"}))
+
+        assert len(informer) == 0
+        assert informer.list({"app": "api"}) == []
+
+    @patch('k8s_helper.informer.watch.Watch')
+    def test_watch_relists_when_resource_version_expires(self, mock_watch_class):
+        """Test a 410 Gone from the watch triggers a fresh list"""
+        list_func = Mock(return_value=_mock_list([_mock_object("web-1")], resource_version="200"))
+        informer = Informer(list_func, "default")
+
+        def expire_once(*args, **kwargs):
+            mock_watch_class.return_value.stream.side_effect = stop_watch
+            raise ApiException(status=410, reason="Expired")
+
+        def stop_watch(*args, **kwargs):
+            informer._stopped.set()
+            return iter([])
+
+        mock_watch_class.return_value.stream.side_effect = expire_once
+
+        informer._run()
+
+        assert informer.relist_count == 1
+        assert informer.resource_version == "200"
+
+
+class TestK8sClientCache:
+    """Test cases for serving K8sClient reads from informers"""
+
+    def teardown_method(self):
+        stop_all_informers()
+
+    @patch('k8s_helper.core.config.load_kube_config')
+    @patch('k8s_helper.core.client.AppsV1Api')
+    @patch('k8s_helper.core.client.CoreV1Api')
+    def test_reads_served_from_cache(self, mock_core_v1, mock_apps_v1, mock_load_config):
+        """Test list and describe calls do not hit the API once cached"""
+        pod = _mock_object("web-1", {"app": "web"})
+        pod.status.phase = "Running"
+        pod.status.conditions = []
+        pod.status.container_statuses = []
+        pod.spec.containers = []
+        informer = Mock()
+        informer.list.return_value = [pod]
+        informer.get.return_value = pod
+        informer.__len__ = Mock(return_value=1)
+
+        with patch('k8s_helper.informer.get_informer', return_value=informer):
+            client = K8sClient(use_cache=True)
+
+        assert [p['name'] for p in client.list_pods()] == ["web-1"]
+        assert client.describe_pod("web-1")['metadata']['name'] == "web-1"
+        assert client.get_namespace_resources() == {'pods': 1, 'deployments': 1, 'services': 1}
+
+        core_v1 = mock_core_v1.return_value
+        core_v1.list_namespaced_pod.assert_not_called()
+        core_v1.read_namespaced_pod.assert_not_called()
+
+    @patch('k8s_helper.core.config.load_kube_config')
+    @patch('k8s_helper.core.client.AppsV1Api')
+    @patch('k8s_helper.core.client.CoreV1Api')
+    def test_selectors_the_cache_cannot_answer_go_to_api(self, mock_core_v1, mock_apps_v1, mock_load_config):
+        """Test equality selectors use the label index and other selectors bypass it"""
+        informer = Mock()
+        informer.list.return_value = []
+        core_v1 = mock_core_v1.return_value
+        core_v1.list_namespaced_pod.return_value = _mock_list([])
+
+        with patch('k8s_helper.informer.get_informer', return_value=informer):
+            client = K8sClient(use_cache=True)
+
+        client.list_pods(label_selector="app=web")
+        informer.list.assert_called_once_with({"app": "web"})
+        core_v1.list_namespaced_pod.assert_not_called()
+
+        client.list_pods(label_selector="app!=web")
+        client.list_pods(label_selector="app=web", field_selector="spec.nodeName=node-1")
+        assert core_v1.list_namespaced_pod.call_count == 2
+        assert informer.list.call_count == 1
+
+    def test_get_informer_rejects_unknown_kind(self):
+        """Test only supported kinds can be cached"""
+        with pytest.raises(ValueError):
+            get_informer("nodes", "default", Mock())
@@ -0,0 +1,114 @@
+"""
+Tests for per-call instrumentation and the --profile option
+"""
+
+import json
+from unittest.mock import Mock, patch
+
+from kubernetes import client as k8s_client
+from typer.testing import CliRunner
+
+from k8s_helper import metrics
+from k8s_helper.cli import app
+from k8s_helper.core import K8sClient
+from k8s_helper.ratelimit import RequestLayer, install_k8s_request_layer
+
+
+def _fake_api_client(body):
+    """Build an ApiClient whose REST client answers every request with `body`"""
+    api_client = k8s_client.ApiClient(k8s_client.Configuration(host="https://k8s.example"))
+    data = json.dumps(body).encode()
+    api_client.rest_client.request = Mock(return_value=Mock(
+        status=200, headers={'Content-Length': str(len(data))}, response=Mock(data=data)
+    ))
+    install_k8s_request_layer(api_client, RequestLayer(qps=None))
+    return api_client
+
+
+class TestMetrics:
+    """Test cases for the instrumentation hooks and registry"""
+
+    def test_k8s_call_names(self):
+        """Test request URLs map to Kubernetes verbs and resources"""
+        assert metrics.k8s_call("GET", "https://k8s/api/v1/namespaces/default/pods?limit=500") == ("list", "pods")
+        assert metrics.k8s_call("GET", "https://k8s/api/v1/namespaces/default/pods/web-1/log") == ("get", "pods/log")
+        assert metrics.k8s_call(
+            "GET", "https://k8s/apis/apps/v1/namespaces/default/deployments?watch=true"
+        ) == ("watch", "deployments")
+        assert metrics.k8s_call("DELETE", "https://k8s/api/v1/namespaces/default/services") == \
+            ("deletecollection", "services")
+        assert metrics.k8s_call("POST", "https://k8s/api/v1/namespaces") == ("create", "namespaces")
+
+    def test_registry_percentiles_and_json(self, tmp_path):
+        """Test samples are grouped per call and summarized with nearest-rank percentiles"""
+        registry = metrics.MetricsRegistry()
+        for i in range(1, 101):
+            registry.record({'api': 'kubernetes', 'call': 'list', 'resource': 'pods',
+                             'status': 200 if i % 10 else 429, 'bytes': 10, 'seconds': i / 1000})
+        registry.record({'api': 'aws', 'call': 'DescribeCluster', 'resource': 'eks',
+                         'status': 200, 'bytes': None, 'seconds': 0.001})
+
+        pods, describe = registry.summary()
+        assert (pods['count'], pods['errors'], pods['bytes']) == (100, 10, 1000)
+        assert (pods['p50_ms'], pods['p95_ms'], pods['p99_ms']) == (50.0, 95.0, 99.0)
+        assert pods['total_ms'] == 5050.0
+        assert pods['statuses'] == {'200': 90, '429': 10}
+        assert describe['call'] == "DescribeCluster"
+
+        path = tmp_path / "profile.json"
+        registry.to_json(str(path))
+        assert json.loads(path.read_text())['calls'][0]['resource'] == "pods"
+
+    def test_timeline_records_overlapping_phases(self):
+        """Test phases keep their own start and end times and failed phases are marked"""
+        timeline = metrics.Timeline()
+
+        with timeline.phase("create cluster"):
+            with timeline.phase("discover nodegroup role"):
+                pass
+        try:
+            with timeline.phase("create nodegroup"):
+                raise RuntimeError("quota exceeded")
+        except RuntimeError:
+            pass
+
+        phases = timeline.phases()
+        assert [phase['phase'] for phase in phases] == ["create cluster", "discover nodegroup role", "create nodegroup"]
+        assert phases[0]['start_s'] <= phases[1]['start_s'] and phases[1]['end_s'] <= phases[0]['end_s']
+        assert [phase['ok'] for phase in phases] == [True, True, False]
+
+    def test_request_layer_emits_events_to_hooks(self):
+        """Test every API request reaches the registered hooks, and none without hooks"""
+        events = []
+        k8s = K8sClient(api_client=_fake_api_client({"metadata": {}, "items": []}))
+
+        k8s.list_pods(fast=True)
+        assert events == []
+
+        metrics.add_hook(events.append)
+        try:
+            k8s.list_pods(fast=True)
+        finally:
+            metrics.remove_hook(events.append)
+
+        assert len(events) == 1
+        assert events[0]['api'] == "kubernetes"
+        assert (events[0]['call'], events[0]['resource'], events[0]['status']) == ("list", "pods", 200)
+        assert events[0]['bytes'] == len(b'{"metadata": {}, "items": []}')
+        assert events[0]['seconds'] >= 0
+
+    def test_cli_profile_reports_calls(self, tmp_path):
+        """Test --profile prints a breakdown and --profile-json exports it"""
+        body = {"metadata": {}, "items": []}
+        path = tmp_path / "profile.json"
+
+        with patch('k8s_helper.cli.get_k8s_client',
+                   side_effect=lambda ns: K8sClient(namespace=ns, api_client=_fake_api_client(body))):
+            result = CliRunner().invoke(app, ["--profile", "--profile-json", str(path),
+                                              "list-pods", "--output", "json", "--namespace", "default"])
+
+        assert result.exit_code == 0, result.output
+        assert "API Calls" in result.output
+        calls = json.loads(path.read_text())['calls']
+        assert [(c['call'], c['resource'], c['count']) for c in calls] == [("list", "pods", 1)]
+        assert not metrics.is_enabled()
@@ -0,0 +1,148 @@
+"""
+Tests for the client-side rate limiter and retry layer
+"""
+
+import time
+from unittest.mock import Mock, patch
+
+import boto3
+import pytest
+from botocore.exceptions import ClientError
+from kubernetes.client.rest import ApiException
+
+from k8s_helper.ratelimit import (
+    RequestLayer,
+    TokenBucket,
+    install_boto_request_layer,
+    install_k8s_request_layer
+)
+
+
+def _response(status, headers=None):
+    """Build a stand-in RESTResponse"""
+    return Mock(status=status, headers=headers or {})
+
+
+def _api_client(responses):
+    """Build a stand-in ApiClient whose REST client answers with `responses` in order"""
+    api_client = Mock(spec=['rest_client'])
+    api_client.rest_client.request = Mock(side_effect=responses)
+    return api_client
+
+
+class TestTokenBucket:
+    """Test cases for TokenBucket"""
+
+    def test_burst_then_sustained_rate(self):
+        """Test a full bucket lets the burst through and then spaces requests at qps"""
+        bucket = TokenBucket(qps=100, burst=5)
+
+        start = time.perf_counter()
+        waits = [bucket.acquire() for _ in range(15)]
+        elapsed = time.perf_counter() - start
+
+        assert waits[:5] == [0.0] * 5
+        assert all(wait > 0 for wait in waits[5:])
+        assert 0.08 <= elapsed < 0.5
+
+    def test_disabled_without_qps(self):
+        """Test a bucket without a rate never waits"""
+        bucket = TokenBucket(qps=None, burst=1)
+
+        assert [bucket.acquire() for _ in range(100)] == [0.0] * 100
+
+
+@patch('k8s_helper.ratelimit.time.sleep')
+class TestRequestLayer:
+    """Test cases for the Kubernetes and AWS request layers"""
+
+    def test_retries_throttled_response_honouring_retry_after(self, mock_sleep):
+        """Test a 429 is retried after the server's Retry-After and counted"""
+        throttled = _response(429, {'Retry-After': "2"})
+        api_client = _api_client([throttled, _response(200)])
+        layer = install_k8s_request_layer(api_client, RequestLayer(qps=None))
+
+        response = api_client.rest_client.request("GET", "https://k8s/api/v1/pods")
+
+        assert response.status == 200
+        mock_sleep.assert_called_once_with(2.0)
+        throttled.response.release_conn.assert_called_once()
+        stats = layer.stats.snapshot()
+        assert stats['requests'] == 2 and stats['retries'] == 1 and stats['throttled'] == 1
+        assert stats['retry_wait_seconds'] == 2.0
+
+    def test_retries_raised_api_exceptions_with_backoff(self, mock_sleep):
+        """Test clients that raise for errors are retried with growing, jittered delays"""
+        error = ApiException(status=503, reason="Service Unavailable")
+        api_client = _api_client([error, error, error, _response(200)])
+        install_k8s_request_layer(api_client, RequestLayer(qps=None, base_delay=1.0))
+
+        assert api_client.rest_client.request("DELETE", "https://k8s/api/v1/pods/web").status == 200
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        assert len(delays) == 3
+        assert all(0 <= delay <= 2 ** attempt for attempt, delay in enumerate(delays))
+
+    def test_gives_up_after_max_retries(self, mock_sleep):
+        """Test the last error is surfaced once the retries are used up"""
+        api_client = _api_client([ApiException(status=429, reason="Too Many Requests")] * 3)
+        layer = install_k8s_request_layer(api_client, RequestLayer(qps=None, max_retries=2))
+
+        with pytest.raises(ApiException):
+            api_client.rest_client.request("GET", "https://k8s/api/v1/pods")
+        assert layer.stats.snapshot()['failures'] == 1
+
+    def test_post_server_errors_are_not_retried(self, mock_sleep):
+        """Test a create that failed with a 5xx is not sent twice, while its 429s are"""
+        api_client = _api_client([_response(429), _response(500)])
+        install_k8s_request_layer(api_client, RequestLayer(qps=None))
+
+        assert api_client.rest_client.request("POST", "https://k8s/apis/apps/v1/deployments").status == 500
+        assert mock_sleep.call_count == 1
+
+    def test_install_is_idempotent(self, mock_sleep):
+        """Test clients sharing an ApiClient share its first layer"""
+        api_client = _api_client([_response(200)])
+        first = install_k8s_request_layer(api_client)
+
+        assert install_k8s_request_layer(api_client, RequestLayer(qps=1)) is first
+
+    def test_boto_throttling_errors_are_retried(self, mock_sleep):
+        """Test throttling ClientErrors are retried and other errors surface immediately"""
+        throttled = ClientError({'Error': {'Code': 'ThrottlingException', 'Message': "Rate exceeded"},
+                                 'ResponseMetadata': {'HTTPStatusCode': 400}}, 'DescribeCluster')
+        missing = ClientError({'Error': {'Code': 'ResourceNotFoundException', 'Message': "No cluster"},
+                               'ResponseMetadata': {'HTTPStatusCode': 404}}, 'DescribeCluster')
+        boto_client = Mock()
+        boto_client._make_api_call.side_effect = [throttled, {'cluster': {'status': 'ACTIVE'}}, missing]
+        layer = install_boto_request_layer(boto_client, RequestLayer(qps=None))
+
+        assert boto_client._make_api_call('DescribeCluster', {'name': "demo"}) == {'cluster': {'status': 'ACTIVE'}}
+        with pytest.raises(ClientError):
+            boto_client._make_api_call('DescribeCluster', {'name': "gone"})
+        stats = layer.stats.snapshot()
+        assert stats['retries'] == 1 and stats['throttled'] == 1 and stats['requests'] == 3
+
+    def test_boto_server_errors_are_retried_only_when_safe(self, mock_sleep):
+        """Test 5xx errors are retried for reads and token-carrying creates, but not other writes"""
+        unavailable = ClientError({'Error': {'Code': 'ServiceUnavailable', 'Message': "Try again"},
+                                   'ResponseMetadata': {'HTTPStatusCode': 503}}, 'CreateCluster')
+
+        def client(service):
+            boto_client = boto3.client(service, region_name="us-west-2")
+            sent = boto_client._make_api_call = Mock(side_effect=[unavailable, {}])
+            install_boto_request_layer(boto_client, RequestLayer(qps=None))
+            return boto_client, sent
+
+        eks, eks_sent = client('eks')
+        assert eks._make_api_call('CreateCluster', {'name': "demo"}) == {}
+        tokens = {call.args[1]['clientRequestToken'] for call in eks_sent.call_args_list}
+        assert eks_sent.call_count == 2 and len(tokens) == 1
+
+        iam, iam_sent = client('iam')
+        with pytest.raises(ClientError):
+            iam._make_api_call('CreateRole', {'RoleName': "demo"})
+        assert iam_sent.call_count == 1
+
+        iam, iam_sent = client('iam')
+        assert iam._make_api_call('GetRole', {'RoleName': "demo"}) == {}
+        assert iam_sent.call_count == 2
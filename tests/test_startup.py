@@ -0,0 +1,82 @@
+"""
+Startup benchmark for k8s-helper
+
+Runs imports in a fresh interpreter with `python -X importtime` and checks that
+heavy dependencies stay deferred and import time stays within budget.
+"""
+
+import subprocess
+import sys
+from typing import Dict
+
+import pytest
+
+
+# Cumulative import time budgets in milliseconds. They are several times the
+# measured cost so that slow CI machines pass, while an eager import of the
+# kubernetes client (~250 ms) or boto3 (~180 ms) still blows the budget.
+STARTUP_BUDGET_MS = {
+    'k8s_helper': 150,
+    'k8s_helper.cli': 400,
+}
+
+HEAVY_MODULES = ('kubernetes', 'boto3')
+
+
+def _import_times(statement: str) -> Dict[str, float]:
+    """Run a statement in a fresh interpreter and return cumulative import times in ms"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True, text=True, check=True
+    )
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative) / 1000
+    return times
+
+
+@pytest.mark.parametrize("module", sorted(STARTUP_BUDGET_MS))
+def test_import_skips_heavy_dependencies(module):
+    """Test importing the package or CLI does not load kubernetes or boto3"""
+    times = _import_times(f"import {module}")
+
+    for heavy in HEAVY_MODULES:
+        assert heavy not in times, f"{module} imports {heavy} at startup"
+
+
+@pytest.mark.parametrize("module", sorted(STARTUP_BUDGET_MS))
+def test_import_time_budget(module):
+    """Test import time stays within the regression budget"""
+    # Best of three runs to smooth out noisy machines
+    best = min(_import_times(f"import {module}")[module] for _ in range(3))
+
+    assert best < STARTUP_BUDGET_MS[module], (
+        f"import {module} took {best:.0f} ms (budget {STARTUP_BUDGET_MS[module]} ms)"
+    )
+
+
+def test_core_defers_boto3():
+    """Test boto3 and botocore are only imported once an EKSClient is constructed"""
+    times = _import_times("import k8s_helper.core")
+
+    assert 'boto3' not in times
+    assert 'botocore' not in times
+
+
+def test_lazy_names_resolve():
+    """Test lazily exported names are still importable from the package"""
+    times = _import_times("from k8s_helper import K8sClient, EKSClient, AsyncK8sClient, get_api_client")
+
+    assert 'kubernetes' in times
+    assert 'boto3' not in times
+
+
+def test_lazy_names_are_in_all():
+    """Test every lazily exported name is also listed in __all__"""
+    import k8s_helper
+
+    assert set(k8s_helper._LAZY_NAMES) <= set(k8s_helper.__all__)
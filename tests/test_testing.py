@@ -0,0 +1,105 @@
+"""
+Tests running the real K8sClient against the in-process fake API server
+"""
+
+import pytest
+
+from k8s_helper.core import K8sClient
+from k8s_helper.testing import FakeKubeServer
+
+
+@pytest.fixture
+def server():
+    """A running fake API server"""
+    with FakeKubeServer(rollout_delay=0.05) as fake:
+        yield fake
+
+
+@pytest.fixture
+def k8s(server, tmp_path):
+    """A K8sClient configured through a kubeconfig pointing at the fake server"""
+    return K8sClient(config_file=server.write_kubeconfig(tmp_path / "kubeconfig"))
+
+
+class TestFakeKubeServer:
+    """Test cases for FakeKubeServer"""
+
+    def test_list_pages_through_seeded_objects(self, server, k8s):
+        """Test both list paths page through every object with limit/continue"""
+        server.seed("pods", 1203)
+        server.seed("pods", 7, namespace="other")
+
+        assert len(k8s.list_pods(page_size=500)) == 1203
+        assert len(k8s.list_pods(page_size=500, fast=True)) == 1203
+        assert server.request_counts[('list', 'pods')] == 6
+
+    def test_counts_use_remaining_item_count(self, server, k8s):
+        """Test namespace counts come from one single-item list per kind"""
+        server.seed("pods", 300)
+        server.seed("deployments", 20)
+
+        assert k8s.get_namespace_resources() == {'pods': 300, 'deployments': 20, 'services': 0}
+        assert server.request_counts[('list', 'pods')] == 1
+
+    def test_selectors_are_applied_server_side(self, server, k8s):
+        """Test label and field selectors filter on the server"""
+        server.seed("pods", 10, labels={"app": "web"}, prefix="web")
+        server.seed("pods", 5, labels={"app": "db"}, prefix="db")
+
+        assert len(k8s.list_pods(label_selector="app=db")) == 5
+        assert len(k8s.list_pods(label_selector="app!=db", page_size=3)) == 10
+        assert [pod['name'] for pod in k8s.list_pods(field_selector="metadata.name=web-00003")] == ["web-00003"]
+
+    def test_create_and_wait_for_rollout(self, server, k8s):
+        """Test created deployments roll out and the bulk wait sees it through a watch"""
+        names = [f"web-{i}" for i in range(5)]
+        for name in names:
+            assert k8s.create_deployment(name, "nginx:1.25", replicas=2) is not None
+
+        assert k8s.wait_for_deployments_ready(names, timeout=10) == {name: True for name in names}
+        assert server.request_counts[('watch', 'deployments')] >= 1
+        assert server.get("deployments", "web-0")['status']['readyReplicas'] == 2
+
+    def test_scale_patches_and_bumps_generation(self, server, k8s):
+        """Test a spec change bumps the generation and rolls out again"""
+        k8s.create_deployment("web", "nginx:1.25", replicas=1)
+        assert k8s.wait_for_deployment_ready("web", timeout=10)
+
+        assert k8s.scale_deployment("web", 3)
+        assert server.get("deployments", "web")['metadata']['generation'] == 2
+        assert k8s.wait_for_deployment_ready("web", timeout=10)
+
+    def test_delete_by_selector_waits_for_finalization(self, server, k8s):
+        """Test deletecollection removes matching objects once their deletion delay passes"""
+        server.deletion_delay = 0.1
+        server.seed("deployments", 30, labels={"env": "preview"}, prefix="preview")
+        server.seed("deployments", 2, labels={"env": "prod"}, prefix="prod")
+
+        results = k8s.delete_by_selector(["deployments"], "env=preview", wait=True, timeout=10)
+
+        assert results['deployments'] == {'matched': 30, 'deleted': 30, 'failed': 0, 'remaining': 0}
+        assert server.count("deployments") == 2
+        assert server.request_counts[('deletecollection', 'deployments')] == 1
+
+    def test_missing_objects_return_not_found(self, server, k8s):
+        """Test reads and deletes of unknown objects fail like a real API server"""
+        assert k8s.describe_deployment("missing") is None
+        assert k8s.delete_service("missing") is False
+
+    def test_cli_apply_twice_is_idempotent(self, server, k8s):
+        """Test re-running `apply NAME IMAGE` leaves unchanged objects alone"""
+        from unittest.mock import patch
+        from typer.testing import CliRunner
+        from k8s_helper.cli import app
+
+        args = ["apply", "web2", "nginx:1.2", "--no-wait", "--no-show-url"]
+        with patch('k8s_helper.cli.get_k8s_client', return_value=k8s):
+            first = CliRunner().invoke(app, args)
+            second = CliRunner().invoke(app, args)
+
+        assert first.exit_code == 0, first.output
+        assert "Deployment 'web2' applied" in first.output
+        assert second.exit_code == 0, second.output
+        assert "Deployment 'web2' unchanged" in second.output
+        assert "Service 'web2-service' unchanged" in second.output
+        assert "409" not in second.output
@@ -0,0 +1,71 @@
+"""
+Tests for the adaptive EKS waiter
+"""
+
+from unittest.mock import Mock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from k8s_helper.waiters import Waiter, WaitFailed
+
+
+def _sequence(*statuses):
+    """A check returning the given statuses in order, then repeating the last"""
+    remaining = list(statuses)
+    return Mock(side_effect=lambda: remaining.pop(0) if len(remaining) > 1 else remaining[0])
+
+
+def _client_error(code, status):
+    return ClientError({'Error': {'Code': code, 'Message': code},
+                        'ResponseMetadata': {'HTTPStatusCode': status}}, 'DescribeCluster')
+
+
+class TestWaiter:
+    """Test cases for Waiter"""
+
+    def test_delays_grow_exponentially_up_to_the_cap(self):
+        """Test intervals start short, grow by the multiplier and stay under the cap"""
+        waiter = Waiter(initial_delay=1, multiplier=2, max_delay=10, jitter=0)
+
+        assert [waiter.delay(attempt) for attempt in range(6)] == [1, 2, 4, 8, 10, 10]
+        jittered = Waiter(initial_delay=1, jitter=0.2).delay(0)
+        assert 0.8 <= jittered <= 1.2
+
+    def test_returns_once_every_resource_is_active(self):
+        """Test resources are polled independently and transitions are reported"""
+        cluster = _sequence('CREATING', 'ACTIVE')
+        nodegroup = _sequence('CREATING', 'CREATING', 'CREATING', 'ACTIVE')
+        progress = []
+
+        statuses = Waiter(initial_delay=0.01, jitter=0).wait(
+            {'cluster/demo': cluster, 'nodegroup/workers': nodegroup}, timeout=5,
+            on_progress=lambda name, status, previous, elapsed: progress.append((name, previous, status))
+        )
+
+        assert statuses == {'cluster/demo': 'ACTIVE', 'nodegroup/workers': 'ACTIVE'}
+        assert cluster.call_count == 2 and nodegroup.call_count == 4
+        assert ('cluster/demo', 'CREATING', 'ACTIVE') in progress
+        assert ('nodegroup/workers', None, 'CREATING') in progress
+        assert len(progress) == 4
+
+    def test_throttling_is_waited_out(self):
+        """Test throttling errors keep the wait going while other errors end it"""
+        throttled = Mock(side_effect=[_client_error('ThrottlingException', 400), 'ACTIVE'])
+        missing = Mock(side_effect=_client_error('ResourceNotFoundException', 404))
+        waiter = Waiter(initial_delay=0.01)
+
+        assert waiter.wait({'cluster/demo': throttled}, timeout=5) == {'cluster/demo': 'ACTIVE'}
+        with pytest.raises(ClientError):
+            waiter.wait({'cluster/gone': missing}, timeout=5)
+
+    def test_failure_status_and_timeout(self):
+        """Test a failed resource raises WaitFailed and a slow one times out"""
+        waiter = Waiter(initial_delay=0.01)
+
+        with pytest.raises(WaitFailed) as error:
+            waiter.wait({'nodegroup/workers': _sequence('CREATING', 'CREATE_FAILED')}, timeout=5,
+                        failure=('CREATE_FAILED',))
+        assert error.value.status == 'CREATE_FAILED'
+
+        assert waiter.wait({'cluster/demo': _sequence('CREATING')}, timeout=0.05) == {'cluster/demo': 'CREATING'}